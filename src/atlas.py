@@ -0,0 +1,256 @@
+# src/atlas.py
+
+'''
+Atlas de texturas precortadas y preescaladas.
+
+El manifiesto (RECORTES y REJILLAS) enumera cada región de las hojas que usa el juego
+con su escala. construir() recorta y escala cada región una sola vez, las empaqueta en
+estantes dentro de una única imagen y guarda junto a ella un índice JSON con el tamaño
+del atlas, la posición de cada pieza y una huella de las hojas de origen y del propio
+manifiesto. La imagen se guarda como píxeles RGBA sin comprimir: es una caché local
+(no se versiona) y así se carga sin decodificar nada, más rápido que un PNG o que zlib.
+
+Al arrancar, cargar() lee esa imagen y registra en sprite_manager una vista
+(subsurface) por pieza bajo la misma clave que usan obtener_sprite y obtener_sprites,
+así que las entidades reciben el sprite del atlas sin recortar nada. Si el atlas no
+existe o la huella no coincide (cambió una hoja o el manifiesto), se reconstruye solo.
+Una región que no esté en el manifiesto se sigue recortando al pedirla.
+
+`python -m src.atlas` construye el atlas sin abrir el juego.
+'''
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import pygame
+
+from src.sprite_manager import extraer_sprite, cortar_sprite, cargar_hoja, registrar_recurso
+
+DIRECTORIO = "assets/atlas"
+IMAGEN = os.path.join(DIRECTORIO, "atlas.rgba")
+INDICE = os.path.join(DIRECTORIO, "atlas.json")
+VERSION = 1
+ANCHO_MAXIMO = 1024  # Ancho máximo de la imagen del atlas
+SEPARACION = 1  # Píxeles libres entre piezas
+
+# Manifiesto --------------------------------------------------------------------------------------
+HOJA_JUGADOR = "assets/player/SpaceShips_Player-0001.png"
+HOJA_ESCUDO = "assets/effects/Barrier-0001.png"
+HOJA_UI = "assets/ui/UI_sprites-0001.png"
+HOJA_ENEMIGOS = "assets/enemy/SpaceShips_Enemy-0001.png"
+HOJA_JEFE = "assets/boss/SpaceShip_Boss-0001.png"
+HOJA_BALAS = "assets/bullet/Bullets-0001.png"
+HOJA_POWERUPS = "assets/powerups/Bonuses-0001.png"
+
+# Regiones (hoja, x, y, ancho, alto, escala) tal como se piden a obtener_sprite
+RECORTES = (
+    # Player: naves, escudo, iconos del HUD y dígitos de la puntuación
+    (HOJA_JUGADOR, 77, 71, 38, 40, 1.5),
+    (HOJA_JUGADOR, 12, 22, 38, 40, 1.5),
+    (HOJA_ESCUDO, 15, 16, 67, 67, 1.5),
+    (HOJA_UI, 3, 82, 12, 10, 2.1),
+    (HOJA_UI, 19, 82, 12, 10, 2.1),
+    (HOJA_UI, 3, 11, 73, 20, 2.4),
+    (HOJA_UI, 93, 27, 22, 22, 1.5),
+    (HOJA_UI, 93, 51, 22, 22, 1.5),
+    (HOJA_UI, 93, 77, 22, 22, 1.5),
+    (HOJA_UI, 93, 102, 22, 22, 1.5),
+    (HOJA_UI, 55, 80, 9, 13, 2.5),
+    (HOJA_UI, 16, 101, 7, 22, 2.4),
+    (HOJA_UI, 26, 101, 7, 22, 2.4),
+    *((HOJA_UI, x, 68, 6, 6, 2.0) for x in range(8, 54, 5)),
+    # Enemy
+    *((HOJA_ENEMIGOS, 32, y, 48, 54, 1.5) for y in (9, 99, 186)),
+    *((HOJA_ENEMIGOS, 91, y, 46, 35, 1.5) for y in (17, 106, 193)),
+    *((HOJA_ENEMIGOS, 149, y, 32, 20, 1.5) for y in (24, 113, 200)),
+    *((HOJA_ENEMIGOS, 198, y, 21, 18, 2) for y in (27, 115, 202)),
+    # Boss
+    *((HOJA_JEFE, x, y, 105, 105, 1.5) for x in (3, 138) for y in (36, 157, 288)),
+    # Balas: jefe, minas, enemigos y jugador
+    (HOJA_BALAS, 16, 80, 17, 22, 1.5),
+    (HOJA_BALAS, 16, 16, 17, 22, 1.5),
+    (HOJA_BALAS, 16, 79, 17, 22, 1.5),
+    (HOJA_BALAS, 84, 144, 8, 15, 1.5),
+    (HOJA_BALAS, 148, 111, 6, 19, 1.5)
+)
+
+# Hojas cortadas en rejilla (hoja, columnas, filas, escala) tal como se piden a obtener_sprites
+REJILLAS = (
+    (HOJA_POWERUPS, 5, 5, 1.6),
+)
+
+def huella_fuentes(recortes=RECORTES, rejillas=REJILLAS):
+    '''
+    Returns:
+        str: SHA-1 del manifiesto y del contenido de cada hoja de origen.
+    '''
+    h = hashlib.sha1(repr((VERSION, ANCHO_MAXIMO, SEPARACION, recortes, rejillas)).encode())
+    for ruta in sorted({recorte[0] for recorte in recortes} | {rejilla[0] for rejilla in rejillas}):
+        h.update(ruta.encode())
+        with open(ruta, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# Construcción ------------------------------------------------------------------------------------
+def _piezas(recortes, rejillas):
+    '''
+    Recorta y escala cada región del manifiesto.
+
+    Returns:
+        list: Pares (clave, superficie); la clave es la de obtener_sprite o, para las
+            rejillas, la de obtener_sprites seguida del índice del sprite.
+    '''
+    piezas = []
+    for ruta, x, y, ancho, alto, escala in recortes:
+        piezas.append((["sprite", ruta, x, y, ancho, alto, escala], extraer_sprite(cargar_hoja(ruta), x, y, ancho, alto, escala)))
+    for ruta, columnas, filas, escala in rejillas:
+        for i, sprite in enumerate(cortar_sprite(cargar_hoja(ruta), columnas, filas, escala)):
+            piezas.append((["hoja", ruta, columnas, filas, escala, i], sprite))
+    return piezas
+
+def empaquetar(tamaños, ancho_maximo=ANCHO_MAXIMO, separacion=SEPARACION):
+    '''
+    Coloca rectángulos en estantes: de más alto a más bajo, de izquierda a derecha,
+    abriendo un estante nuevo cuando no caben en el actual.
+
+    Args:
+        tamaños (list): (ancho, alto) de cada pieza.
+    Returns:
+        tuple: Posiciones (x, y) en el orden de `tamaños` y tamaño (ancho, alto) del atlas.
+    '''
+    posiciones = [None] * len(tamaños)
+    x = y = alto_estante = ancho_usado = 0
+    for i in sorted(range(len(tamaños)), key=lambda i: (-tamaños[i][1], -tamaños[i][0])):
+        ancho, alto = tamaños[i]
+        if x and x + ancho > ancho_maximo:
+            y += alto_estante + separacion
+            x = alto_estante = 0
+        posiciones[i] = (x, y)
+        x += ancho + separacion
+        alto_estante = max(alto_estante, alto)
+        ancho_usado = max(ancho_usado, x - separacion)
+    return posiciones, (max(1, ancho_usado), max(1, y + alto_estante))
+
+def construir(recortes=RECORTES, rejillas=REJILLAS):
+    '''
+    Construye el atlas en memoria.
+
+    Returns:
+        tuple: Superficie del atlas e índice (dict con versión, huella, tamaño y
+            piezas [clave..., x, y, ancho, alto]).
+    '''
+    piezas = _piezas(recortes, rejillas)
+    posiciones, tamaño = empaquetar([superficie.get_size() for _, superficie in piezas])
+    atlas = pygame.Surface(tamaño, pygame.SRCALPHA)
+    entradas = []
+    for (clave, superficie), posicion in zip(piezas, posiciones):
+        # Sobre un fondo transparente la suma copia los píxeles tal cual (un blit normal mezclaría el alfa)
+        atlas.blit(superficie, posicion, special_flags=pygame.BLEND_RGBA_ADD)
+        entradas.append(clave + [posicion[0], posicion[1], *superficie.get_size()])
+    indice = {"version": VERSION, "huella": huella_fuentes(recortes, rejillas), "tamaño": list(tamaño), "piezas": entradas}
+    return atlas, indice
+
+def guardar(atlas, indice, imagen=IMAGEN, ruta_indice=INDICE):
+    '''
+    Escribe la imagen y el índice del atlas. Cada archivo se escribe aparte y se
+    renombra al final, y el índice va el último, así que un atlas a medias nunca
+    tiene un índice válido.
+    '''
+    os.makedirs(os.path.dirname(imagen) or ".", exist_ok=True)
+    with open(imagen + ".tmp", "wb") as f:
+        f.write(pygame.image.tobytes(atlas, "RGBA"))
+    os.replace(imagen + ".tmp", imagen)
+    with open(ruta_indice + ".tmp", "w") as f:
+        json.dump(indice, f)
+    os.replace(ruta_indice + ".tmp", ruta_indice)
+
+# Carga -------------------------------------------------------------------------------------------
+def _leer_indice(ruta_indice):
+    try:
+        with open(ruta_indice) as f:
+            indice = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return indice if indice.get("version") == VERSION else None
+
+def registrar(atlas, indice):
+    '''
+    Registra en sprite_manager una vista del atlas por pieza.
+
+    Returns:
+        int: Piezas registradas.
+    '''
+    rejillas = {}
+    for entrada in indice["piezas"]:
+        clave, (x, y, ancho, alto) = entrada[:-4], entrada[-4:]
+        vista = atlas.subsurface((x, y, ancho, alto))
+        if clave[0] == "hoja":
+            rejillas.setdefault(tuple(clave[:-1]), []).append((clave[-1], vista))
+        else:
+            registrar_recurso(tuple(clave), vista)
+    for clave, sprites in rejillas.items():
+        registrar_recurso(clave, tuple(vista for _, vista in sorted(sprites, key=lambda par: par[0])))
+    return len(indice["piezas"])
+
+def leer(imagen=IMAGEN, ruta_indice=INDICE):
+    '''
+    Lee un atlas al día sin convertirlo. No toca la ventana, así que puede llamarse
+    desde un hilo; la conversión (convert_alpha) y registrar() van en el hilo principal.
+
+    Returns:
+        tuple | None: Superficie sin convertir e índice, o None si falta o está desfasado.
+    '''
+    indice = _leer_indice(ruta_indice)
+    if indice is None or indice["huella"] != huella_fuentes() or not os.path.exists(imagen):
+        return None
+    with open(imagen, "rb") as f:
+        return pygame.image.frombuffer(f.read(), tuple(indice["tamaño"]), "RGBA"), indice
+
+def cargar(imagen=IMAGEN, ruta_indice=INDICE, reconstruir=True):
+    '''
+    Carga el atlas (reconstruyéndolo si falta o está desfasado) y registra sus piezas.
+    Necesita una ventana creada (convert_alpha).
+
+    Args:
+        imagen (str): Imagen del atlas.
+        ruta_indice (str): Índice JSON del atlas.
+        reconstruir (bool): Si se reconstruye un atlas ausente o desfasado.
+    Returns:
+        int: Piezas registradas (0 si no había atlas válido y no se reconstruyó).
+    '''
+    leido = leer(imagen, ruta_indice)
+    if leido is not None:
+        atlas, indice = leido[0].convert_alpha(), leido[1]
+    elif reconstruir:
+        atlas, indice = construir()
+        try:
+            guardar(atlas, indice, imagen, ruta_indice)
+        except (OSError, pygame.error) as e:
+            print(f"No se pudo guardar el atlas: {e}")  # Se usa igualmente el construido en memoria
+    else:
+        return 0
+    return registrar(atlas, indice)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construye el atlas de texturas de Galaxy Blast")
+    parser.add_argument("--forzar", action="store_true", help="Reconstruir aunque el atlas esté al día")
+    args = parser.parse_args(argv)
+
+    from src.game_session import iniciar_headless
+    iniciar_headless()
+    indice = _leer_indice(INDICE)
+    if not args.forzar and indice is not None and indice["huella"] == huella_fuentes() and os.path.exists(IMAGEN):
+        print(f"{IMAGEN} está al día ({len(indice['piezas'])} piezas)")
+        return 0
+    inicio = time.perf_counter()
+    atlas, indice = construir()
+    guardar(atlas, indice)
+    ancho, alto = atlas.get_size()
+    print(f"{IMAGEN}: {len(indice['piezas'])} piezas en {ancho}x{alto} px ({(time.perf_counter() - inicio) * 1000:.1f} ms)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
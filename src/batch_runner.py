@@ -0,0 +1,333 @@
+# src/batch_runner.py
+
+'''
+Simulación de partidas por lotes para equilibrar las fases.
+
+Cada corrida juega una fase sin pantalla ni sonido con una semilla y una política de
+entradas (un bot o el guion de una repetición) hasta que el jugador muere, derrota al
+jefe o se agota el tiempo. Las corridas se reparten entre procesos con
+ProcessPoolExecutor (uno por núcleo por defecto) en lotes pequeños; cada lote
+terminado vuelve al proceso principal, que va acumulando las distribuciones de
+supervivencia, puntuación, daño recibido y tiempo hasta derrotar al jefe.
+
+Como la simulación es determinista (ver game_clock), el resultado de una corrida solo
+depende de su semilla, su fase y su política, no del proceso que la ejecute.
+
+Uso:
+    python -m src.batch_runner --semillas 500 --fases 1 2 3 --politicas bot esquivador
+    python -m src.batch_runner --semillas 200 --guion ultima_partida.rep --salida lotes.json
+'''
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.config import TICK_MS, SCREEN_HEIGHT
+from src.game_session import iniciar_headless, GameSession, Entradas
+from src.score_manager import ScoreManager
+from src.bullet_engine import BulletEngine
+from src.benchmark import percentil
+from src.replay import Repeticion
+
+MAX_SEGUNDOS_POR_DEFECTO = 300  # Tiempo de juego máximo de una corrida
+METRICAS = ("supervivencia_s", "puntaje", "dano_recibido", "tiempo_jefe_s")
+
+class Tarea:
+    '''
+    Una corrida a simular. Se envía a los procesos, así que solo guarda datos simples.
+
+    Atributos:
+        semilla (int): Semilla de la partida.
+        fase (int): Fase que se juega.
+        politica (str): Nombre de la política en POLITICAS (o "guion").
+        max_ticks (int): Ticks tras los que se da la corrida por terminada.
+        backend (str): Backend de balas (None usa el de config).
+        guion (str): Repetición cuyas entradas sigue la política "guion".
+    '''
+    def __init__(self, semilla, fase, politica, max_ticks, backend=None, guion=None):
+        self.semilla = semilla
+        self.fase = fase
+        self.politica = politica
+        self.max_ticks = max_ticks
+        self.backend = backend
+        self.guion = guion
+
+# Políticas ----------------------------------------------------------------------------------------
+# Una política es politica(session, rng, tick) -> Entradas. Solo usa el generador que
+# recibe, de modo que no altera los números aleatorios de la partida.
+POLITICAS = {}
+
+def registrar(nombre):
+    '''
+    Decorador que añade una política al catálogo.
+    '''
+    def decorador(funcion):
+        POLITICAS[nombre] = funcion
+        return funcion
+    return decorador
+
+@registrar("quieto")
+def _quieto(session, rng, tick):
+    return Entradas(disparar=True)
+
+@registrar("bot")
+def _bot(session, rng, tick):
+    return Entradas(
+        izquierda=rng.random() < 0.3, derecha=rng.random() < 0.3,
+        arriba=rng.random() < 0.1, abajo=rng.random() < 0.1,
+        disparar=True, dash=rng.random() < 0.05, sobrecarga=True
+    )
+
+def _amenazas(session):
+    '''
+    Posiciones (x, y) de todas las balas que pueden dañar al jugador.
+    '''
+    for contenedor in [session.enemy_bullets] + [jefe.bullets for jefe in session.boss_group]:
+        if isinstance(contenedor, BulletEngine):
+            yield from zip(contenedor.x[:contenedor.n].tolist(), contenedor.y[:contenedor.n].tolist())
+        else:
+            for bala in contenedor:
+                yield bala.rect.center
+
+@registrar("esquivador")
+def _esquivador(session, rng, tick):
+    '''
+    Se aleja de la bala más cercana que tiene encima, hace dash si está a punto de
+    recibirla y, si no hay peligro, se alinea con el objetivo más bajo y dispara.
+    '''
+    jugador = session.player.rect
+    cercana, distancia = None, 140 ** 2
+    for x, y in _amenazas(session):
+        if y < jugador.bottom and abs(x - jugador.centerx) < 60:
+            d = (x - jugador.centerx) ** 2 + (y - jugador.centery) ** 2
+            if d < distancia:
+                cercana, distancia = (x, y), d
+    entradas = Entradas(disparar=True, sobrecarga=True, abajo=jugador.bottom < SCREEN_HEIGHT - 20)
+    if cercana is not None:
+        huir_izquierda = cercana[0] >= jugador.centerx
+        entradas.izquierda, entradas.derecha = huir_izquierda, not huir_izquierda
+        entradas.dash = distancia < 45 ** 2
+        return entradas
+    objetivos = list(session.boss_group) or list(session.enemies)
+    if objetivos:
+        objetivo = max(objetivos, key=lambda sprite: sprite.rect.bottom).rect.centerx
+        entradas.izquierda = objetivo < jugador.centerx - 8
+        entradas.derecha = objetivo > jugador.centerx + 8
+    return entradas
+
+# Corridas -----------------------------------------------------------------------------------------
+_guiones = {}  # Entradas de cada repetición, cargadas una vez por proceso
+
+def _politica_guion(ruta):
+    if ruta not in _guiones:
+        _guiones[ruta] = list(Repeticion.cargar(ruta))
+    entradas = _guiones[ruta]
+    return lambda session, rng, tick: entradas[tick] if tick < len(entradas) else Entradas()
+
+def simular(tarea):
+    '''
+    Juega una corrida completa.
+
+    Args:
+        tarea (Tarea): Corrida a simular.
+    Returns:
+        dict: Semilla, fase y política de la corrida, si sobrevivió y si derrotó al
+            jefe, supervivencia_s, puntaje, dano_recibido, tiempo_jefe_s (None si no
+            lo derrotó) y ticks simulados.
+    '''
+    kwargs = {"backend": tarea.backend} if tarea.backend else {}
+    session = GameSession(ScoreManager(None), semilla=tarea.semilla, **kwargs)
+    session.fases_desbloqueadas = list(range(1, tarea.fase + 1))
+    session.continuar(tarea.fase)
+    politica = _politica_guion(tarea.guion) if tarea.politica == "guion" else POLITICAS[tarea.politica]
+    rng_politica = random.Random(tarea.semilla ^ 0x5F3759DF)
+
+    dano = 0
+    tick_jefe = None
+    tiempo_jefe = None
+    tick = 0
+    while tick < tarea.max_ticks and not session.game_over:
+        vida = session.player.health
+        sucesos = session.step(politica(session, rng_politica, tick))
+        tick += 1
+        dano += max(0, vida - session.player.health)
+        if "jefe" in sucesos:
+            tick_jefe = tick
+        if "fase_completada" in sucesos:
+            tiempo_jefe = (tick - tick_jefe) * TICK_MS / 1000
+            break
+
+    return {
+        "semilla": tarea.semilla,
+        "fase": tarea.fase,
+        "politica": tarea.politica,
+        "sobrevivio": not session.game_over,
+        "jefe_derrotado": tiempo_jefe is not None,
+        "supervivencia_s": tick * TICK_MS / 1000,
+        "puntaje": session.score_manager.score,
+        "dano_recibido": dano,
+        "tiempo_jefe_s": tiempo_jefe,
+        "ticks": tick
+    }
+
+def simular_lote(tareas):
+    '''
+    Simula varias corridas seguidas en el mismo proceso.
+
+    Returns:
+        list: Resultado de cada corrida (ver simular()).
+    '''
+    return [simular(tarea) for tarea in tareas]
+
+def _iniciar_trabajador():
+    '''
+    Inicializador de cada proceso: pygame con drivers "dummy", sin ventana ni audio
+    aunque el entorno pida otros drivers.
+    '''
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    iniciar_headless()
+
+# Agregación ---------------------------------------------------------------------------------------
+class Agregado:
+    '''
+    Acumula los resultados de las corridas agrupados por (fase, política).
+
+    Atributos:
+        grupos (dict): (fase, política) -> lista de resultados.
+    '''
+    def __init__(self):
+        self.grupos = {}
+
+    def __len__(self):
+        return sum(len(resultados) for resultados in self.grupos.values())
+
+    def añadir(self, resultado):
+        self.grupos.setdefault((resultado["fase"], resultado["politica"]), []).append(resultado)
+
+    def resumen(self):
+        '''
+        Returns:
+            dict: Por grupo ("fase/política"): corridas, tasa de supervivencia y de
+                jefe derrotado, y media, p10, p50, p90 y máximo de cada métrica.
+        '''
+        resumen = {}
+        for (fase, politica), resultados in sorted(self.grupos.items()):
+            grupo = {
+                "corridas": len(resultados),
+                "supervivencia": sum(r["sobrevivio"] for r in resultados) / len(resultados),
+                "jefe_derrotado": sum(r["jefe_derrotado"] for r in resultados) / len(resultados)
+            }
+            for metrica in METRICAS:
+                valores = sorted(r[metrica] for r in resultados if r[metrica] is not None)
+                grupo[metrica] = {
+                    "media": sum(valores) / len(valores) if valores else None,
+                    "p10": percentil(valores, 10) if valores else None,
+                    "p50": percentil(valores, 50) if valores else None,
+                    "p90": percentil(valores, 90) if valores else None,
+                    "max": valores[-1] if valores else None
+                }
+            resumen[f"{fase}/{politica}"] = grupo
+        return resumen
+
+# Ejecución ----------------------------------------------------------------------------------------
+def crear_tareas(semillas, fases, politicas, max_ticks, backend=None, guion=None, semilla_inicial=0):
+    '''
+    Returns:
+        list: Una Tarea por cada combinación de semilla, fase y política.
+    '''
+    return [
+        Tarea(semilla, fase, politica, max_ticks, backend, guion)
+        for semilla in range(semilla_inicial, semilla_inicial + semillas)
+        for fase in fases
+        for politica in politicas
+    ]
+
+def ejecutar(tareas, trabajadores=None, tamaño_lote=None, al_recibir=None):
+    '''
+    Reparte las corridas entre procesos y agrega los resultados según llegan.
+
+    Args:
+        tareas (list): Corridas a simular.
+        trabajadores (int): Procesos a usar (None: uno por núcleo). Con 1 se simula
+            en el propio proceso, sin pool.
+        tamaño_lote (int): Corridas por envío a un proceso (None: unas 4 por proceso).
+        al_recibir (callable): al_recibir(agregado) tras cada lote recibido (opcional).
+    Returns:
+        Agregado: Resultados de todas las corridas.
+    '''
+    trabajadores = trabajadores or os.cpu_count() or 1
+    agregado = Agregado()
+    if trabajadores == 1:
+        _iniciar_trabajador()
+        for tarea in tareas:
+            agregado.añadir(simular(tarea))
+            if al_recibir:
+                al_recibir(agregado)
+        return agregado
+
+    tamaño_lote = tamaño_lote or max(1, len(tareas) // (trabajadores * 4))
+    lotes = [tareas[i:i + tamaño_lote] for i in range(0, len(tareas), tamaño_lote)]
+    with ProcessPoolExecutor(trabajadores, initializer=_iniciar_trabajador) as pool:
+        futuros = [pool.submit(simular_lote, lote) for lote in lotes]
+        for futuro in as_completed(futuros):
+            for resultado in futuro.result():
+                agregado.añadir(resultado)
+            if al_recibir:
+                al_recibir(agregado)
+    return agregado
+
+def imprimir(resumen):
+    '''
+    Muestra una tabla con las tasas y la mediana y p90 de cada métrica por grupo.
+    '''
+    for grupo, datos in resumen.items():
+        print(f"fase/política {grupo}: {datos['corridas']} corridas, "
+              f"sobrevive {datos['supervivencia']:.0%}, derrota al jefe {datos['jefe_derrotado']:.0%}")
+        for metrica in METRICAS:
+            r = datos[metrica]
+            if r["media"] is None:
+                print(f"  {metrica:<16} -")
+            else:
+                print(f"  {metrica:<16} media {r['media']:9.1f}  p50 {r['p50']:9.1f}  p90 {r['p90']:9.1f}  max {r['max']:9.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación por lotes de Galaxy Blast")
+    parser.add_argument("--semillas", type=int, default=100, help="Corridas por fase y política")
+    parser.add_argument("--semilla-inicial", type=int, default=0)
+    parser.add_argument("--fases", type=int, nargs="+", default=[1])
+    parser.add_argument("--politicas", nargs="+", choices=sorted(POLITICAS), default=["esquivador"])
+    parser.add_argument("--guion", help="Añade la política \"guion\" con las entradas de una repetición")
+    parser.add_argument("--max-segundos", type=float, default=MAX_SEGUNDOS_POR_DEFECTO, help="Tiempo de juego máximo por corrida")
+    parser.add_argument("--backend", choices=["sprites", "numpy"])
+    parser.add_argument("--trabajadores", type=int, help="Procesos (uno por núcleo por defecto)")
+    parser.add_argument("--lote", type=int, help="Corridas por envío a un proceso")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el resumen y las corridas")
+    args = parser.parse_args(argv)
+
+    politicas = args.politicas + (["guion"] if args.guion else [])
+    max_ticks = int(args.max_segundos * 1000 / TICK_MS)
+    tareas = crear_tareas(args.semillas, args.fases, politicas, max_ticks, args.backend, args.guion, args.semilla_inicial)
+
+    def progreso(agregado):
+        print(f"\r{len(agregado)}/{len(tareas)} corridas", end="", file=sys.stderr, flush=True)
+
+    inicio = time.perf_counter()
+    agregado = ejecutar(tareas, args.trabajadores, args.lote, progreso)
+    duracion = time.perf_counter() - inicio
+    print(file=sys.stderr)
+
+    resumen = agregado.resumen()
+    imprimir(resumen)
+    print(f"{len(tareas)} corridas en {duracion:.1f} s ({len(tareas) / duracion:.1f} corridas/s)")
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump({"resumen": resumen, "corridas": [r for grupo in agregado.grupos.values() for r in grupo]}, f, indent=4)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,504 @@
+# src/benchmark.py
+
+'''
+Benchmark de rendimiento por escenarios.
+
+Cada escenario prepara una situación de estrés reproducible (semilla fija, número fijo
+de frames) sobre una GameSession sin pantalla y mide el tiempo de cada frame separado
+en actualización, colisiones y dibujado. El resultado se guarda en JSON y puede
+compararse con una línea base: si algún escenario empeora más que el umbral, el
+programa termina con código de error.
+
+Uso:
+    python -m src.benchmark --salida resultados.json
+    python -m src.benchmark --baseline base.json --umbral 0.15
+    python -m src.benchmark --repeticion ultima_partida.rep --escenarios
+    python -m src.benchmark --micro
+'''
+
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+import timeit
+
+import pygame
+
+from src.game_session import iniciar_headless, GameSession, Entradas
+from src.score_manager import ScoreManager
+from src.renderer import crear_renderer, DirtyRenderer
+from src.player import Player
+from src.enemy import Enemy
+from src.wave_scheduler import ProgramadorOleadas
+from src.boss import Boss
+from src.powerup import PowerUp
+from src.bullet import Bullet
+from src.enemy_bullet import sprite_bala_enemiga
+from src.bullet_engine import BulletEngine
+from src.pool import vaciar_pools
+from src.replay import Repeticion, preparar_sesion
+from src.direction_table import DIRECCIONES, POR_GRADO, apuntar
+from src import atlas
+
+FRAMES_POR_DEFECTO = 600
+SEMILLA_POR_DEFECTO = 1234
+UMBRAL_POR_DEFECTO = 0.10
+FASES = ("update", "collision", "draw", "total")
+
+class Escenario:
+    '''
+    Situación de estrés reproducible.
+
+    Atributos:
+        nombre (str): Identificador del escenario.
+        descripcion (str): Qué se está midiendo.
+        preparar (callable): preparar(session, rng) crea las entidades iniciales.
+        por_frame (callable): por_frame(session, rng, frame) se llama antes de cada frame (opcional).
+        entradas (callable): entradas(rng, frame) devuelve las Entradas del jugador (opcional).
+    '''
+    def __init__(self, nombre, descripcion, preparar, por_frame=None, entradas=None):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.preparar = preparar
+        self.por_frame = por_frame
+        self.entradas = entradas
+
+ESCENARIOS = {}
+
+def registrar(escenario):
+    '''
+    Añade un escenario al catálogo.
+    '''
+    ESCENARIOS[escenario.nombre] = escenario
+    return escenario
+
+def _invulnerable(session):
+    '''
+    El jugador no debe morir durante la medición: el game over cambiaría la carga.
+    '''
+    session.player.health = 10 ** 9
+
+def _crear_jefe(session):
+    '''
+    Coloca un jefe ya en posición de combate y con vida de sobra.
+    '''
+    boss = Boss(BulletEngine() if session.backend == "numpy" else None)
+    boss.entrando = False
+    boss.rect.top = 60
+    boss.health = 10 ** 9
+    session.boss = boss
+    session.boss_group.add(boss)
+    return boss
+
+# Escenarios --------------------------------------------------------------------------------------
+def _preparar_torretas(session, rng):
+    _invulnerable(session)
+    for _ in range(500):
+        enemy = Enemy("torreta")
+        enemy.tipo_disparo = "abanico"
+        enemy.rect.top = rng.randint(0, 200)
+        session.enemies.add(enemy)
+
+registrar(Escenario(
+    "torretas_abanico",
+    "500 torretas disparando en abanico",
+    _preparar_torretas
+))
+
+def _preparar_anillo(session, rng):
+    _invulnerable(session)
+    _crear_jefe(session)
+
+def _anillo_por_frame(session, rng, frame):
+    if frame % 10 == 0 and session.boss:
+        session.boss.shoot_ring(64)
+
+registrar(Escenario(
+    "jefe_anillo",
+    "Jefe disparando shoot_ring(64) cada 10 frames",
+    _preparar_anillo,
+    _anillo_por_frame
+))
+
+def _preparar_minas(session, rng):
+    _invulnerable(session)
+    for _ in range(200):
+        enemy = Enemy("rapido")
+        enemy.speed = 0  # Se quedan en pantalla sembrando minas
+        enemy.tipo_movimiento = "vertical"
+        enemy.rect.top = rng.randint(0, 300)
+        enemy.cooldown_disparo = rng.randint(20, 40)
+        session.enemies.add(enemy)
+
+registrar(Escenario(
+    "minas_encadenadas",
+    "200 enemigos rápidos con explosiones de minas encadenadas",
+    _preparar_minas
+))
+
+def _preparar_powerups(session, rng):
+    _invulnerable(session)
+    session.player.rect.left = 0  # Fuera del camino para que los power-ups sigan animándose
+
+def _powerups_por_frame(session, rng, frame):
+    for _ in range(5):
+        session.powerups.add(PowerUp(rng.randint(40, 440), rng.randint(-20, 0)))
+
+registrar(Escenario(
+    "lluvia_powerups",
+    "Cinco power-ups nuevos por frame, todos animándose",
+    _preparar_powerups,
+    _powerups_por_frame
+))
+
+def _entradas_bot(rng, frame):
+    return Entradas(
+        izquierda=rng.random() < 0.3, derecha=rng.random() < 0.3,
+        arriba=rng.random() < 0.1, abajo=rng.random() < 0.1,
+        disparar=True, dash=rng.random() < 0.05, sobrecarga=True
+    )
+
+def _preparar_partida(session, rng):
+    _invulnerable(session)
+    session.oleadas = ProgramadorOleadas(session.fase_actual, intervalo=18)  # Un enemigo cada 300 ms
+
+registrar(Escenario(
+    "partida",
+    "Partida normal con un bot que dispara sin parar",
+    _preparar_partida,
+    entradas=_entradas_bot
+))
+
+# Medición ----------------------------------------------------------------------------------------
+def percentil(valores, p):
+    '''
+    Percentil por el método del rango más cercano.
+
+    Args:
+        valores (list): Muestras ordenadas.
+        p (float): Percentil entre 0 y 100.
+    '''
+    if not valores:
+        return 0.0
+    indice = min(len(valores) - 1, max(0, math.ceil(p / 100 * len(valores)) - 1))
+    return valores[indice]
+
+def resumir(muestras):
+    '''
+    Media, p95, p99 y máximo de una lista de muestras (tiempos en ms o conteos).
+    '''
+    ordenadas = sorted(muestras)
+    return {
+        "media": sum(ordenadas) / len(ordenadas) if ordenadas else 0.0,
+        "p95": percentil(ordenadas, 95),
+        "p99": percentil(ordenadas, 99),
+        "max": ordenadas[-1] if ordenadas else 0.0
+    }
+
+def ejecutar_escenario(escenario, frames=FRAMES_POR_DEFECTO, semilla=SEMILLA_POR_DEFECTO, backend=None, dibujar=True, modo_render="completo"):
+    '''
+    Ejecuta un escenario y mide cada frame.
+
+    Args:
+        escenario (Escenario): Escenario a ejecutar.
+        frames (int): Número de frames simulados.
+        semilla (int): Semilla del generador aleatorio.
+        backend (str): Backend de balas ("sprites" o "numpy"); None usa el de config.
+        dibujar (bool): Si se mide también el dibujado (incluido el envío a la ventana).
+        modo_render (str): "completo" o "dirty".
+    Returns:
+        dict: Resumen por fase (update, collision, draw, total) y número de entidades al final.
+    '''
+    rng = random.Random(semilla)
+    vaciar_pools()
+    pantalla = pygame.display.get_surface()
+    kwargs = {"backend": backend} if backend else {}
+    session = GameSession(ScoreManager(None), semilla=semilla, **kwargs)
+    session.iniciar_fase()
+    renderer = crear_renderer(modo_render)
+    escenario.preparar(session, rng)
+
+    muestras = {fase: [] for fase in FASES}
+    candidatos = []
+    ocupadas = []
+    reloj = time.perf_counter
+    for frame in range(frames):
+        if escenario.por_frame:
+            escenario.por_frame(session, rng, frame)
+        entradas = escenario.entradas(rng, frame) if escenario.entradas else Entradas()
+
+        t0 = reloj()
+        sucesos = session.actualizar(entradas)
+        t1 = reloj()
+        session.colisionar(sucesos)
+        t2 = reloj()
+        if dibujar:
+            renderer.draw(pantalla, session)
+            renderer.presentar()
+        t3 = reloj()
+
+        # Fuera de los tiempos: la rejilla aún tiene el contenido de este frame
+        candidatos.append(session.collision_system.estadisticas["pares_candidatos"])
+        ocupadas.append(session.collision_system.grid.ocupacion()[0])
+        muestras["update"].append((t1 - t0) * 1000)
+        muestras["collision"].append((t2 - t1) * 1000)
+        muestras["draw"].append((t3 - t2) * 1000)
+        muestras["total"].append((t3 - t0) * 1000)
+
+    resultado = {fase: resumir(muestras[fase]) for fase in FASES}
+    resultado["frames"] = frames
+    resultado["entidades"] = session.conteos()
+    resultado["colisiones"] = {
+        "pares_candidatos": resumir(candidatos),
+        "celdas_ocupadas": resumir(ocupadas),
+        "celdas_totales": len(session.collision_system.grid.celdas)
+    }
+    if dibujar:
+        resultado["hud"] = renderer.hud.estadisticas()["reconstrucciones"]
+        resultado["cola"] = renderer.cola.estadisticas()
+    if isinstance(renderer, DirtyRenderer):
+        resultado["dirty"] = renderer.estadisticas()
+    return resultado
+
+def escenario_repeticion(ruta):
+    '''
+    Escenario que reproduce las entradas de una partida grabada (ver replay).
+    Tras un game over la partida se reinicia, como en la reproducción normal.
+
+    Args:
+        ruta (str): Archivo de la repetición.
+    Returns:
+        Escenario: Escenario listo para ejecutar_escenario().
+    '''
+    repeticion = Repeticion.cargar(ruta)
+    entradas = list(repeticion)
+
+    def por_frame(session, rng, frame):
+        if session.game_over:
+            session.reiniciar()
+
+    return Escenario(
+        "repeticion", f"Entradas grabadas en {ruta} ({len(entradas)} ticks)",
+        lambda session, rng: preparar_sesion(repeticion, session), por_frame,
+        lambda rng, frame: entradas[frame] if frame < len(entradas) else Entradas()
+    )
+
+# Micro-benchmark de direcciones -------------------------------------------------------------------
+def _micro_casos():
+    '''
+    Pares (antes, después) de las operaciones de dirección de los proyectiles: la
+    trigonometría que se hacía por bala frente a la tabla de direction_table.
+    '''
+    angulos = [60 + i % 61 for i in range(64)]
+    objetivos = [(i * 7 % 200 - 100, 150 + i % 50) for i in range(64)]
+    onda = [(x_offset, apuntar(x_offset / 50, 1)) for x_offset in range(-80, 81, 40)]
+    radianes = [math.radians(a) for a in angulos]
+    direcciones = [DIRECCIONES[a * POR_GRADO] for a in angulos]
+
+    def angulo_trig():  # EnemyBullet: radians + cos + sin al crear cada bala
+        for a in angulos:
+            r = math.radians(a)
+            math.cos(r) * 4, math.sin(r) * 4
+
+    def angulo_tabla():  # Ángulo entero indexado en la tabla
+        for a in angulos:
+            dx, dy = DIRECCIONES[a * POR_GRADO]
+            dx * 4, dy * 4
+
+    def dirigido_trig():  # Enemy.shoot: atan2 -> grados -> radianes -> cos/sin
+        for dx, dy in objetivos:
+            r = math.radians(math.degrees(math.atan2(dy, dx)))
+            math.cos(r) * 4, math.sin(r) * 4
+
+    def dirigido_vector():  # Vector normalizado
+        for dx, dy in objetivos:
+            distancia = math.hypot(dx, dy) or 1.0
+            dx / distancia * 4, dy / distancia * 4
+
+    def onda_trig():  # shoot_sine_wave: atan2 por bala
+        for x_offset in range(-80, 81, 40):
+            r = math.radians(math.degrees(math.atan2(1, x_offset / 50)))
+            math.cos(r) * 4, math.sin(r) * 4
+
+    def onda_tabla():  # Direcciones calculadas al cargar el módulo
+        for _, (dx, dy) in onda:
+            dx * 4, dy * 4
+
+    def espiral_trig():  # SpiralBullet.update: cos y sin por frame
+        for r in radianes:
+            240 + math.cos(r) * 100.5, 120 + math.sin(r) * 100.5
+
+    def espiral_vector():  # Dirección guardada al crear la bala
+        for dx, dy in direcciones:
+            240 + dx * 100.5, 120 + dy * 100.5
+
+    return {
+        "disparo_angulo (64 balas)": (angulo_trig, angulo_tabla),
+        "disparo_dirigido (64 balas)": (dirigido_trig, dirigido_vector),
+        "onda (5 balas)": (onda_trig, onda_tabla),
+        "espiral_update (64 balas)": (espiral_trig, espiral_vector)
+    }
+
+def micro_direcciones(repeticiones=20000):
+    '''
+    Mide cada caso de _micro_casos() con timeit (mejor de 5).
+
+    Returns:
+        dict: Caso -> microsegundos por llamada antes y después, y aceleración.
+    '''
+    resultado = {}
+    for nombre, (antes, despues) in _micro_casos().items():
+        t_antes = min(timeit.repeat(antes, number=repeticiones, repeat=5)) / repeticiones * 1e6
+        t_despues = min(timeit.repeat(despues, number=repeticiones, repeat=5)) / repeticiones * 1e6
+        resultado[nombre] = {"antes_us": t_antes, "despues_us": t_despues, "aceleracion": t_antes / t_despues}
+    return resultado
+
+# Arranque en frío --------------------------------------------------------------------------------
+def _arranque(usar_atlas):
+    '''
+    Se ejecuta en un proceso nuevo, sin nada en caché: mide desde la ventana ya creada
+    hasta tener los sprites del jugador, los enemigos, el jefe, las balas y los power-ups.
+
+    Returns:
+        float: Milisegundos.
+    '''
+    iniciar_headless()
+    inicio = time.perf_counter()
+    if usar_atlas:
+        atlas.cargar(reconstruir=False)
+    Player(240, 600)
+    Enemy()
+    Boss()
+    PowerUp(0, 0)
+    Bullet(0, 0)
+    sprite_bala_enemiga(True)
+    sprite_bala_enemiga(False)
+    return (time.perf_counter() - inicio) * 1000
+
+def medir_arranque(repeticiones=10):
+    '''
+    Compara el arranque en frío recortando los sprites de las hojas con el arranque
+    desde el atlas (que se construye antes si hace falta). Cada medida usa un proceso nuevo.
+
+    Returns:
+        dict: Modo ("recortes" o "atlas") -> mediana y mínimo en milisegundos.
+    '''
+    iniciar_headless()
+    atlas.cargar()
+    resultado = {}
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for modo, usar_atlas in (("recortes", False), ("atlas", True)):
+            tiempos = sorted(pool.map(_arranque, [usar_atlas] * repeticiones, chunksize=1))
+            resultado[modo] = {"mediana_ms": tiempos[len(tiempos) // 2], "min_ms": tiempos[0]}
+    return resultado
+
+def ejecutar(nombres=None, frames=FRAMES_POR_DEFECTO, semilla=SEMILLA_POR_DEFECTO, backend=None, dibujar=True, modo_render="completo"):
+    '''
+    Ejecuta varios escenarios.
+
+    Args:
+        nombres (list): Escenarios a ejecutar; None ejecuta todos.
+    Returns:
+        dict: Informe con la configuración y el resultado de cada escenario.
+    '''
+    iniciar_headless()
+    informe = {"frames": frames, "semilla": semilla, "backend": backend, "render": modo_render, "escenarios": {}}
+    for nombre in nombres or ESCENARIOS:
+        informe["escenarios"][nombre] = ejecutar_escenario(ESCENARIOS[nombre], frames, semilla, backend, dibujar, modo_render)
+    return informe
+
+def comparar(informe, base, umbral=UMBRAL_POR_DEFECTO, metrica="p95"):
+    '''
+    Compara un informe con una línea base.
+
+    Args:
+        informe (dict): Resultado actual.
+        base (dict): Resultado de referencia.
+        umbral (float): Empeoramiento relativo tolerado (0.10 = 10 %).
+        metrica (str): Estadístico a comparar ("media", "p95" o "p99").
+    Returns:
+        list: Regresiones como tuplas (escenario, fase, base_ms, actual_ms).
+    '''
+    regresiones = []
+    for nombre, actual in informe["escenarios"].items():
+        referencia = base.get("escenarios", {}).get(nombre)
+        if referencia is None:
+            continue
+        for fase in FASES:
+            antes = referencia[fase][metrica]
+            ahora = actual[fase][metrica]
+            if antes > 0 and ahora > antes * (1 + umbral):
+                regresiones.append((nombre, fase, antes, ahora))
+    return regresiones
+
+def imprimir(informe):
+    '''
+    Muestra una tabla con media, p95 y p99 de cada fase.
+    '''
+    for nombre, resultado in informe["escenarios"].items():
+        print(f"{nombre} ({resultado['frames']} frames) {resultado['entidades']}")
+        if "colisiones" in resultado:
+            colisiones = resultado["colisiones"]
+            print(f"  colisiones por frame: {colisiones['pares_candidatos']['media']:.1f} pares candidatos "
+                  f"(máx. {colisiones['pares_candidatos']['max']:.0f}), {colisiones['celdas_ocupadas']['media']:.1f} "
+                  f"de {colisiones['celdas_totales']} celdas ocupadas")
+        if "cola" in resultado:
+            cola = resultado["cola"]
+            print(f"  cola de dibujo: {cola['envios']} envíos, {cola['vaciados']} vaciados en el último frame")
+        if "dirty" in resultado:
+            dirty = resultado["dirty"]
+            print(f"  dirty: {dirty['porcentaje_medio']:.1f} % de píxeles enviados, {dirty['frames_completos']} frames completos")
+        for fase in FASES:
+            r = resultado[fase]
+            print(f"  {fase:<10} media {r['media']:7.3f} ms  p95 {r['p95']:7.3f} ms  p99 {r['p99']:7.3f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escenarios de Galaxy Blast")
+    parser.add_argument("--escenarios", nargs="*", choices=sorted(ESCENARIOS), help="Escenarios a ejecutar (todos por defecto)")
+    parser.add_argument("--frames", type=int, default=FRAMES_POR_DEFECTO)
+    parser.add_argument("--semilla", type=int, default=SEMILLA_POR_DEFECTO)
+    parser.add_argument("--backend", choices=["sprites", "numpy"])
+    parser.add_argument("--sin-dibujo", action="store_true", help="No mide el dibujado")
+    parser.add_argument("--render", choices=["completo", "dirty"], default="completo", help="Modo de dibujado")
+    parser.add_argument("--micro", action="store_true", help="Micro-benchmark de la tabla de direcciones y termina")
+    parser.add_argument("--arranque", action="store_true", help="Mide el arranque en frío con y sin atlas y termina")
+    parser.add_argument("--repeticion", help="Añade un escenario con las entradas de una partida grabada")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="Archivo JSON de referencia para detectar regresiones")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_POR_DEFECTO)
+    parser.add_argument("--metrica", choices=["media", "p95", "p99"], default="p95")
+    args = parser.parse_args(argv)
+
+    if args.micro:
+        for nombre, r in micro_direcciones().items():
+            print(f"{nombre:<28} trig {r['antes_us']:7.2f} us  tabla {r['despues_us']:7.2f} us  x{r['aceleracion']:.2f}")
+        return 0
+    if args.arranque:
+        for modo, r in medir_arranque().items():
+            print(f"arranque {modo:<9} mediana {r['mediana_ms']:7.2f} ms  mínimo {r['min_ms']:7.2f} ms")
+        return 0
+    if args.repeticion:
+        ESCENARIOS["repeticion"] = escenario_repeticion(args.repeticion)
+        if args.escenarios is not None:
+            args.escenarios.append("repeticion")
+    informe = ejecutar(args.escenarios, args.frames, args.semilla, args.backend, not args.sin_dibujo, args.render)
+    imprimir(informe)
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(informe, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            base = json.load(f)
+        regresiones = comparar(informe, base, args.umbral, args.metrica)
+        for nombre, fase, antes, ahora in regresiones:
+            print(f"REGRESIÓN {nombre}/{fase}: {antes:.3f} ms -> {ahora:.3f} ms ({args.metrica})")
+        if regresiones:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
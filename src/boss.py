@@ -1,14 +1,20 @@
 import pygame
-import random
-import math
-from src.sprite_manager import extraer_sprite
+from src.pool import PooledSprite
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.bullet_engine import BulletEngine, ESPIRAL, CARGADA, VELOCIDAD_FRAGMENTOS
+from src.bullet_patterns import EmisorPatrones, obtener_patron, patron_anillo, repertorio
+from src.sprite_manager import obtener_sprite, obtener_recurso, obtener_pulso, fase_pulso
+from src.game_clock import rng
+from src.direction_table import direccion_grados, EXPLOSION
 
 class Boss(pygame.sprite.Sprite):
     '''
     Clase para los jefes del juego por fase.
     Esta clase maneja la lógica de movimiento, disparo y daño del jefe.
     Se encarga de crear y gestionar las balas disparadas por el jefe.
-    Además, implementa diferentes patrones de ataque como espiral, anillo y bola cargada.
+    Los patrones de ataque (espiral, anillo, bola cargada...) se declaran como datos en
+    bullet_patterns; cada fase tiene su repertorio y un EmisorPatrones reparte las
+    ráfagas grandes entre varios frames.
     También maneja la entrada del jefe desde la parte superior de la pantalla.
     
     Atributos:
@@ -17,53 +23,68 @@ class Boss(pygame.sprite.Sprite):
         health (int): Salud del jefe.
         speed (int): Velocidad de movimiento del jefe.
         direction (int): Dirección de movimiento del jefe (-1 o 1).
-        bullets (pygame.sprite.Group): Grupo de balas disparadas por el jefe.
+        bullets (pygame.sprite.Group | BulletEngine): Balas disparadas por el jefe.
         shoot_timer (int): Temporizador para controlar el tiempo entre disparos.
         entrando (bool): Indica si el jefe está entrando en la pantalla.
+        repertorio (tuple): Patrones que puede elegir en su fase.
+        emisor (EmisorPatrones): Cola de emisión de sus ráfagas.
     '''
-    def __init__(self):
+    def __init__(self, bullets=None, fase=1):
         '''
         Inicializa el jefe con sus sprites, posición inicial y atributos básicos.
         Carga las imágenes de los sprites del jefe y las balas.
         Configura la posición inicial del jefe para que entre desde la parte superior de la pantalla.
+
+        Args:
+            bullets (BulletEngine): Motor vectorizado para las balas. Si es None se usa un grupo de sprites.
+            fase (int): Fase del jefe; decide su repertorio de patrones.
         '''
         super().__init__()
-        sheet = pygame.image.load("assets/boss/SpaceShip_Boss-0001.png").convert_alpha()
-        bullets_sprites = pygame.image.load("assets/bullet/Bullets-0001.png").convert_alpha()
+        sheet = "assets/boss/SpaceShip_Boss-0001.png"
+        bullets_sprites = "assets/bullet/Bullets-0001.png"
         boss_sprites_1 = [
-            extraer_sprite(sheet, 3, 36, 105, 105, 1.5), 
-            extraer_sprite(sheet, 3, 157, 105, 105, 1.5), 
-            extraer_sprite(sheet, 3, 288, 105, 105, 1.5),
+            obtener_sprite(sheet, 3, 36, 105, 105, 1.5), 
+            obtener_sprite(sheet, 3, 157, 105, 105, 1.5), 
+            obtener_sprite(sheet, 3, 288, 105, 105, 1.5),
             
         ]
         boss_sprites_2 = [
-            extraer_sprite(sheet, 138, 36, 105, 105, 1.5), 
-            extraer_sprite(sheet, 138, 157, 105, 105, 1.5), 
-            extraer_sprite(sheet, 138, 288, 105, 105, 1.5),
+            obtener_sprite(sheet, 138, 36, 105, 105, 1.5), 
+            obtener_sprite(sheet, 138, 157, 105, 105, 1.5), 
+            obtener_sprite(sheet, 138, 288, 105, 105, 1.5),
         ]
         
         self.bullets_sprites = [
-            extraer_sprite(bullets_sprites, 16, 80, 17, 22, 1.5),  # Bullet sprite
-            extraer_sprite(bullets_sprites, 16, 16, 17, 22, 1.5),   # Alternate bullet sprite
+            obtener_sprite(bullets_sprites, 16, 80, 17, 22, 1.5),  # Bullet sprite
+            obtener_sprite(bullets_sprites, 16, 16, 17, 22, 1.5),   # Alternate bullet sprite
+        ]
+        # Versión grande de cada bala para la bola cargada, escalada una sola vez
+        self.charged_sprites = [
+            obtener_recurso(("bola_cargada", i), lambda sprite=sprite: pygame.transform.scale(sprite, (40, 40)))
+            for i, sprite in enumerate(self.bullets_sprites)
         ]
         
-        self.image = random.choice(boss_sprites_1)
+        self.image = rng().choice(boss_sprites_1)
         self.rect = self.image.get_rect(midtop=(240, -100))  # Entra desde arriba
         self.health = 1500
         self.speed = 3
         self.direction = 1
-        self.bullets = pygame.sprite.Group()
+        self.bullets = bullets if bullets is not None else pygame.sprite.Group()
+        self.motor = isinstance(self.bullets, BulletEngine)
         self.shoot_timer = 0
         self.entrando = True
+        self.repertorio = repertorio(fase)
+        self.emisor = EmisorPatrones(self)
 
-    def update(self, time_factor=1.0):
+    def update(self, time_factor=1.0, objetivo=None):
         '''
         Actualiza la posición del jefe y maneja el disparo de balas.
         Si el jefe está entrando, se mueve hacia abajo hasta alcanzar una posición específica.
-        Una vez que ha entrado, se mueve horizontalmente y dispara balas según un patrón aleatorio.
+        Una vez que ha entrado, se mueve horizontalmente y dispara un patrón aleatorio de su repertorio.
         
         Args:
             time_factor (float): Factor de tiempo para ajustar la velocidad de movimiento y disparo.
+            objetivo (pygame.sprite.Sprite): Jugador al que apuntan los patrones dirigidos.
         '''
         if self.entrando:
             self.rect.y += 1
@@ -77,23 +98,46 @@ class Boss(pygame.sprite.Sprite):
             # Disparar cada 60 frames SOLO cuando no está entrando
             self.shoot_timer += 1
             if self.shoot_timer >= 60:  # Dispara cada segundo
-                attack_pattern = random.choice([
-                    self.shoot,          # Ataque básico original
-                    self.shoot_spiral,
-                    self.shoot_ring,
-                    self.shoot_charged_ball
-                ])
-                attack_pattern()
+                self.disparar_patron(rng().choice(self.repertorio), objetivo)
                 self.shoot_timer = 0
+        self.emisor.update()
+
+    def disparar_patron(self, nombre, objetivo=None):
+        '''
+        Encola un patrón del catálogo; sus balas salen a partir del próximo update().
+
+        Args:
+            nombre (str): Nombre del patrón en bullet_patterns.PATRONES.
+            objetivo (pygame.sprite.Sprite): Sprite al que apunta si el patrón es dirigido.
+        '''
+        self.emisor.disparar(obtener_patron(nombre), objetivo)
+
+    def crear_bala(self, tipo, imagen, centro, direccion, velocidad):
+        '''
+        Crea una bala de sprite con la dirección ya calculada (backend de sprites).
+
+        Args:
+            tipo (int): LINEAL, ESPIRAL o CARGADA.
+            imagen (pygame.Surface): Sprite de la bala.
+            centro (tuple): Posición inicial del centro.
+            direccion (tuple): Vector unitario (dx, dy).
+            velocidad (float): Velocidad de la bala.
+        '''
+        rect = imagen.get_rect(center=centro)
+        if tipo == CARGADA:
+            bala = ChargedBullet.crear(imagen, rect, self.bullets_sprites)
+            bala.speed = velocidad
+        elif tipo == ESPIRAL:
+            bala = SpiralBullet.crear(imagen, rect, 0, direccion)
+        else:
+            bala = BossBullet.crear(imagen, rect, 90, direccion, velocidad)
+        self.bullets.add(bala)
 
     def shoot(self):
         '''
         Dispara una bala hacia abajo desde la posición del jefe.
-        Selecciona aleatoriamente un sprite de bala del grupo de balas.
         '''
-        bullet = random.choice(self.bullets_sprites)
-        rect = bullet.get_rect(midtop=(self.rect.centerx, self.rect.bottom))
-        self.bullets.add(BossBullet(bullet, rect))
+        self.disparar_patron("basico")
 
     def draw(self, surface):
         '''
@@ -119,49 +163,27 @@ class Boss(pygame.sprite.Sprite):
     
     def shoot_spiral(self):
         '''
-        Dispara balas en un patrón espiral.
-        Crea 8 balas que se dispersan en un patrón espiral alrededor del jefe.
-        Cada bala se crea con un ángulo inicial basado en el tiempo actual del juego.
-        El ángulo de cada bala se incrementa en 45 grados para crear el efecto espiral.
+        Dispara 8 balas en espiral separadas 45 grados, giradas según el tiempo de juego.
         '''
-        angle = pygame.time.get_ticks() % 360
-        for i in range(8):
-            bullet = random.choice(self.bullets_sprites)
-            rect = bullet.get_rect(center=(self.rect.centerx, self.rect.centery))
-            self.bullets.add(SpiralBullet(bullet, rect, angle + i*45))
+        self.disparar_patron("espiral")
 
     def shoot_ring(self, bullets=12):
         '''
         Dispara balas en un patrón de anillo.
-        Crea un número específico de balas que se dispersan en un círculo alrededor
-        del jefe. Cada bala se crea con un ángulo calculado en función de su posición en el círculo.
         
         Args:
             bullets (int): Número de balas a disparar en el patrón de anillo.
         '''
-        for i in range(bullets):
-            angle = 360 / bullets * i
-            bullet = random.choice(self.bullets_sprites)
-            rect = bullet.get_rect(center=(self.rect.centerx, self.rect.centery))
-            self.bullets.add(BossBullet(bullet, rect, angle))  # Ahora acepta 3 parámetros
+        self.emisor.disparar(patron_anillo(bullets))
 
     def shoot_charged_ball(self):
         '''
-        Dispara una bola cargada que explota después de un tiempo.
-        Crea una bala grande que se mueve hacia abajo y explota después de un tiempo,
-        creando 8 balas más pequeñas que se dispersan en todas direcciones.
-        Esta bala tiene un efecto de pulso visual y se escala para simular una carga.
-        También utiliza un sprite aleatorio de las balas disponibles.
-        '''
-        big_bullet = pygame.transform.scale(
-            random.choice(self.bullets_sprites), 
-            (40, 40)
-        )
-        rect = big_bullet.get_rect(center=(self.rect.centerx, self.rect.bottom))
-        self.bullets.add(ChargedBullet(big_bullet, rect, self.bullets_sprites))
+        Dispara una bola cargada que baja lentamente y explota en 8 balas después de un tiempo.
+        '''
+        self.disparar_patron("cargada")
 
 
-class BossBullet(pygame.sprite.Sprite):
+class BossBullet(PooledSprite):
     '''
     Clase para las balas disparadas por el jefe.
     Esta clase maneja el movimiento y la actualización de las balas.
@@ -171,27 +193,39 @@ class BossBullet(pygame.sprite.Sprite):
         image (pygame.Surface): Imagen de la bala.
         rect (pygame.Rect): Rectángulo que define la posición y tamaño de la bala.
         speed (int): Velocidad de movimiento de la bala.
-        angle (float): Ángulo en radianes en el que se mueve la bala.
+        dir_x, dir_y (float): Dirección unitaria.
         vel_x (float): Componente horizontal de la velocidad.
         vel_y (float): Componente vertical de la velocidad.
     '''
-    def __init__(self, image, rect, angle=90):  # 90° = hacia abajo por defecto
+    def __init__(self, image, rect, angle=90, direccion=None, speed=5):  # 90° = hacia abajo por defecto
         super().__init__()
+        self.reiniciar(image, rect, angle, direccion, speed)
+
+    def reiniciar(self, image, rect, angle=90, direccion=None, speed=5):
+        '''
+        Inicializa (o reinicializa, si viene del pool) imagen, posición y dirección.
+        Si se da `direccion` (vector unitario precalculado) no se usa `angle`; si no,
+        la dirección sale de la tabla de direction_table.
+        '''
         self.image = image
         self.rect = rect
-        self.speed = 5
-        self.angle = math.radians(angle)  # Convierte a radianes
-        self.vel_x = math.cos(self.angle) * self.speed
-        self.vel_y = math.sin(self.angle) * self.speed
+        self.speed = speed
+        if direccion is None:
+            direccion = direccion_grados(angle)
+        self.dir_x, self.dir_y = direccion
+        self.vel_x = direccion[0] * self.speed
+        self.vel_y = direccion[1] * self.speed
 
     def update(self, time_factor=1.0):
         '''
         Actualiza la posición de la bala según su velocidad y ángulo.
-        Mueve la bala en la dirección especificada por su ángulo.
+        Mueve la bala en la dirección especificada por su ángulo y la elimina al salir
+        de la pantalla por cualquier lado (los anillos también disparan hacia arriba).
         '''
         self.rect.x += int(self.vel_x * time_factor)
         self.rect.y += int(self.vel_y * time_factor)
-        if self.rect.top > 670:
+        rect = self.rect
+        if rect.top > SCREEN_HEIGHT or rect.bottom < 0 or rect.left > SCREEN_WIDTH or rect.right < 0:
             self.kill()
 
 class SpiralBullet(BossBullet):
@@ -202,15 +236,21 @@ class SpiralBullet(BossBullet):
     Atributos:
         image (pygame.Surface): Imagen de la bala.
         rect (pygame.Rect): Rectángulo que define la posición y tamaño de la bala.
-        angle (float): Ángulo en radianes en el que se mueve la bala.
+        dir_x, dir_y (float): Dirección unitaria en la que crece el radio.
         speed (int): Velocidad de movimiento de la bala.
         radius (float): Radio del movimiento en espiral.
         center_x (int): Coordenada x del centro del espiral.
         center_y (int): Coordenada y del centro del espiral.
     '''
-    def __init__(self, image, rect, angle):
-        super().__init__(image, rect)
-        self.angle = math.radians(angle)
+    def __init__(self, image, rect, angle, direccion=None):
+        PooledSprite.__init__(self)
+        self.reiniciar(image, rect, angle, direccion)
+
+    def reiniciar(self, image, rect, angle, direccion=None):
+        '''
+        Inicializa (o reinicializa, si viene del pool) la bala en el centro del espiral.
+        '''
+        super().reiniciar(image, rect, angle, direccion)
         self.speed = 3
         self.radius = 0
         self.center_x = rect.centerx
@@ -220,15 +260,15 @@ class SpiralBullet(BossBullet):
         '''
         Actualiza la posición de la bala en un patrón espiral.
         Aumenta el radio del movimiento en espiral y actualiza la posición de la bala
-        según su ángulo y radio.
+        según su dirección (precalculada, sin seno ni coseno por frame) y radio.
         Si el radio supera un límite, la bala se elimina.
         
         Args:
             time_factor (float): Factor de tiempo para ajustar la velocidad de movimiento.
         '''
         self.radius += 0.5 * time_factor
-        self.rect.x = self.center_x + math.cos(self.angle) * self.radius
-        self.rect.y = self.center_y + math.sin(self.angle) * self.radius
+        self.rect.x = self.center_x + self.dir_x * self.radius
+        self.rect.y = self.center_y + self.dir_y * self.radius
         if self.radius > 300:
             self.kill()
 
@@ -243,37 +283,42 @@ class ChargedBullet(BossBullet):
         speed (int): Velocidad de movimiento de la bala.
         timer (int): Temporizador para controlar el tiempo antes de la explosión.
         glow_timer (float): Temporizador para el efecto de pulso visual.
-        scale_factor (float): Factor de escala para el efecto de pulso.
+        pulso (tuple): Tira precalculada del pulso, indexada por fase.
     '''
     def __init__(self, image, rect, bullets_sprites):
-        super().__init__(image, rect, 90)  # Siempre dispara hacia abajo
+        PooledSprite.__init__(self)
+        self.reiniciar(image, rect, bullets_sprites)
+
+    def reiniciar(self, image, rect, bullets_sprites):
+        '''
+        Inicializa (o reinicializa, si viene del pool) la bola cargada y su pulso.
+        '''
+        super().reiniciar(image, rect, 90)  # Siempre dispara hacia abajo
         self.original_image = image
+        self.pulso = obtener_pulso(image, 0.1)
         self.speed = 2
         self.timer = 0
         self.glow_timer = 0
-        self.scale_factor = 1.0
         self.bullets_sprites = bullets_sprites
 
     def update(self, time_factor=1.0):
         '''
         Actualiza la posición de la bala cargada y maneja el efecto de pulso.
-        Aumenta el temporizador y escala la imagen para crear un efecto de pulso.
+        Aumenta el temporizador y toma el fotograma del pulso que corresponde a la fase.
         Si el temporizador alcanza un límite, la bala explota y se crean balas secundarias.
         También mueve la bala hacia abajo según su velocidad.
         
         Args:
             time_factor (float): Factor de tiempo para ajustar la velocidad de movimiento y el efecto de pulso.
         '''
-        # Efecto de pulso
+        # Efecto de pulso: fotograma precalculado, sin escalar ni crear superficies
         self.glow_timer += 0.1 * time_factor
-        self.scale_factor = 1 + 0.1 * math.sin(self.glow_timer)
-        self.image = pygame.transform.scale(
-            self.original_image,
-            (int(self.original_image.get_width() * self.scale_factor),
-             int(self.original_image.get_height() * self.scale_factor))
-        )
-        old_center = self.rect.center
-        self.rect = self.image.get_rect(center=old_center)
+        image = self.pulso[fase_pulso(self.glow_timer)]
+        if image is not self.image:
+            centro = self.rect.center
+            self.image = image
+            self.rect.size = image.get_size()
+            self.rect.center = centro
         
         # Movimiento y explosión
         self.timer += 1 * time_factor
@@ -287,9 +332,8 @@ class ChargedBullet(BossBullet):
         '''
         Crea 8 balas secundarias que se dispersan en todas direcciones al explotar
         '''
-        for angle in range(0, 360, 45):  # 8 direcciones
-            bullet_img = random.choice(self.bullets_sprites)
+        for direccion in EXPLOSION:  # 8 direcciones
+            bullet_img = rng().choice(self.bullets_sprites)
             rect = bullet_img.get_rect(center=self.rect.center)
-            new_bullet = BossBullet(bullet_img, rect, angle)
-            new_bullet.speed = 3  # Velocidad para las balas secundarias
+            new_bullet = BossBullet.crear(bullet_img, rect, 90, direccion, VELOCIDAD_FRAGMENTOS[CARGADA])
             self.groups()[0].add(new_bullet)  # Añade al mismo grupo de sprites
\ No newline at end of file
@@ -1,10 +1,10 @@
 # src/bullet.py
 
-import pygame
 from src.config import BULLET_SPEED
-from src.sprite_manager import extraer_sprite
+from src.pool import PooledSprite
+from src.sprite_manager import obtener_sprite
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     '''
     Clase que representa una bala disparada por el jugador.
     
@@ -14,10 +14,15 @@ class Bullet(pygame.sprite.Sprite):
     '''
     def __init__(self, x, y):
         super().__init__()
-        self.bullet_sheet = pygame.image.load("assets/bullet/Bullets-0001.png").convert_alpha()
-        self.image = extraer_sprite(self.bullet_sheet, 148, 111, 6, 19, 1.5)
+        self.image = obtener_sprite("assets/bullet/Bullets-0001.png", 148, 111, 6, 19, 1.5)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def reiniciar(self, x, y):
+        '''
+        Recoloca una bala reciclada del pool.
+        '''
+        self.rect.center = (x, y)
+
     def update(self):
         '''
         Actualiza la posición de la bala.
@@ -0,0 +1,373 @@
+# src/bullet_engine.py
+
+'''
+Motor de proyectiles en estructura de arrays (NumPy).
+
+Alternativa a los grupos de sprites para las balas de enemigos y jefes. Posición,
+velocidad, radio, temporizador, tipo y sprite de cada bala viven en arrays contiguos
+y se avanzan todos a la vez en un único paso vectorizado, en lugar de una llamada a
+update() por bala. Las balas que salen de pantalla se eliminan compactando los arrays.
+'''
+
+import math
+import numpy as np
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.sprite_manager import obtener_pulso, PASOS_PULSO
+from src.direction_table import EXPLOSION
+
+# Tipos de proyectil
+LINEAL = 0     # Se mueve en línea recta (EnemyBullet, BossBullet)
+ESPIRAL = 1    # Se aleja del centro con radio creciente (SpiralBullet)
+MINA = 2       # Flota y explota en 8 balas (EnemyBullet con is_mine)
+CARGADA = 3    # Baja lentamente y explota en 8 balas (ChargedBullet)
+
+TIEMPO_MINA = 180      # Frames hasta que explota una mina
+TIEMPO_CARGADA = 60    # Frames hasta que explota una bola cargada
+RADIO_MAX_ESPIRAL = 300
+VELOCIDAD_ESPIRAL = 0.5
+VELOCIDAD_FRAGMENTOS = {MINA: 3, CARGADA: 5}
+VELOCIDAD_PULSO = 0.1  # Radianes de fase del pulso por frame (bolas cargadas)
+
+# Direcciones de los 8 fragmentos de una explosión (0°, 45°, ..., 315°)
+_COS_EXPLOSION = np.array([dx for dx, _ in EXPLOSION], dtype=np.float32)
+_SIN_EXPLOSION = np.array([dy for _, dy in EXPLOSION], dtype=np.float32)
+
+_CAMPOS = {
+    "x": np.float32, "y": np.float32,        # Centro de la bala
+    "px": np.float32, "py": np.float32,      # Centro al inicio del último tick (interpolación)
+    "vx": np.float32, "vy": np.float32,      # Velocidad por frame
+    "cx": np.float32, "cy": np.float32,      # Centro del espiral
+    "dx": np.float32, "dy": np.float32,      # Dirección unitaria del espiral
+    "radio": np.float32,
+    "timer": np.float32,                     # Frames vividos
+    "tipo": np.int8,
+    "sprite": np.int16,
+    "hijo": np.int16,                        # Sprite de los fragmentos al explotar
+    "pulso": np.int16                        # Fila de la tabla de pulsos o -1
+}
+
+class BulletEngine:
+    '''
+    Contenedor vectorizado de proyectiles. Expone la misma interfaz que usa el bucle
+    principal con los grupos de sprites (update, draw, empty, len) más métodos de
+    emisión y de colisión.
+
+    Atributos:
+        n (int): Número de balas vivas (ocupan las posiciones [0, n) de cada array).
+        capacidad (int): Tamaño reservado de los arrays.
+        superficies (list): Sprites registrados; cada bala guarda un índice a esta lista.
+        ticks (int): Frames simulados, usados para el balanceo de las minas.
+        pulsos (numpy.ndarray): Índice de sprite de cada fotograma de pulso, una fila por sprite pulsante.
+    '''
+    def __init__(self, capacidad=1024):
+        self.n = 0
+        self.capacidad = capacidad
+        for campo, tipo in _CAMPOS.items():
+            setattr(self, campo, np.zeros(capacidad, dtype=tipo))
+        self.superficies = []
+        self._ids = {}
+        self._semi_w = np.zeros(0, dtype=np.float32)
+        self._semi_h = np.zeros(0, dtype=np.float32)
+        self.ticks = 0
+        self.pulsos = np.zeros((0, PASOS_PULSO), dtype=np.int16)
+        self._filas_pulso = {}
+
+    def __len__(self):
+        return self.n
+
+    def __bool__(self):
+        return self.n > 0
+
+    def registrar_sprite(self, superficie):
+        '''
+        Devuelve el índice de un sprite, registrándolo la primera vez.
+
+        Args:
+            superficie (pygame.Surface): Sprite compartido del registro de recursos.
+        Returns:
+            int: Índice del sprite en self.superficies.
+        '''
+        indice = self._ids.get(id(superficie))
+        if indice is None:
+            indice = len(self.superficies)
+            self.superficies.append(superficie)
+            self._ids[id(superficie)] = indice
+            self._semi_w = np.append(self._semi_w, np.float32(superficie.get_width() / 2))
+            self._semi_h = np.append(self._semi_h, np.float32(superficie.get_height() / 2))
+        return indice
+
+    def registrar_pulso(self, superficie):
+        '''
+        Registra los fotogramas de la tira de pulso de un sprite (ver obtener_pulso).
+
+        Returns:
+            int: Fila de self.pulsos con los índices de sus fotogramas.
+        '''
+        fila = self._filas_pulso.get(id(superficie))
+        if fila is None:
+            ids = [self.registrar_sprite(fotograma) for fotograma in obtener_pulso(superficie, 0.1)]
+            fila = len(self.pulsos)
+            self.pulsos = np.vstack([self.pulsos, np.array(ids, dtype=np.int16)])
+            self._filas_pulso[id(superficie)] = fila
+        return fila
+
+    def _reservar(self, cantidad):
+        '''
+        Garantiza espacio para `cantidad` balas más, duplicando los arrays si hace falta.
+        '''
+        necesario = self.n + cantidad
+        if necesario <= self.capacidad:
+            return
+        capacidad = self.capacidad
+        while capacidad < necesario:
+            capacidad *= 2
+        for campo in _CAMPOS:
+            viejo = getattr(self, campo)
+            nuevo = np.zeros(capacidad, dtype=viejo.dtype)
+            nuevo[:self.n] = viejo[:self.n]
+            setattr(self, campo, nuevo)
+        self.capacidad = capacidad
+
+    def emit(self, x, y, angulos, speed, sprite, tipo=LINEAL, hijo=None):
+        '''
+        Añade una o varias balas. x, y y angulos pueden ser escalares o secuencias.
+
+        Args:
+            x (float | sequence): Posición horizontal del centro.
+            y (float | sequence): Posición vertical del centro.
+            angulos (float | sequence): Ángulo de disparo en grados.
+            speed (float): Velocidad de las balas.
+            sprite (pygame.Surface | list): Sprite común o un sprite por bala.
+            tipo (int): LINEAL, ESPIRAL, MINA o CARGADA.
+            hijo (pygame.Surface): Sprite de los fragmentos si la bala explota.
+        '''
+        angulos = np.radians(np.atleast_1d(np.asarray(angulos, dtype=np.float32)))
+        self.emit_vectores(x, y, np.cos(angulos), np.sin(angulos), speed, sprite, tipo, hijo)
+
+    def emit_vectores(self, x, y, dx, dy, speed, sprite, tipo=LINEAL, hijo=None):
+        '''
+        Como emit(), pero con la dirección ya dada como vector unitario: no calcula
+        trigonometría (ver bullet_patterns, que precalcula las direcciones).
+
+        Args:
+            dx, dy (float | sequence): Componentes de la dirección unitaria.
+            speed (float | sequence): Velocidad común o una por bala.
+        '''
+        x, y, dx, dy, speed = np.broadcast_arrays(
+            np.float32(x), np.float32(y), np.atleast_1d(np.asarray(dx, dtype=np.float32)),
+            np.asarray(dy, dtype=np.float32), np.asarray(speed, dtype=np.float32)
+        )
+        cantidad = dx.size
+        self._reservar(cantidad)
+        ini, fin = self.n, self.n + cantidad
+
+        if isinstance(sprite, (list, tuple)):
+            ids = [self.registrar_sprite(s) for s in sprite]
+        else:
+            ids = self.registrar_sprite(sprite)
+
+        self.x[ini:fin] = x
+        self.y[ini:fin] = y
+        self.px[ini:fin] = x
+        self.py[ini:fin] = y
+        self.cx[ini:fin] = x
+        self.cy[ini:fin] = y
+        self.dx[ini:fin] = dx
+        self.dy[ini:fin] = dy
+        if tipo == LINEAL:
+            self.vx[ini:fin] = dx * speed
+            self.vy[ini:fin] = dy * speed
+        elif tipo == CARGADA:
+            self.vx[ini:fin] = 0
+            self.vy[ini:fin] = speed
+        else:
+            self.vx[ini:fin] = 0
+            self.vy[ini:fin] = 0
+        self.radio[ini:fin] = 0
+        self.timer[ini:fin] = 0
+        self.tipo[ini:fin] = tipo
+        self.sprite[ini:fin] = ids
+        self.hijo[ini:fin] = self.registrar_sprite(hijo) if hijo is not None else -1
+        self.pulso[ini:fin] = self.registrar_pulso(sprite) if tipo == CARGADA else -1
+        self.n = fin
+
+    def update(self, time_factor=1.0):
+        '''
+        Avanza todas las balas un frame: movimiento lineal, crecimiento del radio de
+        los espirales, temporizadores de minas y bolas cargadas, explosiones y
+        eliminación de las balas fuera de pantalla.
+
+        Args:
+            time_factor (float): Factor de tiempo para ajustar la velocidad.
+        '''
+        self.ticks += 1
+        n = self.n
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        tipo, timer, radio = self.tipo[:n], self.timer[:n], self.radio[:n]
+
+        x += self.vx[:n] * time_factor
+        y += self.vy[:n] * time_factor
+        timer += time_factor
+
+        espiral = tipo == ESPIRAL
+        if espiral.any():
+            radio[espiral] += VELOCIDAD_ESPIRAL * time_factor
+            x[espiral] = self.cx[:n][espiral] + self.dx[:n][espiral] * radio[espiral]
+            y[espiral] = self.cy[:n][espiral] + self.dy[:n][espiral] * radio[espiral]
+
+        pulsa = self.pulso[:n] >= 0
+        if pulsa.any():
+            fases = (timer[pulsa] * (VELOCIDAD_PULSO * PASOS_PULSO / (2 * math.pi))).astype(np.int32) % PASOS_PULSO
+            self.sprite[:n][pulsa] = self.pulsos[self.pulso[:n][pulsa], fases]
+
+        mina = tipo == MINA
+        if mina.any():
+            y[mina] += math.sin(self.ticks / 30) * 0.5  # Flota en el lugar
+
+        explota = (mina & (timer > TIEMPO_MINA)) | ((tipo == CARGADA) & (timer >= TIEMPO_CARGADA))
+        semi_w = self._semi_w[self.sprite[:n]]
+        semi_h = self._semi_h[self.sprite[:n]]
+        muertas = (
+            explota
+            | (espiral & (radio > RADIO_MAX_ESPIRAL))
+            | (x + semi_w < 0) | (x - semi_w > SCREEN_WIDTH)
+            | (y + semi_h < 0) | (y - semi_h > SCREEN_HEIGHT)
+        )
+
+        fragmentos = None
+        if explota.any():
+            fragmentos = (x[explota].copy(), y[explota].copy(), tipo[explota].copy(), self.hijo[:n][explota].copy())
+        if muertas.any():
+            self._compactar(~muertas)
+        if fragmentos is not None:
+            self._explotar(*fragmentos)
+
+    def _compactar(self, vivas):
+        '''
+        Mueve las balas vivas al principio de los arrays y actualiza n.
+
+        Args:
+            vivas (numpy.ndarray): Máscara booleana de longitud n.
+        '''
+        n = self.n
+        k = int(np.count_nonzero(vivas))
+        for campo in _CAMPOS:
+            arr = getattr(self, campo)
+            arr[:k] = arr[:n][vivas]
+        self.n = k
+
+    def _explotar(self, xs, ys, tipos, hijos):
+        '''
+        Crea 8 fragmentos lineales por cada mina o bola cargada que explota.
+        '''
+        cantidad = xs.size * 8
+        self._reservar(cantidad)
+        ini, fin = self.n, self.n + cantidad
+        velocidad = np.repeat(np.where(tipos == MINA, VELOCIDAD_FRAGMENTOS[MINA], VELOCIDAD_FRAGMENTOS[CARGADA]), 8)
+        self.x[ini:fin] = np.repeat(xs, 8)
+        self.y[ini:fin] = np.repeat(ys, 8)
+        self.px[ini:fin] = self.x[ini:fin]
+        self.py[ini:fin] = self.y[ini:fin]
+        self.dx[ini:fin] = np.tile(_COS_EXPLOSION, xs.size)
+        self.dy[ini:fin] = np.tile(_SIN_EXPLOSION, xs.size)
+        self.vx[ini:fin] = self.dx[ini:fin] * velocidad
+        self.vy[ini:fin] = self.dy[ini:fin] * velocidad
+        self.radio[ini:fin] = 0
+        self.timer[ini:fin] = 0
+        self.tipo[ini:fin] = LINEAL
+        self.sprite[ini:fin] = np.repeat(np.maximum(hijos, 0), 8)
+        self.hijo[ini:fin] = -1
+        self.pulso[ini:fin] = -1
+        self.n = fin
+
+    def guardar_posiciones(self):
+        '''
+        Copia las posiciones actuales como punto de partida de la interpolación.
+        '''
+        n = self.n
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+
+    def batch(self, alpha=1.0):
+        '''
+        Lote de dibujo para Surface.blits.
+
+        Args:
+            alpha (float): Fracción del tick entre la posición guardada y la actual (1 = actual).
+        Returns:
+            zip: Pares (superficie, (x, y)) con la esquina superior izquierda de cada bala.
+        '''
+        n = self.n
+        ids = self.sprite[:n]
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            x = self.px[:n] + (x - self.px[:n]) * alpha
+            y = self.py[:n] + (y - self.py[:n]) * alpha
+        xs = (x - self._semi_w[ids]).astype(np.int32).tolist()
+        ys = (y - self._semi_h[ids]).astype(np.int32).tolist()
+        superficies = self.superficies
+        return zip([superficies[i] for i in ids.tolist()], zip(xs, ys))
+
+    def draw(self, surface, alpha=1.0):
+        '''
+        Dibuja todas las balas con una única llamada a Surface.blits.
+
+        Args:
+            surface (pygame.Surface): Superficie donde se dibujan las balas.
+            alpha (float): Fracción del tick para interpolar la posición.
+        '''
+        if self.n:
+            surface.blits(self.batch(alpha), doreturn=False)
+
+    def colisiones_rect(self, rect):
+        '''
+        Índices de las balas cuyo rectángulo se solapa con `rect`.
+
+        Args:
+            rect (pygame.Rect): Rectángulo a comprobar (p. ej. el del jugador).
+        Returns:
+            numpy.ndarray: Índices de las balas que colisionan.
+        '''
+        n = self.n
+        ids = self.sprite[:n]
+        semi_w, semi_h = self._semi_w[ids], self._semi_h[ids]
+        x, y = self.x[:n], self.y[:n]
+        solapa = (
+            (x + semi_w > rect.left) & (x - semi_w < rect.right)
+            & (y + semi_h > rect.top) & (y - semi_h < rect.bottom)
+        )
+        return np.flatnonzero(solapa)
+
+    def collide_rect(self, rect):
+        '''
+        Elimina las balas que tocan `rect` y devuelve cuántas eran.
+
+        Args:
+            rect (pygame.Rect): Rectángulo a comprobar.
+        Returns:
+            int: Número de impactos.
+        '''
+        indices = self.colisiones_rect(rect)
+        if indices.size:
+            self.kill(indices)
+        return int(indices.size)
+
+    def kill(self, indices):
+        '''
+        Elimina las balas indicadas.
+
+        Args:
+            indices (sequence): Índices de las balas a eliminar.
+        '''
+        vivas = np.ones(self.n, dtype=bool)
+        vivas[indices] = False
+        self._compactar(vivas)
+
+    def empty(self):
+        '''
+        Elimina todas las balas.
+        '''
+        self.n = 0
@@ -0,0 +1,309 @@
+# src/bullet_patterns.py
+
+'''
+Motor de patrones de disparo de los jefes.
+
+Los patrones se declaran como datos en PATRONES: una forma (disparo, anillo o abanico)
+con su número de balas, ángulos, velocidad, tipo de bala y retardo, o una lista de
+capas que combina varias formas. Cada patrón se compila una sola vez en una tabla de
+emisión con la dirección unitaria, el desplazamiento, la velocidad y el retardo de
+cada bala, agrupada en tramos que salen juntos. Al disparar solo se gira la tabla
+con un vector de giro (de direction_table, sin trigonometría) y se encolan sus tramos.
+
+EmisorPatrones saca cada frame los tramos que ya tocan sin superar un presupuesto de
+balas; lo que sobra sale en los frames siguientes, adelantado lo que habría avanzado,
+para que una ráfaga de cientos de balas no se concentre en un solo frame.
+'''
+
+import numpy as np
+
+from src.config import PATRON_BALAS_POR_FRAME
+from src.bullet_engine import LINEAL, ESPIRAL, CARGADA
+from src.game_clock import rng, ms
+from src.direction_table import DIRECCIONES, POR_GRADO, apuntar
+
+TIPOS = {"lineal": LINEAL, "espiral": ESPIRAL, "cargada": CARGADA}
+ANCLAS = {"centro": 0, "abajo": 1}  # Punto del jefe desde el que sale la bala
+
+# Catálogo de patrones ------------------------------------------------------------------------------
+# Ángulos en grados (90 = hacia abajo). Claves de cada forma:
+#   forma: "disparo" (una bala), "anillo" (balas repartidas en 360°) o "abanico" (repartidas en `apertura`)
+#   balas, angulo, apertura, velocidad, tipo ("lineal", "espiral", "cargada"), origen ("centro", "abajo"),
+#   desplazamiento (px en y desde el origen), retardo (frames) y escalonado (frames extra por bala)
+#   oleadas + intervalo: repite la forma cada `intervalo` frames
+# Claves del patrón: capas (lista de formas), girar (rota con el tiempo de juego) y
+# apuntar (el ángulo 90 pasa a apuntar al jugador).
+PATRONES = {
+    "basico": {"forma": "disparo", "velocidad": 5, "origen": "abajo", "desplazamiento": 16},
+    "espiral": {"forma": "anillo", "balas": 8, "tipo": "espiral", "girar": True},
+    "anillo": {"forma": "anillo", "balas": 12, "velocidad": 5},
+    "cargada": {"forma": "disparo", "tipo": "cargada", "velocidad": 2, "origen": "abajo"},
+    "abanico": {"forma": "abanico", "balas": 9, "apertura": 80, "velocidad": 4, "origen": "abajo"},
+    "rafaga_dirigida": {
+        "forma": "abanico", "balas": 3, "apertura": 12, "velocidad": 6, "origen": "abajo",
+        "oleadas": 5, "intervalo": 6, "apuntar": True
+    },
+    "anillo_denso": {"forma": "anillo", "balas": 120, "velocidad": 3},
+    "remolino": {"forma": "anillo", "balas": 72, "velocidad": 3.5, "escalonado": 0.5, "vueltas": 2, "girar": True},
+    "flor": {"capas": [
+        {"forma": "anillo", "balas": 48, "velocidad": 3},
+        {"forma": "anillo", "balas": 48, "velocidad": 2.5, "angulo": 3.75, "retardo": 12},
+        {"forma": "anillo", "balas": 16, "tipo": "espiral", "retardo": 24},
+        {"forma": "disparo", "tipo": "cargada", "velocidad": 2, "origen": "abajo", "retardo": 30}
+    ]},
+    "cortina": {"capas": [
+        {"forma": "abanico", "balas": 36, "apertura": 150, "velocidad": 3, "origen": "abajo"},
+        {"forma": "abanico", "balas": 5, "apertura": 20, "velocidad": 6, "origen": "abajo", "retardo": 20},
+    ], "apuntar": True}
+}
+
+# Patrones que puede elegir el jefe en cada fase (las fases siguientes usan la última lista)
+REPERTORIOS = {
+    1: ("basico", "espiral", "anillo", "cargada"),
+    2: ("basico", "espiral", "anillo", "cargada", "abanico", "rafaga_dirigida"),
+    3: ("espiral", "cargada", "rafaga_dirigida", "anillo_denso", "remolino", "flor", "cortina")
+}
+
+def repertorio(fase):
+    '''
+    Returns:
+        tuple: Nombres de los patrones disponibles para el jefe de `fase`.
+    '''
+    return REPERTORIOS[min(max(fase, 1), max(REPERTORIOS))]
+
+# Compilación -------------------------------------------------------------------------------------
+class Patron:
+    '''
+    Tabla de emisión compilada de un patrón. Las balas están ordenadas por retardo y
+    tipo; cada tramo es un bloque contiguo que sale en el mismo frame con el mismo tipo.
+
+    Atributos:
+        nombre (str): Nombre del patrón.
+        dx, dy (numpy.ndarray): Dirección unitaria de cada bala.
+        desplazamiento (numpy.ndarray): Desplazamiento vertical desde el origen.
+        ancla (numpy.ndarray): Origen de cada bala (ver ANCLAS).
+        velocidad (numpy.ndarray): Velocidad de cada bala.
+        tramos (list): Tuplas (retardo, tipo, inicio, fin).
+        girar (bool): Si la tabla se gira según el tiempo de juego.
+        apuntar (bool): Si la tabla se gira hacia el jugador.
+    '''
+    def __init__(self, nombre, filas, girar=False, apuntar=False):
+        filas.sort(key=lambda fila: (fila[0], fila[1]))
+        self.nombre = nombre
+        self.girar = girar
+        self.apuntar = apuntar
+        retardo, tipo, angulo, velocidad, ancla, desplazamiento = (list(columna) for columna in zip(*filas))
+        radianes = np.radians(np.array(angulo, dtype=np.float64))
+        self.dx = np.cos(radianes).astype(np.float32)
+        self.dy = np.sin(radianes).astype(np.float32)
+        self.velocidad = np.array(velocidad, dtype=np.float32)
+        self.ancla = np.array(ancla, dtype=np.int8)
+        self.desplazamiento = np.array(desplazamiento, dtype=np.float32)
+        self.tramos = []
+        inicio = 0
+        for i in range(1, len(filas) + 1):
+            if i == len(filas) or (retardo[i], tipo[i]) != (retardo[inicio], tipo[inicio]):
+                self.tramos.append((retardo[inicio], tipo[inicio], inicio, i))
+                inicio = i
+
+    def __len__(self):
+        return self.dx.size
+
+def _filas_forma(forma):
+    '''
+    Expande una forma del catálogo en filas (retardo, tipo, ángulo, velocidad, ancla, desplazamiento).
+    '''
+    balas = forma.get("balas", 1)
+    angulo = forma.get("angulo", 90 if forma.get("forma", "disparo") != "anillo" else 0)
+    if forma.get("forma", "disparo") == "anillo":
+        paso = 360 * forma.get("vueltas", 1) / balas
+        angulos = [angulo + paso * i for i in range(balas)]
+    elif forma.get("forma") == "abanico" and balas > 1:
+        apertura = forma.get("apertura", 60)
+        angulos = [angulo - apertura / 2 + apertura * i / (balas - 1) for i in range(balas)]
+    else:
+        angulos = [angulo] * balas
+    tipo = TIPOS[forma.get("tipo", "lineal")]
+    velocidad = forma.get("velocidad", 0 if tipo == ESPIRAL else 5)
+    ancla = ANCLAS[forma.get("origen", "centro")]
+    desplazamiento = forma.get("desplazamiento", 0)
+    filas = []
+    for oleada in range(forma.get("oleadas", 1)):
+        base = forma.get("retardo", 0) + oleada * forma.get("intervalo", 0)
+        for i, a in enumerate(angulos):
+            retardo = int(base + i * forma.get("escalonado", 0))
+            filas.append((retardo, tipo, a, velocidad, ancla, desplazamiento))
+    return filas
+
+def compilar(nombre, definicion):
+    '''
+    Compila la definición de un patrón (ver PATRONES) en su tabla de emisión.
+
+    Returns:
+        Patron: Tabla lista para EmisorPatrones.
+    '''
+    filas = []
+    for forma in definicion.get("capas", [definicion]):
+        filas += _filas_forma(forma)
+    return Patron(nombre, filas, definicion.get("girar", False), definicion.get("apuntar", False))
+
+_compilados = {}
+
+def obtener_patron(nombre):
+    '''
+    Devuelve la tabla compilada de un patrón del catálogo, compilándola la primera vez.
+    '''
+    patron = _compilados.get(nombre)
+    if patron is None:
+        patron = compilar(nombre, PATRONES[nombre])
+        _compilados[nombre] = patron
+    return patron
+
+def patron_anillo(balas):
+    '''
+    Anillo lineal de `balas` balas (compilado una vez por tamaño).
+    '''
+    nombre = f"anillo_{balas}"
+    if nombre not in _compilados:
+        _compilados[nombre] = compilar(nombre, {"forma": "anillo", "balas": balas, "velocidad": 5})
+    return _compilados[nombre]
+
+# Emisión -----------------------------------------------------------------------------------------
+class _Tanda:
+    '''
+    Tramo de una ráfaga pendiente de salir: direcciones ya giradas y, si se quedó a
+    medias por el presupuesto, el origen y el frame en que debía salir.
+    '''
+    __slots__ = ("frame", "tipo", "dx", "dy", "velocidad", "ancla", "desplazamiento", "origen")
+
+    def __init__(self, frame, tipo, dx, dy, velocidad, ancla, desplazamiento, origen=None):
+        self.frame = frame
+        self.tipo = tipo
+        self.dx = dx
+        self.dy = dy
+        self.velocidad = velocidad
+        self.ancla = ancla
+        self.desplazamiento = desplazamiento
+        self.origen = origen
+
+class EmisorPatrones:
+    '''
+    Cola de emisión de las ráfagas de un jefe.
+
+    Atributos:
+        jefe (Boss): Jefe que dispara (origen, sprites y contenedor de balas).
+        presupuesto (int): Balas máximas que salen por frame.
+        frame (int): Frames avanzados.
+        pendientes (list): Tandas que aún no han salido, en orden de salida.
+        emitidas (int): Balas emitidas en total.
+        pico (int): Máximo de balas emitidas en un frame.
+    '''
+    def __init__(self, jefe, presupuesto=PATRON_BALAS_POR_FRAME):
+        self.jefe = jefe
+        self.presupuesto = presupuesto
+        self.frame = 0
+        self.pendientes = []
+        self.emitidas = 0
+        self.pico = 0
+
+    def __len__(self):
+        return sum(tanda.dx.size for tanda in self.pendientes)
+
+    def disparar(self, patron, objetivo=None):
+        '''
+        Gira la tabla del patrón y encola sus tramos; salen a partir del próximo update().
+
+        Args:
+            patron (Patron): Tabla compilada.
+            objetivo (pygame.sprite.Sprite): Sprite al que apuntan los patrones con `apuntar`.
+        '''
+        # Giro como vector (coseno, seno): se componen sin calcular ángulos
+        c, s = 1.0, 0.0
+        if patron.girar:
+            c, s = DIRECCIONES[int(ms()) % 360 * POR_GRADO]
+        if patron.apuntar and objetivo is not None:
+            centro = self.jefe.rect.center
+            ux, uy = apuntar(objetivo.rect.centerx - centro[0], objetivo.rect.centery - centro[1])
+            c, s = c * uy + s * ux, s * uy - c * ux  # Girar además (apuntado - 90°)
+        dx, dy = patron.dx, patron.dy
+        if (c, s) != (1.0, 0.0):
+            c, s = np.float32(c), np.float32(s)
+            dx, dy = dx * c - dy * s, dx * s + dy * c
+        for retardo, tipo, ini, fin in patron.tramos:
+            self.pendientes.append(_Tanda(
+                self.frame + retardo, tipo, dx[ini:fin], dy[ini:fin], patron.velocidad[ini:fin],
+                patron.ancla[ini:fin], patron.desplazamiento[ini:fin]
+            ))
+        self.pendientes.sort(key=lambda tanda: tanda.frame)
+
+    def update(self):
+        '''
+        Avanza un frame y emite las tandas que ya tocan, hasta el presupuesto.
+        '''
+        self.frame += 1
+        restantes = self.presupuesto
+        emitidas = 0
+        while self.pendientes and self.pendientes[0].frame <= self.frame and restantes > 0:
+            tanda = self.pendientes[0]
+            if tanda.dx.size > restantes:
+                parte = _Tanda(tanda.frame, tanda.tipo, tanda.dx[:restantes], tanda.dy[:restantes],
+                               tanda.velocidad[:restantes], tanda.ancla[:restantes], tanda.desplazamiento[:restantes])
+                if tanda.origen is None:
+                    tanda.origen = self._origen()
+                parte.origen = tanda.origen
+                for campo in ("dx", "dy", "velocidad", "ancla", "desplazamiento"):
+                    setattr(tanda, campo, getattr(tanda, campo)[restantes:])
+                tanda = parte
+            else:
+                self.pendientes.pop(0)
+            self._emitir(tanda)
+            restantes -= tanda.dx.size
+            emitidas += tanda.dx.size
+        self.emitidas += emitidas
+        self.pico = max(self.pico, emitidas)
+
+    def vaciar(self):
+        '''
+        Descarta las ráfagas pendientes.
+        '''
+        self.pendientes.clear()
+
+    def _origen(self):
+        rect = self.jefe.rect
+        return rect.centerx, rect.centery, rect.bottom
+
+    def _emitir(self, tanda):
+        '''
+        Crea las balas de una tanda en el contenedor del jefe.
+        '''
+        x, centro_y, abajo_y = tanda.origen or self._origen()
+        y = np.where(tanda.ancla == ANCLAS["abajo"], np.float32(abajo_y), np.float32(centro_y)) + tanda.desplazamiento
+        x = np.full(tanda.dx.size, x, dtype=np.float32)
+        atraso = self.frame - tanda.frame
+        if atraso and tanda.tipo == LINEAL:  # Salió tarde: adelantar lo que habría recorrido
+            x = x + tanda.dx * tanda.velocidad * atraso
+            y = y + tanda.dy * tanda.velocidad * atraso
+
+        jefe = self.jefe
+        cantidad = tanda.dx.size
+        if tanda.tipo == CARGADA:
+            grandes = [rng().choice(jefe.charged_sprites) for _ in range(cantidad)]
+            hijos = [rng().choice(jefe.bullets_sprites) for _ in range(cantidad)]
+        else:
+            sprites = rng().choices(jefe.bullets_sprites, k=cantidad)
+
+        if jefe.motor:
+            if tanda.tipo == CARGADA:
+                for i in range(cantidad):
+                    jefe.bullets.emit_vectores(x[i], y[i], tanda.dx[i], tanda.dy[i], tanda.velocidad[i],
+                                               grandes[i], CARGADA, hijos[i])
+            else:
+                jefe.bullets.emit_vectores(x, y, tanda.dx, tanda.dy, tanda.velocidad, sprites, tanda.tipo)
+            return
+
+        # Backend de sprites: las balas reciben la dirección ya calculada
+        xs, ys = x.tolist(), y.tolist()
+        dxs, dys, velocidades = tanda.dx.tolist(), tanda.dy.tolist(), tanda.velocidad.tolist()
+        for i in range(cantidad):
+            imagen = grandes[i] if tanda.tipo == CARGADA else sprites[i]
+            jefe.crear_bala(tanda.tipo, imagen, (xs[i], ys[i]), (dxs[i], dys[i]), velocidades[i])
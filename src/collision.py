@@ -0,0 +1,253 @@
+# src/collision.py
+
+'''
+Sistema de colisiones con broadphase de hash espacial.
+
+El área de juego se divide en una rejilla uniforme. En cada frame se insertan los
+objetos que pueden ser golpeados (enemigos, jefes, power-ups y balas enemigas) en las
+celdas que ocupan, y cada sonda (balas del jugador y el propio jugador) solo se compara
+con los objetos de sus celdas cuyas capas coinciden con su máscara. El resultado es un
+lote de pares de impacto que luego consume la lógica de daño y puntuación.
+'''
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.bullet_engine import BulletEngine
+
+# Capas de colisión (máscaras de bits)
+CAPA_ENEMIGO = 1
+CAPA_JEFE = 2
+CAPA_POWERUP = 4
+CAPA_BALA_ENEMIGA = 8
+CAPA_BALA_JEFE = 16
+
+# Qué capas comprueba cada sonda
+MASCARA_BALA_JUGADOR = CAPA_ENEMIGO | CAPA_JEFE
+MASCARA_JUGADOR = CAPA_ENEMIGO | CAPA_POWERUP | CAPA_BALA_ENEMIGA | CAPA_BALA_JEFE
+
+TAM_CELDA = 64
+
+class SpatialHash:
+    '''
+    Rejilla uniforme sobre el área de juego.
+
+    Atributos:
+        tam_celda (int): Lado de cada celda en píxeles.
+        columnas (int): Número de columnas de la rejilla.
+        filas (int): Número de filas de la rejilla.
+        celdas (list): Lista plana de celdas; cada una es una lista de (sprite, capa).
+    '''
+    def __init__(self, ancho=SCREEN_WIDTH, alto=SCREEN_HEIGHT, tam_celda=TAM_CELDA):
+        self.tam_celda = tam_celda
+        self.columnas = -(-ancho // tam_celda)
+        self.filas = -(-alto // tam_celda)
+        self.celdas = [[] for _ in range(self.columnas * self.filas)]
+        self.insertados = 0
+
+    def limpiar(self):
+        '''
+        Vacía todas las celdas para el siguiente frame.
+        '''
+        for celda in self.celdas:
+            celda.clear()
+        self.insertados = 0
+
+    def _rango(self, rect):
+        '''
+        Columnas y filas (inclusive) que cubre un rectángulo, recortadas a la rejilla.
+        Los objetos fuera de pantalla quedan en las celdas del borde.
+        '''
+        t = self.tam_celda
+        c0 = min(max(rect.left // t, 0), self.columnas - 1)
+        c1 = min(max((rect.right - 1) // t, 0), self.columnas - 1)
+        f0 = min(max(rect.top // t, 0), self.filas - 1)
+        f1 = min(max((rect.bottom - 1) // t, 0), self.filas - 1)
+        return c0, c1, f0, f1
+
+    def insertar(self, sprite, capa):
+        '''
+        Añade un sprite a todas las celdas que ocupa su rect.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Objeto con atributo rect.
+            capa (int): Capa de colisión del objeto.
+        '''
+        c0, c1, f0, f1 = self._rango(sprite.rect)
+        entrada = (sprite, capa)
+        columnas = self.columnas
+        for f in range(f0, f1 + 1):
+            base = f * columnas
+            for c in range(c0, c1 + 1):
+                self.celdas[base + c].append(entrada)
+        self.insertados += 1
+
+    def consultar(self, rect, mascara):
+        '''
+        Candidatos de las celdas que cubre `rect` cuyas capas están en la máscara.
+
+        Args:
+            rect (pygame.Rect): Rectángulo de la sonda.
+            mascara (int): Capas a comprobar.
+        Returns:
+            list: Pares (sprite, capa) sin duplicados.
+        '''
+        c0, c1, f0, f1 = self._rango(rect)
+        columnas = self.columnas
+        vistos = set()
+        candidatos = []
+        for f in range(f0, f1 + 1):
+            base = f * columnas
+            for c in range(c0, c1 + 1):
+                for entrada in self.celdas[base + c]:
+                    if entrada[1] & mascara and id(entrada[0]) not in vistos:
+                        vistos.add(id(entrada[0]))
+                        candidatos.append(entrada)
+        return candidatos
+
+    def ocupacion(self):
+        '''
+        Returns:
+            tuple: (celdas ocupadas, máximo de objetos en una celda).
+        '''
+        ocupadas = 0
+        maximo = 0
+        for celda in self.celdas:
+            if celda:
+                ocupadas += 1
+                maximo = max(maximo, len(celda))
+        return ocupadas, maximo
+
+class CollisionSystem:
+    '''
+    Detecta en un solo paso todas las colisiones del frame y las devuelve por tipo.
+
+    Atributos:
+        grid (SpatialHash): Broadphase del área de juego.
+        estadisticas (dict): Contadores del último frame (pares candidatos, ocupación...).
+    '''
+    def __init__(self, tam_celda=TAM_CELDA):
+        self.grid = SpatialHash(tam_celda=tam_celda)
+        self.estadisticas = {}
+
+    def _insertar_balas(self, balas, capa):
+        '''
+        Inserta un grupo de balas en la rejilla. El motor vectorizado no se inserta:
+        se comprueba aparte con una sola operación sobre sus arrays.
+        '''
+        if isinstance(balas, BulletEngine):
+            return
+        for bullet in balas:
+            self.grid.insertar(bullet, capa)
+
+    def detectar(self, player, enemies, enemy_bullets, powerups, boss_group, ocupacion=False):
+        '''
+        Calcula los impactos del frame.
+
+        Args:
+            player (Player): Jugador (sus balas están en player.bullets).
+            enemies (pygame.sprite.Group): Enemigos vivos.
+            enemy_bullets (pygame.sprite.Group | BulletEngine): Balas de los enemigos.
+            powerups (pygame.sprite.Group): Power-ups en pantalla.
+            boss_group (pygame.sprite.Group): Jefes activos (sus balas están en boss.bullets).
+            ocupacion (bool): Si se recorre la rejilla para contar celdas ocupadas (solo
+                al perfilar; si no, las estadísticas no incluyen la ocupación).
+        Returns:
+            dict: Impactos por tipo:
+                "balas_vs_enemigos": lista de (bala del jugador, [enemigos]).
+                "balas_vs_jefe": lista de (bala del jugador, jefe).
+                "jugador_vs_enemigos": lista de enemigos.
+                "jugador_vs_powerups": lista de power-ups.
+                "balas_enemigas": lista de (contenedor, impactos) de balas de enemigos que tocan al jugador.
+                "balas_jefe": lista de (contenedor, impactos) de balas de jefes que tocan al jugador.
+        '''
+        grid = self.grid
+        grid.limpiar()
+        for enemy in enemies:
+            grid.insertar(enemy, CAPA_ENEMIGO)
+        for boss in boss_group:
+            grid.insertar(boss, CAPA_JEFE)
+            self._insertar_balas(boss.bullets, CAPA_BALA_JEFE)
+        for powerup in powerups:
+            grid.insertar(powerup, CAPA_POWERUP)
+        self._insertar_balas(enemy_bullets, CAPA_BALA_ENEMIGA)
+
+        candidatos = 0
+        resultado = {
+            "balas_vs_enemigos": [],
+            "balas_vs_jefe": [],
+            "jugador_vs_enemigos": [],
+            "jugador_vs_powerups": [],
+            "balas_enemigas": [],
+            "balas_jefe": []
+        }
+
+        # Balas del jugador vs enemigos y jefes
+        for bullet in player.bullets:
+            rect = bullet.rect
+            golpeados = []
+            for sprite, capa in grid.consultar(rect, MASCARA_BALA_JUGADOR):
+                candidatos += 1
+                if rect.colliderect(sprite.rect):
+                    if capa == CAPA_ENEMIGO:
+                        golpeados.append(sprite)
+                    else:
+                        resultado["balas_vs_jefe"].append((bullet, sprite))
+            if golpeados:
+                resultado["balas_vs_enemigos"].append((bullet, golpeados))
+
+        # Jugador vs enemigos, power-ups y balas en la rejilla
+        rect = player.rect
+        balas_enemigas = []
+        balas_jefe = {}
+        for sprite, capa in grid.consultar(rect, MASCARA_JUGADOR):
+            candidatos += 1
+            if not rect.colliderect(sprite.rect):
+                continue
+            if capa == CAPA_ENEMIGO:
+                resultado["jugador_vs_enemigos"].append(sprite)
+            elif capa == CAPA_POWERUP:
+                resultado["jugador_vs_powerups"].append(sprite)
+            elif capa == CAPA_BALA_ENEMIGA:
+                balas_enemigas.append(sprite)
+            else:
+                balas_jefe.setdefault(sprite.groups()[0], []).append(sprite)
+        if balas_enemigas:
+            resultado["balas_enemigas"].append((enemy_bullets, balas_enemigas))
+        resultado["balas_jefe"].extend(balas_jefe.items())
+
+        # Balas del motor vectorizado: una sola prueba sobre todos sus arrays
+        pruebas_vectorizadas = 0
+        contenedores = [(enemy_bullets, "balas_enemigas")]
+        contenedores += [(boss.bullets, "balas_jefe") for boss in boss_group]
+        for balas, clave in contenedores:
+            if isinstance(balas, BulletEngine) and balas:
+                pruebas_vectorizadas += len(balas)
+                indices = balas.colisiones_rect(rect)
+                if indices.size:
+                    resultado[clave].append((balas, indices))
+
+        self.estadisticas = {
+            "insertados": grid.insertados,
+            "pares_candidatos": candidatos,
+            "pruebas_vectorizadas": pruebas_vectorizadas
+        }
+        if ocupacion:
+            ocupadas, maximo = grid.ocupacion()
+            self.estadisticas.update(celdas_ocupadas=ocupadas, celdas_totales=len(grid.celdas), max_por_celda=maximo)
+        return resultado
+
+def eliminar_impactos(contenedor, impactos):
+    '''
+    Elimina las balas que impactaron, sean sprites o índices del motor vectorizado.
+
+    Args:
+        contenedor (pygame.sprite.Group | BulletEngine): Origen de las balas.
+        impactos (list | numpy.ndarray): Sprites o índices devueltos por detectar().
+    Returns:
+        int: Número de balas eliminadas.
+    '''
+    if isinstance(contenedor, BulletEngine):
+        contenedor.kill(impactos)
+    else:
+        for bullet in impactos:
+            bullet.kill()
+    return len(impactos)
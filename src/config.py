@@ -9,9 +9,36 @@ dimensiones de la pantalla, velocidad del jugador y balas, tipos de potenciadore
 
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 670
-FPS = 60
+FPS = 60  # Ticks de simulación por segundo (paso fijo)
+TICK_MS = 1000 / FPS
+MAX_SUBPASOS = 5  # Ticks máximos por frame dibujado cuando el render se retrasa
+RENDER_FPS = 120  # Límite de frames dibujados por segundo (se interpolan entre ticks)
+
+# Modo de dibujado: "completo" (flip de toda la ventana) o "dirty" (solo zonas modificadas)
+RENDER_MODE = "completo"
+DIRTY_UMBRAL = 0.5  # Fracción de la ventana sucia a partir de la cual se hace flip completo
+DIRTY_SCROLL_FONDO = False  # True: el modo "dirty" usa el renderer completo para mantener el scroll
 
 PLAYER_SPEED = 4
 BULLET_SPEED = -10
 
-POWERUP_TYPES = ["health", "shoot", "speed", "shield", "double_points"]
\ No newline at end of file
+POWERUP_TYPES = ["health", "shoot", "speed", "shield", "double_points"]
+
+# Ordenar cada capa de la cola de dibujo por superficie de origen antes de enviarla
+# (con el blit por software de SDL no compensa el coste de ordenar)
+COLA_ORDENAR_FUENTE = False
+
+# Máximo de proyectiles libres que guarda cada pool de reciclaje
+POOL_MAX_LIBRES = 512
+
+# Balas máximas que emite un jefe por frame; el resto de una ráfaga sale en los siguientes
+PATRON_BALAS_POR_FRAME = 64
+
+# Oleadas de enemigos: apariciones máximas por tick y topes de enemigos y balas enemigas vivos
+# (mientras se superan, el programador de oleadas se detiene)
+OLEADA_APARICIONES_POR_TICK = 2
+MAX_ENEMIGOS_VIVOS = 12
+MAX_BALAS_ENEMIGAS = 400
+
+# Backend de las balas enemigas: "sprites" (un Sprite por bala) o "numpy" (BulletEngine)
+BULLET_BACKEND = "sprites"
@@ -0,0 +1,50 @@
+# src/direction_table.py
+
+'''
+Tabla compartida de direcciones unitarias.
+
+DIRECCIONES guarda el vector (cos, sin) de todos los ángulos a intervalos de
+RESOLUCION grados (0.25° -> 1440 entradas). Los proyectiles reciben su dirección como
+vector ya calculado: los ángulos enteros se indexan directamente con
+DIRECCIONES[grados * POR_GRADO], las direcciones fijas se calculan una vez al cargar
+el módulo que las usa y los disparos dirigidos se normalizan sin pasar por atan2 ni
+por grados. `python -m src.benchmark --micro` compara estos caminos con la
+trigonometría por bala.
+'''
+
+import math
+
+RESOLUCION = 0.25  # Grados entre entradas de la tabla
+POR_GRADO = int(round(1 / RESOLUCION))
+PASOS = 360 * POR_GRADO
+
+DIRECCIONES = [(math.cos(math.radians(i * RESOLUCION)), math.sin(math.radians(i * RESOLUCION))) for i in range(PASOS)]
+
+def indice(angulo):
+    '''
+    Returns:
+        int: Entrada de la tabla más cercana a `angulo` (grados).
+    '''
+    return int(round(angulo * POR_GRADO)) % PASOS
+
+def direccion_grados(angulo):
+    '''
+    Returns:
+        tuple: Vector unitario (dx, dy) del ángulo en grados (redondeado a RESOLUCION).
+    '''
+    return DIRECCIONES[indice(angulo)]
+
+def apuntar(dx, dy):
+    '''
+    Normaliza el vector (dx, dy). Si es nulo devuelve la dirección de 0°.
+
+    Returns:
+        tuple: Vector unitario (dx, dy).
+    '''
+    longitud = math.hypot(dx, dy)
+    if longitud == 0:
+        return 1.0, 0.0
+    return dx / longitud, dy / longitud
+
+# Direcciones de las 8 balas de una explosión (0°, 45°, ..., 315°)
+EXPLOSION = [DIRECCIONES[angulo * POR_GRADO] for angulo in range(0, 360, 45)]
@@ -1,9 +1,16 @@
 import pygame
-import random
 import math
 from src.config import SCREEN_WIDTH
-from src.enemy_bullet import EnemyBullet
-from src.sprite_manager import extraer_sprite
+from src.enemy_bullet import EnemyBullet, sprite_bala_enemiga
+from src.bullet_engine import BulletEngine, LINEAL, MINA
+from src.sprite_manager import obtener_sprite
+from src.game_clock import rng, ms
+from src.direction_table import DIRECCIONES, POR_GRADO, apuntar
+
+# Direcciones fijas de los disparos, calculadas una sola vez
+_ABANICO = [DIRECCIONES[angulo * POR_GRADO] for angulo in (60, 75, 90, 105, 120)]
+_ONDA = [(x_offset, apuntar(x_offset / 50, 1)) for x_offset in range(-80, 81, 40)]  # Menos balas, más separación
+_ABAJO = DIRECCIONES[90 * POR_GRADO]
 
 class Enemy(pygame.sprite.Sprite):
     '''
@@ -19,63 +26,85 @@ class Enemy(pygame.sprite.Sprite):
         shoot_timer (int): Temporizador para controlar el tiempo entre disparos.
         cooldown_disparo (int): Tiempo de recarga entre disparos.
     '''
-    def __init__(self):
+    def __init__(self, enemy_type=None, x=None, movimiento=None):
+        '''
+        Args:
+            enemy_type (str): "normal", "torreta", "tanque" o "rapido". Si es None se elige al azar.
+            x (int): Posición horizontal de entrada. Si es None se elige al azar.
+            movimiento (str): Tipo de movimiento. Si es None se usa el del arquetipo.
+        '''
         super().__init__()
 
         # Posición horizontal aleatoria
-        x = random.randint(20, SCREEN_WIDTH - 20)
-
-        # Cargar los sprites del sheet SOLO una vez
-        if not hasattr(Enemy, "sprites1"):
-            sheet = pygame.image.load("assets/enemy/SpaceShips_Enemy-0001.png").convert_alpha()
-            Enemy.sprites1 = [
-                extraer_sprite(sheet, 32, 9, 48, 54, 1.5),
-                extraer_sprite(sheet, 32, 99, 48, 54, 1.5),
-                extraer_sprite(sheet, 32, 186, 48, 54, 1.5),
-                extraer_sprite(sheet, 91, 17, 46, 35, 1.5),
-                extraer_sprite(sheet, 91, 106, 46, 35, 1.5),
-                extraer_sprite(sheet, 91, 193, 46, 35, 1.5),
-                extraer_sprite(sheet, 149, 24, 32, 20, 1.5),
-                extraer_sprite(sheet, 149, 113, 32, 20, 1.5),
-                extraer_sprite(sheet, 149, 200, 32, 20, 1.5),
-                extraer_sprite(sheet, 198, 27, 21, 18, 2),
-                extraer_sprite(sheet, 198, 115, 21, 18, 2),
-                extraer_sprite(sheet, 198, 202, 21, 18, 2)
-            ]
-            
+        if x is None:
+            x = rng().randint(20, SCREEN_WIDTH - 20)
+
+        Enemy.cargar_sprites()
+
         # Comportamiento aleatorio según tipo
-        enemy_type = random.choice(["normal", "torreta", "tanque", "rapido"])
+        if enemy_type is None:
+            enemy_type = rng().choice(["normal", "torreta", "tanque", "rapido"])
 
         if enemy_type == "torreta":
             self.vida = 30
             self.speed = 0
             self.tipo_movimiento = "vertical"
-            self.tipo_disparo = random.choice(["sine", "abanico"])
-            self.image = random.choice(Enemy.sprites1[0:3] )
+            self.tipo_disparo = rng().choice(["sine", "abanico"])
+            self.image = rng().choice(Enemy.sprites1[0:3] )
         elif enemy_type == "tanque":
             self.vida = 50
             self.speed = 1
             self.tipo_movimiento = "lento"
             self.tipo_disparo = "random"
-            self.image = random.choice(Enemy.sprites1[3:5])
+            self.image = rng().choice(Enemy.sprites1[3:5])
         elif enemy_type == "rapido":
             self.vida = 10
             self.speed = 4
             self.tipo_movimiento = "zigzag"
             self.tipo_disparo = "mine"
-            self.image = random.choice(Enemy.sprites1[5:8])
+            self.image = rng().choice(Enemy.sprites1[5:8])
         else:
             self.vida = 20
             self.speed = 2
-            self.tipo_movimiento = random.choice(["vertical", "zigzag"])
+            self.tipo_movimiento = rng().choice(["vertical", "zigzag"])
             self.tipo_disparo = "directo"
-            self.image = random.choice(Enemy.sprites1[8:12])
+            self.image = rng().choice(Enemy.sprites1[8:12])
+
+        if movimiento is not None:
+            self.tipo_movimiento = movimiento
 
         self.rect = self.image.get_rect(midtop=(x, -30))
         
         # Timers de disparo
-        self.shoot_timer = random.randint(0, 30)
-        self.cooldown_disparo = random.randint(60, 90)
+        self.shoot_timer = rng().randint(0, 30)
+        self.cooldown_disparo = rng().randint(60, 90)
+
+    @classmethod
+    def cargar_sprites(cls):
+        '''
+        Recorta los sprites de los enemigos una sola vez y los comparte desde el registro.
+        Se llama al crear el primer enemigo o antes, durante la precarga.
+
+        Returns:
+            list: Sprites de los cuatro arquetipos (tres variantes de cada uno).
+        '''
+        if not hasattr(cls, "sprites1"):
+            sheet = "assets/enemy/SpaceShips_Enemy-0001.png"
+            cls.sprites1 = [
+                obtener_sprite(sheet, 32, 9, 48, 54, 1.5),
+                obtener_sprite(sheet, 32, 99, 48, 54, 1.5),
+                obtener_sprite(sheet, 32, 186, 48, 54, 1.5),
+                obtener_sprite(sheet, 91, 17, 46, 35, 1.5),
+                obtener_sprite(sheet, 91, 106, 46, 35, 1.5),
+                obtener_sprite(sheet, 91, 193, 46, 35, 1.5),
+                obtener_sprite(sheet, 149, 24, 32, 20, 1.5),
+                obtener_sprite(sheet, 149, 113, 32, 20, 1.5),
+                obtener_sprite(sheet, 149, 200, 32, 20, 1.5),
+                obtener_sprite(sheet, 198, 27, 21, 18, 2),
+                obtener_sprite(sheet, 198, 115, 21, 18, 2),
+                obtener_sprite(sheet, 198, 202, 21, 18, 2)
+            ]
+        return cls.sprites1
 
     def shoot(self, player, group_global):
         '''
@@ -83,22 +112,20 @@ class Enemy(pygame.sprite.Sprite):
         
         Args:
             player (Player): Referencia al jugador para calcular la dirección del disparo.
-            group_global (pygame.sprite.Group): Grupo global donde se añadirán las balas.
+            group_global (pygame.sprite.Group | BulletEngine): Destino de las balas.
         '''
         if self.tipo_disparo == "directo":
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            angle = math.degrees(math.atan2(dy, dx))
-            group_global.add(EnemyBullet(self.rect.centerx, self.rect.bottom, angle, owner=self))
+            distancia = math.hypot(dx, dy) or 1.0  # Vector normalizado, sin pasar por ángulos
+            self.emitir(group_global, self.rect.centerx, self.rect.bottom, [(dx / distancia, dy / distancia)])
 
         elif self.tipo_disparo == "abanico":
-            for offset in [-30, -15, 0, 15, 30]:
-                group_global.add(EnemyBullet(self.rect.centerx, self.rect.bottom, 90 + offset, owner=self))
+            self.emitir(group_global, self.rect.centerx, self.rect.bottom, _ABANICO)
 
         elif self.tipo_disparo == "random":
-            for _ in range(3):
-                angle = random.randint(60, 120)
-                group_global.add(EnemyBullet(self.rect.centerx, self.rect.bottom, angle, owner=self))
+            direcciones = [DIRECCIONES[rng().randint(60, 120) * POR_GRADO] for _ in range(3)]
+            self.emitir(group_global, self.rect.centerx, self.rect.bottom, direcciones)
         
         elif self.tipo_disparo == "sine":
             self.shoot_sine_wave(group_global)
@@ -106,6 +133,28 @@ class Enemy(pygame.sprite.Sprite):
         elif self.tipo_disparo == "mine":
             self.shoot_mines(group_global)
     
+    def emitir(self, group_global, x, y, direcciones, speed=4, is_mine=False):
+        '''
+        Añade balas al grupo global o, si es el motor vectorizado, las emite en bloque.
+
+        Args:
+            group_global (pygame.sprite.Group | BulletEngine): Destino de las balas.
+            x (int | list): Posición horizontal de salida (una o una por bala).
+            y (int): Posición vertical de salida.
+            direcciones (list): Vectores unitarios (dx, dy) de disparo, uno por bala.
+            speed (int): Velocidad de las balas.
+            is_mine (bool): Si son minas en lugar de balas normales.
+        '''
+        if isinstance(group_global, BulletEngine):
+            tipo = MINA if is_mine else LINEAL
+            hijo = sprite_bala_enemiga() if is_mine else None
+            dx, dy = zip(*direcciones)
+            group_global.emit_vectores(x, y, dx, dy, speed, sprite_bala_enemiga(is_mine), tipo, hijo)
+            return
+        xs = x if isinstance(x, list) else [x] * len(direcciones)
+        for bx, direccion in zip(xs, direcciones):
+            group_global.add(EnemyBullet.crear(bx, y, direccion, speed=speed, is_mine=is_mine, owner=self))
+
     def update(self, player, time_factor=1.0, group_global = None):
         '''
         Actualiza la posición del enemigo y maneja el disparo.
@@ -134,13 +183,13 @@ class Enemy(pygame.sprite.Sprite):
 
         elif self.tipo_movimiento == "zigzag":
             self.rect.y += int(self.speed * time_factor)
-            self.rect.x += int(3 * math.sin(pygame.time.get_ticks() / 200))
+            self.rect.x += int(3 * math.sin(ms() / 200))
 
         elif self.tipo_movimiento == "lento":
             self.rect.y += int((self.speed / 2) * time_factor)
 
         elif self.tipo_movimiento == "salto":
-            self.rect.y += int((self.speed + 2 * abs(math.sin(pygame.time.get_ticks() / 300))) * time_factor)
+            self.rect.y += int((self.speed + 2 * abs(math.sin(ms() / 300))) * time_factor)
     
     def hit(self, damage):
         '''
@@ -158,20 +207,13 @@ class Enemy(pygame.sprite.Sprite):
         ''' 
         Dispara balas en una onda sinusoidal.
         Crea balas en posiciones horizontales separadas y las dispara hacia arriba. 
-        Cada bala tiene un ángulo calculado basado en su posición horizontal.
+        Cada bala tiene una dirección precalculada según su posición horizontal (_ONDA).
         
         Args:
-            group_global (pygame.sprite.Group): Grupo global donde se añadirán las balas.
+            group_global (pygame.sprite.Group | BulletEngine): Destino de las balas.
         '''
-        base_y = self.rect.bottom
-        for x_offset in range(-80, 81, 40):  # Menos balas, más separación
-            angle = math.degrees(math.atan2(1, x_offset / 50))
-            group_global.add(EnemyBullet(
-                self.rect.centerx + x_offset,
-                base_y,
-                angle,
-                owner=self
-            ))
+        xs = [self.rect.centerx + x_offset for x_offset, _ in _ONDA]
+        self.emitir(group_global, xs, self.rect.bottom, [direccion for _, direccion in _ONDA])
 
     def shoot_mines(self, group_global):
         '''
@@ -180,15 +222,6 @@ class Enemy(pygame.sprite.Sprite):
         y explotando después de un tiempo.
         
         Args:
-            group_global (pygame.sprite.Group): Grupo global donde se añadirá la mina.
+            group_global (pygame.sprite.Group | BulletEngine): Destino de la mina.
         '''
-        mine = EnemyBullet(
-            self.rect.centerx,
-            self.rect.bottom,
-            90,
-            speed=2,
-            is_mine=True,
-            owner=self
-        )
-        mine.is_mine = True
-        group_global.add(mine)
\ No newline at end of file
+        self.emitir(group_global, self.rect.centerx, self.rect.bottom, [_ABAJO], speed=2, is_mine=True)
\ No newline at end of file
@@ -1,36 +1,47 @@
-import pygame
 import math
-import random
-from src.sprite_manager import extraer_sprite
+from src.pool import PooledSprite
+from src.sprite_manager import obtener_sprite
+from src.game_clock import ms
+from src.direction_table import EXPLOSION
 
-class EnemyBullet(pygame.sprite.Sprite):
+def sprite_bala_enemiga(is_mine=False):
+    '''
+    Devuelve el sprite compartido de una bala enemiga o de una mina.
+
+    Args:
+        is_mine (bool): Si es True devuelve el sprite de la mina.
+    Returns:
+        pygame.Surface: El sprite del registro de recursos.
+    '''
+    if is_mine:
+        return obtener_sprite("assets/bullet/Bullets-0001.png", 16, 79, 17, 22, 1.5)  # Use alternate sprite for mine
+    return obtener_sprite("assets/bullet/Bullets-0001.png", 84, 144, 8, 15, 1.5)  # Bullet sprite
+
+class EnemyBullet(PooledSprite):
     ''' 
     Clase que representa una bala disparada por un enemigo.
     
     Atributos:
         x (int): Posición horizontal de la bala.
         y (int): Posición vertical de la bala.
-        angle_deg (float): Ángulo de disparo en grados.
+        direccion (tuple): Vector unitario (dx, dy) de disparo (ver direction_table).
         speed (int): Velocidad de la bala.
         is_mine (bool): Indica si es una mina o una bala normal.
         owner: Referencia al enemigo que disparó esta bala.
     '''
-    def __init__(self, x, y, angle_deg, speed=4, is_mine=False, owner=None):
+    def __init__(self, x, y, direccion, speed=4, is_mine=False, owner=None):
         super().__init__()
-        self.bullet_sheet = pygame.image.load("assets/bullet/Bullets-0001.png").convert_alpha()
-        bullets_sprites = [
-            extraer_sprite(self.bullet_sheet, 84, 144, 8, 15, 1.5),  # Bullet sprite
-            extraer_sprite(self.bullet_sheet, 16, 79, 17, 22, 1.5),   # Alternate bullet sprite
-        ]
-        if is_mine:
-            self.image = bullets_sprites[1]  # Use alternate sprite for mine
-        else:
-            self.image = bullets_sprites[0]
+        self.reiniciar(x, y, direccion, speed, is_mine, owner)
+
+    def reiniciar(self, x, y, direccion, speed=4, is_mine=False, owner=None):
+        '''
+        Inicializa (o reinicializa, si viene del pool) la posición, la dirección y la velocidad.
+        '''
+        self.image = sprite_bala_enemiga(is_mine)
         self.rect = self.image.get_rect(center=(x, y))
-        self.angle = math.radians(angle_deg)
         self.speed = speed
-        self.vel_x = math.cos(self.angle) * self.speed
-        self.vel_y = math.sin(self.angle) * self.speed
+        self.vel_x = direccion[0] * self.speed
+        self.vel_y = direccion[1] * self.speed
         self.is_mine = is_mine
         self.mine_timer = 0
         self.owner = owner  # Guarda referencia al enemigo que disparó
@@ -47,7 +58,7 @@ class EnemyBullet(pygame.sprite.Sprite):
                 self.kill()
             else:
                 # Flota en el lugar
-                self.rect.y += math.sin(pygame.time.get_ticks() / 500) * 0.5
+                self.rect.y += math.sin(ms() / 500) * 0.5
         else:
             # Comportamiento normal
             self.rect.x += self.vel_x
@@ -67,11 +78,11 @@ class EnemyBullet(pygame.sprite.Sprite):
         Si es una mina, crea 8 balas en ángulos de 45 grados.
         '''
         # Crea 8 balas en todas direcciones al explotar
-        for angle in range(0, 360, 45):
-            new_bullet = EnemyBullet(
+        for direccion in EXPLOSION:
+            new_bullet = EnemyBullet.crear(
                 self.rect.centerx,
                 self.rect.centery,
-                angle,
+                direccion,
                 speed=3,
                 owner=self.owner
             )
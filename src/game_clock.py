@@ -0,0 +1,65 @@
+# src/game_clock.py
+
+'''
+Reloj de juego y generador aleatorio de la simulación.
+
+Las entidades no usan el módulo random global ni pygame.time.get_ticks(): piden los
+números aleatorios a rng() y el tiempo a ms(), que se deriva del contador de ticks.
+Cada GameSession tiene su propio Reloj con semilla y lo activa al avanzar, de modo
+que una partida con la misma semilla y las mismas entradas se repite exactamente.
+'''
+
+import random
+
+from src.config import TICK_MS
+
+class Reloj:
+    '''
+    Generador aleatorio con semilla y contador de ticks de una partida.
+
+    Atributos:
+        semilla (int): Semilla con la que se inició el generador.
+        rng (random.Random): Generador de la partida.
+        tick (int): Ticks simulados desde la última siembra.
+    '''
+    def __init__(self, semilla=None):
+        if semilla is None:
+            semilla = random.SystemRandom().randrange(2 ** 32)
+        self.sembrar(semilla)
+
+    def sembrar(self, semilla):
+        '''
+        Reinicia el generador con `semilla` y el contador de ticks a 0.
+        '''
+        self.semilla = semilla
+        self.rng = random.Random(semilla)
+        self.tick = 0
+
+    def ms(self):
+        '''
+        Returns:
+            float: Tiempo de juego en milisegundos (ticks * TICK_MS).
+        '''
+        return self.tick * TICK_MS
+
+_activo = [Reloj(0)]
+
+def activar(reloj):
+    '''
+    Hace que rng() y ms() usen el reloj de una partida.
+    '''
+    _activo[0] = reloj
+
+def rng():
+    '''
+    Returns:
+        random.Random: Generador de la partida activa.
+    '''
+    return _activo[0].rng
+
+def ms():
+    '''
+    Returns:
+        float: Tiempo de juego de la partida activa en milisegundos.
+    '''
+    return _activo[0].tick * TICK_MS
@@ -0,0 +1,545 @@
+# src/game_session.py
+
+'''
+Núcleo de simulación del juego.
+
+GameSession contiene todo el estado de una partida (jugador, enemigos, balas, jefe,
+puntuación y fase) y lo avanza un tick con step(entradas). No abre ventanas,
+no reproduce sonido ni muestra menús: devuelve una lista de sucesos ("disparo",
+"powerup", "jefe", "fase_completada", "game_over"...) a los que el bucle principal
+reacciona. Así se puede simular sin pantalla y más rápido que en tiempo real.
+
+Todo lo aleatorio sale del generador con semilla de la partida y el tiempo de juego se
+deriva del contador de ticks (ver game_clock), así que la misma semilla con las mismas
+entradas reproduce la partida exactamente.
+'''
+
+import os
+import pygame
+
+from src.player import Player
+from src.boss import Boss
+from src.powerup import PowerUp
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TICK_MS, BULLET_BACKEND
+from src.bullet_engine import BulletEngine
+from src.collision import CollisionSystem, eliminar_impactos
+from src.profiler import FrameProfiler
+from src.game_clock import Reloj, activar
+from src.wave_scheduler import ProgramadorOleadas
+
+def iniciar_headless():
+    '''
+    Inicializa pygame con los drivers "dummy" de vídeo y audio para simular sin
+    ventana. Crea una superficie de pantalla porque los sprites necesitan convert_alpha.
+
+    Returns:
+        pygame.Surface: La superficie de pantalla (no visible).
+    '''
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def vaciar_grupo(grupo):
+    '''
+    Vacía un contenedor con kill() en cada sprite, de modo que los proyectiles vuelven
+    a su pool en lugar de descartarse (Group.empty() no llama a kill()).
+
+    Args:
+        grupo (pygame.sprite.Group | BulletEngine): Contenedor a vaciar.
+    '''
+    if isinstance(grupo, BulletEngine):
+        grupo.empty()
+        return
+    for sprite in list(grupo):
+        sprite.kill()
+
+class Entradas:
+    '''
+    Entradas del jugador en un frame.
+    Se indexa con constantes de pygame como el resultado de pygame.key.get_pressed(),
+    de modo que Player.update() la acepta directamente.
+
+    Atributos:
+        izquierda, derecha, arriba, abajo (bool): Flechas mantenidas.
+        disparar (bool): Z pulsada en este frame.
+        dash (bool): X pulsada en este frame.
+        sobrecarga (bool): C pulsada en este frame.
+    '''
+    def __init__(self, izquierda=False, derecha=False, arriba=False, abajo=False,
+                 disparar=False, dash=False, sobrecarga=False):
+        self.izquierda = izquierda
+        self.derecha = derecha
+        self.arriba = arriba
+        self.abajo = abajo
+        self.disparar = disparar
+        self.dash = dash
+        self.sobrecarga = sobrecarga
+
+    def __getitem__(self, tecla):
+        if tecla == pygame.K_LEFT:
+            return self.izquierda
+        if tecla == pygame.K_RIGHT:
+            return self.derecha
+        if tecla == pygame.K_UP:
+            return self.arriba
+        if tecla == pygame.K_DOWN:
+            return self.abajo
+        return False
+
+    @classmethod
+    def desde_teclado(cls, keys, teclas_pulsadas):
+        '''
+        Construye las entradas a partir del estado del teclado de pygame.
+
+        Args:
+            keys: Resultado de pygame.key.get_pressed().
+            teclas_pulsadas (set): Teclas con evento KEYDOWN en este frame.
+        '''
+        return cls(
+            keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP], keys[pygame.K_DOWN],
+            pygame.K_z in teclas_pulsadas, pygame.K_x in teclas_pulsadas, pygame.K_c in teclas_pulsadas
+        )
+
+class GameSession:
+    '''
+    Estado completo de una partida y su lógica de simulación.
+
+    Atributos:
+        player (Player): Jugador.
+        enemies (pygame.sprite.Group): Enemigos vivos.
+        powerups (pygame.sprite.Group): Power-ups en pantalla.
+        enemy_bullets (pygame.sprite.Group | BulletEngine): Balas de los enemigos.
+        boss_group (pygame.sprite.Group): Jefe activo.
+        boss (Boss): Referencia al jefe activo o None.
+        boss_defeated (bool): Si el jefe de la fase fue derrotado.
+        score_manager (ScoreManager): Puntuación y récord.
+        save_manager (SaveManager): Guardado de fases (None para no guardar).
+        fase_actual (int): Fase en juego.
+        fases_desbloqueadas (list): Fases disponibles.
+        score_boss (int): Puntuación a la que aparece el jefe.
+        mostrar_alerta_boss (bool): Si se está mostrando la alerta previa al jefe.
+        contador_alerta (int): Frames restantes de la alerta.
+        oleadas (ProgramadorOleadas): Apariciones de enemigos de la fase en juego.
+        reloj (Reloj): Generador aleatorio con semilla y contador de ticks.
+        frame (int): Frames simulados (el tick del reloj).
+        inicio_fase (int): Frame en que empezó el intento actual de la fase.
+        game_over (bool): Si el jugador se quedó sin vida.
+        collision_system (CollisionSystem): Detección de colisiones.
+        perfil (FrameProfiler): Temporizadores por fase del frame.
+        anteriores (dict): Posición (esquina superior izquierda) de cada sprite al inicio
+            del último tick, para que el Renderer interpole entre ticks.
+    '''
+    duracion_alerta = 180  # ~3 segundos a 60 FPS
+    base_score_boss = 1000
+
+    def __init__(self, score_manager, save_manager=None, backend=BULLET_BACKEND, perfil=None, semilla=None):
+        self.backend = backend
+        self.reloj = Reloj(semilla)
+        activar(self.reloj)
+        self.perfil = perfil if perfil is not None else FrameProfiler()
+        self.score_manager = score_manager
+        self.save_manager = save_manager
+        self.fase_actual = save_manager.fase_actual if save_manager else 1
+        self.fases_desbloqueadas = save_manager.fases_desbloqueadas if save_manager else [1]
+        self.collision_system = CollisionSystem()
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
+        self.enemies = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.enemy_bullets = self.crear_contenedor_balas()
+        self.boss_group = pygame.sprite.Group()
+        self.boss = None
+        self.boss_defeated = False
+        self.mostrar_alerta_boss = False
+        self.contador_alerta = 0
+        self.score_boss = self.base_score_boss
+        self.oleadas = ProgramadorOleadas(self.fase_actual)
+        self.inicio_fase = 0
+        self.game_over = False
+        self.anteriores = {}
+
+    @property
+    def frame(self):
+        return self.reloj.tick
+
+    @frame.setter
+    def frame(self, valor):
+        self.reloj.tick = valor
+
+    def sembrar(self, semilla=None):
+        '''
+        Reinicia el generador (con `semilla` o con la semilla actual) y el contador de ticks.
+        Se llama al empezar una partida para que pueda grabarse y repetirse.
+        '''
+        self.reloj.sembrar(self.reloj.semilla if semilla is None else semilla)
+        activar(self.reloj)
+
+    def crear_contenedor_balas(self):
+        '''
+        Crea un contenedor de balas según el backend configurado.
+        '''
+        if self.backend == "numpy":
+            return BulletEngine()
+        return pygame.sprite.Group()
+
+    def _limpiar(self):
+        '''
+        Crea un jugador nuevo y vacía enemigos, power-ups y balas.
+        '''
+        vaciar_grupo(self.player.bullets)
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
+        vaciar_grupo(self.enemies)
+        vaciar_grupo(self.powerups)
+        vaciar_grupo(self.enemy_bullets)
+        self.anteriores = {}
+
+    def nueva_partida(self):
+        '''
+        Reinicia la puntuación y el progreso y empieza en la fase 1.
+        '''
+        self.sembrar()
+        self._limpiar()
+        self.score_manager.reset()
+        self.score_manager.save_score()
+        self.fase_actual = 1
+        self.fases_desbloqueadas = [1]
+        if self.save_manager:
+            self.save_manager.fase_actual = self.fase_actual
+            self.save_manager.fases_desbloqueadas = self.fases_desbloqueadas
+            self.save_manager.save()
+        self.iniciar_fase()
+
+    def continuar(self, fase):
+        '''
+        Continúa una partida guardada desde la fase elegida.
+
+        Args:
+            fase (int): Fase seleccionada por el jugador.
+        '''
+        self.fase_actual = fase
+        self.score_manager.load_score()
+        self.sembrar()
+        self._limpiar()
+        self.iniciar_fase()
+
+    def iniciar_fase(self):
+        '''
+        Ajusta la puntuación del jefe a la fase actual y programa sus oleadas.
+        '''
+        self.score_boss = self.base_score_boss * self.fase_actual  # Ajustar el puntaje del jefe según la fase actual
+        self._programar_oleadas()
+
+    def _retirar_jefe(self):
+        '''
+        Quita el jefe y devuelve sus balas a su pool.
+        '''
+        for jefe in self.boss_group:
+            vaciar_grupo(jefe.bullets)
+        self.boss_group.empty()
+
+    def _programar_oleadas(self):
+        '''
+        Compila las oleadas de la fase actual y marca el inicio del intento.
+        '''
+        self.oleadas = ProgramadorOleadas(self.fase_actual)
+        self.inicio_fase = self.frame
+
+    def reiniciar(self):
+        '''
+        Reinicia la partida tras un game over, manteniendo la fase actual.
+        '''
+        self._limpiar()
+        self._retirar_jefe()
+        self.boss = None
+        self.boss_defeated = False
+        self.mostrar_alerta_boss = False
+        self.score_manager.reset()
+        self._programar_oleadas()
+        self.game_over = False
+
+    def guardar_posiciones(self):
+        '''
+        Guarda la posición actual de cada entidad como origen de la interpolación.
+        Basta con llamarlo antes del último tick de cada frame dibujado.
+        '''
+        anteriores = {self.player: self.player.rect.topleft}
+        for grupo in (self.player.bullets, self.powerups, self.enemies, self.boss_group):
+            for sprite in grupo:
+                anteriores[sprite] = sprite.rect.topleft
+        for contenedor in [self.enemy_bullets] + [jefe.bullets for jefe in self.boss_group]:
+            if isinstance(contenedor, BulletEngine):
+                contenedor.guardar_posiciones()
+            else:
+                for sprite in contenedor:
+                    anteriores[sprite] = sprite.rect.topleft
+        self.anteriores = anteriores
+
+    def step(self, entradas):
+        '''
+        Avanza la simulación un tick (TICK_MS): actualización de entidades y colisiones.
+
+        Args:
+            entradas (Entradas): Teclas mantenidas y pulsadas en este frame.
+        Returns:
+            list: Sucesos del frame para sonido, música y menús.
+        '''
+        sucesos = self.actualizar(entradas)
+        self.colisionar(sucesos)
+        return sucesos
+
+    def actualizar(self, entradas):
+        '''
+        Primera mitad de step(): acciones del jugador, apariciones y movimiento de
+        todas las entidades.
+
+        Args:
+            entradas (Entradas): Teclas mantenidas y pulsadas en este frame.
+        Returns:
+            list: Sucesos generados hasta el momento.
+        '''
+        activar(self.reloj)
+        self.frame += 1
+        sucesos = []
+        player = self.player
+        score_manager = self.score_manager
+        time_factor = 0.4 if player.charge_status else 1.0 # Factor de tiempo para la velocidad de enemigos y balas
+
+        # Acciones del jugador ---------------------------------------------------------------
+        if entradas.disparar:
+            player.shoot()
+            sucesos.append("disparo")
+        if entradas.dash:
+            player.dash()
+        if entradas.sobrecarga and player.charge == player.charge_max:
+            player.charge_status = True
+            player.charge = 0  # Reiniciar carga al activar sobrecarga
+
+        # Aparición de enemigos ------------------------------------------------------
+        if self.boss is None and not self.boss_defeated:
+            self.oleadas.update(self.enemies, len(self.enemy_bullets))
+
+        # Actualizar el jugador y sus balas ----------------------------------------------------------
+        player.update(entradas)
+        player.update_bullets()
+        perfil = self.perfil
+        perfil.marca("jugador")
+
+        # Actualizar power-ups, enemigos y sus balas -----------------------------
+        self.powerups.update(time_factor)
+        perfil.marca("powerups")
+        for enemy in self.enemies:
+            enemy.update(player, time_factor, self.enemy_bullets)
+        perfil.marca("enemigos")
+        self.enemy_bullets.update()
+        perfil.marca("balas_enemigas")
+
+        # Generación del jefe ------------------------------------------------
+        if score_manager.score >= self.score_boss and self.boss is None and not self.boss_defeated and not self.mostrar_alerta_boss:
+            self.mostrar_alerta_boss = True
+            self.contador_alerta = self.duracion_alerta
+            sucesos.append("alerta")
+
+        if self.mostrar_alerta_boss:
+            self.contador_alerta -= 1
+            if self.contador_alerta <= 0:
+                self.mostrar_alerta_boss = False
+                self.boss = Boss(BulletEngine() if self.backend == "numpy" else None, self.fase_actual)
+                self.boss_group.add(self.boss)
+                sucesos.append("jefe")
+
+        # Actualizar el jefe y sus balas -------------------------------------
+        self.boss_group.update(time_factor, player)
+        for jefe in self.boss_group:
+            jefe.bullets.update(time_factor)
+        perfil.marca("jefe")
+        return sucesos
+
+    def colisionar(self, sucesos):
+        '''
+        Segunda mitad de step(): colisiones, fin de fase y game over.
+
+        Args:
+            sucesos (list): Lista de sucesos del frame, a la que se añaden los nuevos.
+        '''
+        player = self.player
+        score_manager = self.score_manager
+        self._resolver_colisiones(sucesos)
+        self.perfil.marca("colisiones")
+
+        # Verificar si el jefe ha sido derrotado y desbloquear fase ------------------------
+        if self.boss_defeated and score_manager.score > 0:
+            self._completar_fase()
+            sucesos.append("fase_completada")
+
+        # Verificar si el jugador ha perdido --------------------------------
+        if player.health <= 0:
+            self.game_over = True
+            score_manager.vaciar()
+            self._registrar_intento(completada=False)
+            sucesos.append("game_over")
+
+    def conteos(self):
+        '''
+        Returns:
+            dict: Número de entidades vivas por tipo.
+        '''
+        return {
+            "enemies": len(self.enemies),
+            "enemy_bullets": len(self.enemy_bullets),
+            "boss_bullets": sum(len(boss.bullets) for boss in self.boss_group),
+            "player_bullets": len(self.player.bullets),
+            "powerups": len(self.powerups)
+        }
+
+    def _resolver_colisiones(self, sucesos):
+        '''
+        Detecta las colisiones del frame y aplica daño, puntuación y power-ups.
+        '''
+        player = self.player
+        score_manager = self.score_manager
+        colisiones = self.collision_system.detectar(
+            player, self.enemies, self.enemy_bullets, self.powerups, self.boss_group, ocupacion=self.perfil.activo
+        )
+
+        # Colisiones: balas del jugador vs enemigos ---------------------------
+        for bullet, hits in colisiones["balas_vs_enemigos"]:
+            hits = [enemy for enemy in hits if enemy.alive()]  # Otra bala pudo destruirlo antes
+            if hits:
+                for enemy in hits:
+                    enemy.hit(10)
+                bullet.kill()
+                if player.charge_status:
+                    score_manager.add_points(200)
+                if player.double_points > 0:
+                    score_manager.add_points(100)  # Por cada enemigo destruido
+                else:
+                    score_manager.add_points(50)
+                player.charge = min(player.charge_max, player.charge + 5)  # Incrementar carga al destruir enemigos
+                if self.reloj.rng.random() < 0.1:  # 20% de probabilidad de generar un power-up
+                    powerup = PowerUp(bullet.rect.centerx, bullet.rect.centery)
+                    self.powerups.add(powerup)
+
+        # Colisiones: jugador vs powerups --------------------------------
+        for p in colisiones["jugador_vs_powerups"]:
+            p.kill()
+            sucesos.append("powerup")
+            if p.tipo == "health":
+                player.health = min(player.max_health, player.health + 20)
+            elif p.tipo == "shoot":
+                player.double_shot = FPS * 5  # 5 segundos de disparo doble
+            elif p.tipo == "speed":
+                player.speed_boost = FPS * 3  # 3 segundos
+            elif p.tipo == "overcharge":
+                player.charge = min(player.charge_max, player.charge + 25)
+            elif p.tipo == "shield":
+                player.shield = FPS * 2  # 5 segundos de inmunidad
+            elif p.tipo == "double_points":
+                player.double_points = FPS * 5  # 5 segundos de puntos dobles
+
+        # Colisiones: jugador vs enemigos --------------------------------
+        collisions = [enemy for enemy in colisiones["jugador_vs_enemigos"] if enemy.alive()]
+        if collisions:
+            for enemy in collisions:
+                enemy.kill()
+            if player.dashing:
+                if player.double_points > 0:
+                    score_manager.add_points(200)
+                else:
+                    score_manager.add_points(100)
+                player.charge = min(player.charge_max, player.charge + 10)  # Incrementar carga al parry
+                sucesos.append("parry")
+            else:
+                if player.shield <= 0:
+                    player.health -= 10
+                    score_manager.add_points(-20)  # Penalización por daño
+
+        # Colisiones: balas de enemigos vs jugador -----------------------
+        for contenedor, impactos in colisiones["balas_enemigas"]:
+            for _ in range(eliminar_impactos(contenedor, impactos)):
+                if not player.dashing:
+                    if player.shield <= 0:
+                        player.health -= 10
+                        score_manager.add_points(-10)  # Penalización por daño
+                else:
+                    if player.double_points > 0:
+                        score_manager.add_points(200)
+                    else:
+                        score_manager.add_points(100)
+                    player.charge = min(player.charge_max, player.charge + 10)
+
+        # Fase del jefe ------------------------------------------------
+        if self.boss_group:  # Verificar si hay jefe activo
+            for bullet, jefe in colisiones["balas_vs_jefe"]:
+                if jefe.rect.top >= 50 and bullet.alive():
+                    bullet.kill()
+                    jefe.hit(10)
+                    if player.double_points > 0:
+                        score_manager.add_points(200)
+                    else:
+                        score_manager.add_points(100)
+                    player.charge = min(player.charge_max, player.charge + 5)
+
+            # Colisión balas del jefe vs jugador ------------------------
+            for contenedor, impactos in colisiones["balas_jefe"]:
+                for _ in range(eliminar_impactos(contenedor, impactos)):
+                    if not player.dashing:
+                        if player.shield <= 0:
+                            player.health -= 10
+                            score_manager.add_points(-50)  # Penalización por daño
+                    else:
+                        if player.double_points > 0:
+                            score_manager.add_points(200)
+                        else:
+                            score_manager.add_points(100)
+                        player.charge = min(player.charge_max, player.charge + 10)  # Incrementar carga al parry
+
+            # Verificar si el jefe ha sido derrotado -------------------
+            if not self.boss_group:  # Más pythonico para verificar grupo vacío
+                vaciar_grupo(self.boss.bullets)  # Boss.hit() ya lo sacó del grupo: sus balas vuelven al pool aquí
+                self.boss_defeated = True
+                self.boss = None
+
+    def _completar_fase(self):
+        '''
+        Suma el bonus de fase, desbloquea la siguiente, guarda y resetea el estado de batalla.
+        '''
+        player = self.player
+        self.score_manager.add_points(500)
+        self.score_manager.vaciar()
+        self._registrar_intento(completada=True, guardar=False)
+        if self.fase_actual + 1 not in self.fases_desbloqueadas:
+            self.fases_desbloqueadas.append(self.fase_actual + 1)
+            self.fase_actual += 1
+            if self.save_manager:
+                self.save_manager.fase_actual = self.fase_actual
+                self.save_manager.fases_desbloqueadas = self.fases_desbloqueadas
+        if self.save_manager:
+            self.save_manager.save()
+
+        # Resetear estado de batalla
+        self._retirar_jefe()
+        vaciar_grupo(self.enemies)
+        vaciar_grupo(self.enemy_bullets)
+        vaciar_grupo(self.powerups)
+        vaciar_grupo(player.bullets)
+        player.charge = 0  # Reiniciar carga al completar fase
+        player.charge_status = False  # Reiniciar estado de sobrecarga
+        player.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
+        self.score_boss += self.score_manager.score  # Aumentar el puntaje del jefe para la siguiente fase
+        self._programar_oleadas()
+        self.boss_defeated = False
+
+    def _registrar_intento(self, completada, guardar=True):
+        '''
+        Anota en el guardado el puntaje y la duración del intento de la fase actual.
+
+        Args:
+            completada (bool): Si se derrotó al jefe.
+            guardar (bool): Si se escribe el guardado a continuación.
+        '''
+        if not self.save_manager:
+            return
+        tiempo_ms = (self.frame - self.inicio_fase) * TICK_MS
+        self.save_manager.registrar_fase(self.fase_actual, self.score_manager.score, tiempo_ms, completada)
+        if guardar:
+            self.save_manager.save()
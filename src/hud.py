@@ -0,0 +1,125 @@
+# src/hud.py
+
+'''
+HUD en modo retenido.
+
+HUD guarda una superficie ya compuesta por cada región de la interfaz (vida,
+puntuación, carga e iconos de potenciadores) junto con los valores de los que depende.
+Cada frame compara esos valores con los del jugador y solo recompone las regiones que
+cambiaron; después dibuja todas las regiones con una sola llamada a Surface.blits.
+La disposición sigue saliendo de los métodos draw_* de Player.
+'''
+
+import pygame
+
+REGIONES = ("vida", "carga", "iconos", "puntaje")
+
+class _Recolector:
+    '''
+    Superficie falsa que anota los blits de un método draw_* en lugar de dibujarlos.
+    '''
+    def __init__(self):
+        self.blits = []
+
+    def blit(self, imagen, posicion):
+        self.blits.append((imagen, posicion))
+
+def _componer(dibujar):
+    '''
+    Ejecuta un método de dibujo sobre un recolector y compone sus blits en una superficie.
+
+    Args:
+        dibujar (callable): dibujar(superficie) hace los blits de la región.
+    Returns:
+        tuple: (superficie, (x, y)) de la región, o None si no dibuja nada.
+    '''
+    recolector = _Recolector()
+    dibujar(recolector)
+    if not recolector.blits:
+        return None
+    rects = [imagen.get_rect(topleft=posicion) for imagen, posicion in recolector.blits]
+    area = rects[0].unionall(rects[1:])
+    superficie = pygame.Surface(area.size, pygame.SRCALPHA)
+    superficie.blits(
+        [(imagen, (rect.x - area.x, rect.y - area.y)) for (imagen, _), rect in zip(recolector.blits, rects)],
+        doreturn=False
+    )
+    return superficie, area.topleft
+
+class HUD:
+    '''
+    Compositor del HUD que solo redibuja las regiones cuyo estado cambió.
+
+    Atributos:
+        claves (dict): Valores de los que dependía cada región al componerla.
+        capas (dict): Superficie y posición compuestas de cada región (None si está vacía).
+        frames (int): Veces que se ha dibujado el HUD.
+        reconstrucciones (dict): Veces que se ha recompuesto cada región.
+    '''
+    def __init__(self):
+        self.claves = {}
+        self.capas = {}
+        self.frames = 0
+        self.reconstrucciones = {region: 0 for region in REGIONES}
+
+    def _estado(self, player, score):
+        '''
+        Valores de los que depende cada región.
+        '''
+        return {
+            "vida": (max(0, player.health) // 20, player.max_health // 20),
+            "carga": player.charge == player.charge_max,
+            "iconos": (player.double_shot > 0, player.shield > 0, player.speed_boost > 0,
+                       player.charge_status, player.double_points > 0),
+            "puntaje": max(0, score)
+        }
+
+    def _recomponer(self, region, player, score):
+        if region == "vida":
+            def dibujar(superficie):
+                player.draw_hearts(superficie)
+                player.draw_health_bar(superficie)
+        elif region == "carga":
+            dibujar = player.draw_charge_bar
+        elif region == "iconos":
+            dibujar = player.draw_powerup_icons
+        else:
+            def dibujar(superficie):
+                player.draw_score(superficie, score)
+        self.capas[region] = _componer(dibujar)
+        self.reconstrucciones[region] += 1
+
+    def draw(self, surface, player, score):
+        '''
+        Dibuja el HUD, recomponiendo antes las regiones que cambiaron.
+
+        Args:
+            surface (pygame.Surface): Superficie de destino.
+            player (Player): Jugador cuyo estado muestra el HUD.
+            score (int): Puntuación actual.
+        '''
+        self.frames += 1
+        for region, clave in self._estado(player, score).items():
+            if self.claves.get(region, self) != clave:
+                self.claves[region] = clave
+                self._recomponer(region, player, score)
+
+        player.draw_shield(surface)  # Sigue al jugador: no forma parte de las capas fijas
+        surface.blits([capa for capa in self.capas.values() if capa is not None], doreturn=False)
+
+    def invalidar(self):
+        '''
+        Fuerza a recomponer todas las regiones en el próximo dibujo.
+        '''
+        self.claves.clear()
+
+    def estadisticas(self):
+        '''
+        Returns:
+            dict: Frames dibujados, recomposiciones por región y total.
+        '''
+        return {
+            "frames": self.frames,
+            "reconstrucciones": dict(self.reconstrucciones),
+            "total": sum(self.reconstrucciones.values())
+        }
@@ -1,18 +1,21 @@
+import time
+INICIO = time.perf_counter()  # Referencia del informe de arranque
+
 import pygame
-import random
 import sys
 
-from src.player import Player
-from src.enemy import Enemy
-from src.boss import Boss
-
-from src.powerup import PowerUp
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TICK_MS, MAX_SUBPASOS, RENDER_FPS, RENDER_MODE
 from src.score_manager import ScoreManager
 from src.menu import menu_principal, menu_tutorial, menu_seleccion_fase, menu_pausa, game_over
 from src.save_manager import SaveManager
-from src.music_manager import load_music
-
+from src.music_manager import GestorMusica
+from src.game_session import GameSession, Entradas
+from src.renderer import crear_renderer
+from src.replay import GrabadorEntradas, ULTIMA_PARTIDA
+from src.preloader import Precargador, InformeArranque
+from src.sound_bus import BusSonido
+
+informe = InformeArranque(INICIO, (time.perf_counter() - INICIO) * 1000)  # `--arranque` lo imprime al mostrarse el menú
 pygame.init()
 pygame.mixer.init()
 
@@ -21,51 +24,38 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Galaxy Blast")
 clock = pygame.time.Clock()
 
-fondo = pygame.image.load("assets/bg/Background_Full-0001.png").convert()
-fondo = pygame.transform.scale(fondo, (SCREEN_WIDTH, SCREEN_HEIGHT))
-scroll = 0
+# Precarga: atlas, fondos y sonidos en hilos mientras se anima la pantalla de carga -------------
+precargador = Precargador(informe)
+if not precargador.ejecutar(screen):
+    pygame.quit()
+    sys.exit()
 
 # Inicialización de música y efectos de sonido ---------------------------------------------------
-volume_music = 0.8  # Volumen de la música y efectos de sonido
-menu_music = "assets/music/menu-soundtrack.mp3"
-main_music = "assets/music/main-music-soundtrack.mp3"
-boss_music = "assets/music/boss-soundtrack.mp3"
-
-shoot_sound = pygame.mixer.Sound("assets/sounds/laser-shoot.wav")
-options_sound = pygame.mixer.Sound("assets/sounds/option-change-sound.wav")
-powerup_sound = pygame.mixer.Sound("assets/sounds/powerup-sound.wav")
-lose_sound = pygame.mixer.Sound("assets/sounds/lose.wav")
-victory_sound = pygame.mixer.Sound("assets/sounds/victory.wav")
-warning_sound = pygame.mixer.Sound("assets/sounds/warning.wav")
-volume_sound = 0.4  # Volumen de los efectos de sonido
+musica = GestorMusica(volumen=0.8)  # Comprueba las pistas; la que falte usa su reserva
 
-# Inicialización de objetos y variables ---------------------------------------------------------------
-player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-enemies = pygame.sprite.Group()
-powerups = pygame.sprite.Group()
-enemy_bullets = pygame.sprite.Group()
-boss_group = pygame.sprite.Group()
-score_boss = 1000
+sonidos = BusSonido(precargador.sonidos)  # Canales por categoría, límites de voces y de repetición
+options_sound = sonidos.voz("opciones")
+lose_sound = sonidos.voz("derrota")
 
-# Inicialización del gestor de guardado y puntuación -----------------------------------------------
+# Inicialización de la partida, el guardado y la puntuación -------------------------------------------
 save_manager = SaveManager()
-fase_actual = save_manager.fase_actual
-fases_desbloqueadas = save_manager.fases_desbloqueadas
-
-# Inicialización del jefe y estado del juego ----------------------------------------------------------
-boss = None
-boss_defeated = False
 score_manager = ScoreManager()
-mostrar_alerta_boss = False
-contador_alerta = 0
-duracion_alerta = 180  # ~3 segundos a 60 FPS
+session = GameSession(score_manager, save_manager)
+renderer = crear_renderer(RENDER_MODE)  # "dirty": solo se envían las zonas modificadas
+perfil = session.perfil  # F3: overlay de tiempos por fase, F4: grabar frames a CSV
 
 # Bucle principal del juego ---------------------------------------------------------------------------
 running = True
-load_music(menu_music, bucle=-1, volume=volume_music)  # Cargar música del menú
+musica.reproducir("menu")  # Cargar música del menú
+musica.precargar("principal")
 
 # Mostrar menú principal y manejar la selección de juego ------------------------------------------------
-inicio = menu_principal(screen, options_sound)
+def primer_frame():
+    informe.marcar_primer_frame()
+    if "--arranque" in sys.argv:
+        informe.imprimir()
+
+inicio = menu_principal(screen, options_sound, al_mostrar=primer_frame)
 if inicio == "salir": # Si el usuario elige salir del juego
     running = False
     pygame.quit()
@@ -73,49 +63,34 @@ if inicio == "salir": # Si el usuario elige salir del juego
 else:
     if inicio == "nuevo juego": # Si el usuario elige iniciar un nuevo juego
         # Reiniciar el juego y cargar la fase inicial
-        player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-        enemies.empty()
-        powerups.empty()
-        enemy_bullets.empty()
-        score_manager.reset()
-        score_manager.save_score()
-        fase_actual = 1
-        fases_desbloqueadas = [1]
-        save_manager.fase_actual = fase_actual
-        save_manager.fases_desbloqueadas = fases_desbloqueadas
-        save_manager.save()
+        session.nueva_partida()
         run = menu_tutorial(screen, options_sound) # Mostrar tutorial si se elige una fase nueva
         if not run:
             running = False
     elif inicio == "continuar": # Si el usuario elige continuar un juego guardado
         # Cargar el juego guardado
         save_manager.load()
-        fases_desbloqueadas = save_manager.fases_desbloqueadas
-        fase_elegida = menu_seleccion_fase(screen, fases_desbloqueadas, options_sound)
+        session.fases_desbloqueadas = save_manager.fases_desbloqueadas
+        fase_elegida = menu_seleccion_fase(screen, session.fases_desbloqueadas, options_sound)
         if fase_elegida is not None:
-            fase_actual = fase_elegida
+            session.continuar(fase_elegida)
         else:
             running = False
-        score_manager.load_score()
-        player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-        enemies.empty()
-        powerups.empty()
-        enemy_bullets.empty()
-    load_music(main_music, bucle=-1, volume=volume_music)  # Cargar música principal del juego
-
-score_boss *= fase_actual  # Ajustar el puntaje del jefe según la fase actual
-
-# Evento para generar enemigos cada segundo ----------------------------------------------------------
-SPAWN_EVENT = pygame.USEREVENT + 1
-base_difficulty = 1800  # Dificultad 
-difficulty = max(400, base_difficulty - (fase_actual - 1) * 150)  # Aumentar dificultad con cada fase, mínimo 400ms
-pygame.time.set_timer(SPAWN_EVENT, difficulty)  
+    musica.reproducir("principal")  # Música principal del juego, tras el fundido del menú
 
 # Bucle principal del juego -----------------------------------------------------------------------
+# La simulación avanza en ticks fijos de TICK_MS; el dibujado va a su ritmo e interpola
+# entre los dos últimos ticks. Si el render se retrasa se recuperan como mucho
+# MAX_SUBPASOS ticks por frame y el resto se descarta (el juego se ralentiza en vez de
+# entrar en una espiral de recuperación).
+grabador = GrabadorEntradas(session)  # Semilla y entradas por tick: se guarda al salir
+acumulado = 0.0
+teclas_pulsadas = set()  # Pulsaciones pendientes de entregar al próximo tick
+clock.tick()
 while running:
-    clock.tick(FPS) # Controlar la velocidad de fotogramas
-    time_factor = 0.4 if player.charge_status else 1.0 # Factor de tiempo para la velocidad de enemigos y balas
-    
+    dt = clock.tick(RENDER_FPS) # Controlar la velocidad de fotogramas
+    perfil.iniciar_frame()
+
     keys = pygame.key.get_pressed() # Obtener las teclas presionadas
 
     # Manejo de eventos del juego ---------------------------------------------------------------
@@ -123,263 +98,95 @@ while running:
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_z:
-                player.shoot()
-                shoot_sound.play()
-                shoot_sound.set_volume(volume_sound)  # Ajustar volumen del sonido de disparo
-            elif event.key == pygame.K_x:
-                player.dash()
-            elif event.key == pygame.K_c and player.charge == player.charge_max:
-                player.charge_status = True
-                player.charge = 0  # Reiniciar carga al activar sobrecarga
+            teclas_pulsadas.add(event.key)
+            if event.key == pygame.K_F3:
+                perfil.alternar_overlay()
+            elif event.key == pygame.K_F4:
+                perfil.alternar_exportacion(time.strftime("perfil_%Y%m%d_%H%M%S.csv"))
             elif event.key == pygame.K_ESCAPE:  # Pausar con tecla P
                 pygame.mixer.music.pause()  # Pausar música
                 resultado = menu_pausa(screen, options_sound)
                 pygame.mixer.music.unpause()  # Reanudar música
+                clock.tick()  # El tiempo en pausa no cuenta para la simulación
+                renderer.invalidar()  # El menú tapó la partida
                 if resultado == "salir":
                     running = False
                 elif resultado == "configuración":
                     pass
-        if event.type == SPAWN_EVENT and boss is None and not boss_defeated:
-            enemies.add(Enemy())
-        
-    # Actualizar el jugador y sus balas ----------------------------------------------------------
-    player.update(keys)
-    player.update_bullets()
-
-    # Colisiones: balas del jugador vs enemigos ---------------------------
-    for bullet in player.bullets:
-        hits = pygame.sprite.spritecollide(bullet, enemies, False) # Colisión con enemigos
-        
-        if hits:
-            for enemy in hits:
-                enemy.hit(10)
-            bullet.kill()
-            if player.charge_status:
-                score_manager.add_points(200)
-            if player.double_points > 0:
-                score_manager.add_points(100)  # Por cada enemigo destruido
-            else:
-                score_manager.add_points(50)
-            player.charge = min(player.charge_max, player.charge + 5)  # Incrementar carga al destruir enemigos
-            if random.random() < 0.1:  # 20% de probabilidad de generar un power-up
-                powerup = PowerUp(bullet.rect.centerx, bullet.rect.centery)
-                powerups.add(powerup)
 
-    # Actualizar power-ups ---------------------------------------------------
-    powerups.update(time_factor)
-    
-    # Colisiones: jugador vs powerups --------------------------------
-    colision_powerups = pygame.sprite.spritecollide(player, powerups, True)
-    for p in colision_powerups:
-        powerup_sound.play()
-        powerup_sound.set_volume(volume_sound)
-        if p.tipo == "health":
-            player.health = min(player.max_health, player.health + 20)
-        elif p.tipo == "shoot":
-            player.double_shot = FPS * 5  # 5 segundos de disparo doble
-        elif p.tipo == "speed":
-            player.speed_boost = FPS * 3  # 3 segundos
-        elif p.tipo == "overcharge":
-            player.charge = min(player.charge_max, player.charge + 25)
-        elif p.tipo == "shield":
-            player.shield = FPS * 2  # 5 segundos de inmunidad
-        elif p.tipo == "double_points":
-            player.double_points = FPS * 5  # 5 segundos de puntos dobles
-
-    # Actualizar enemigos y sus balas --------------------------------
-    for enemy in enemies:
-        enemy.update(player, time_factor, enemy_bullets)
-    
-    # Colisiones: jugador vs enemigos --------------------------------
-    collisions = pygame.sprite.spritecollide(player, enemies, True)
-    if collisions:
-        if player.dashing:
-            if player.double_points > 0:
-                score_manager.add_points(200)
-            else:
-                score_manager.add_points(100)
-            player.charge = min(player.charge_max, player.charge + 10)  # Incrementar carga al parry
+    musica.update()  # Arranca la pista pendiente al acabar el fundido
+    perfil.marca("eventos")
+
+    # Simulación a paso fijo -------------------------------------------------------------------
+    acumulado = min(acumulado + dt, TICK_MS * MAX_SUBPASOS)
+    pasos = int(acumulado // TICK_MS)
+    sucesos = []
+    for paso in range(pasos):
+        if paso == pasos - 1:
+            session.guardar_posiciones()  # Origen de la interpolación del dibujado
+        entradas = Entradas.desde_teclado(keys, teclas_pulsadas)
+        grabador.registrar(entradas)
+        sucesos += session.step(entradas)
+        teclas_pulsadas.clear()  # Cada pulsación se aplica en un único tick
+        acumulado -= TICK_MS
+        if session.game_over or "fase_completada" in sucesos:
+            acumulado = 0.0
+            break
+
+    for suceso in sucesos:
+        if suceso in ("disparo", "powerup", "alerta"):
+            sonidos.reproducir(suceso)  # La alerta suena una vez, al empezar
+            if suceso == "alerta":
+                musica.precargar("jefe")  # Se lee durante la cuenta atrás
+        elif suceso == "parry":
             print("¡Parry exitoso!")
-        else:
-            if player.shield <= 0:
-                player.health -= 10
-                score_manager.add_points(-20)  # Penalización por daño
-    
-    # Colisiones: balas de enemigos vs jugador -----------------------
-    enemy_bullets.update()
-    
-    for bullet in enemy_bullets:
-        if player.rect.colliderect(bullet.rect):
-            if not player.dashing:
-                if player.shield <= 0:
-                    player.health -= 10
-                    score_manager.add_points(-10)  # Penalización por daño
-            else:
-                if player.double_points > 0:
-                    score_manager.add_points(200)
-                else:
-                    score_manager.add_points(100)
-                player.charge = min(player.charge_max, player.charge + 10)
-            bullet.kill()
-    
-    # Generación del jefe ------------------------------------------------
-    if score_manager.score >= score_boss and boss is None and not boss_defeated and not mostrar_alerta_boss:
-        mostrar_alerta_boss = True
-        contador_alerta = duracion_alerta
-
-    if mostrar_alerta_boss:
-        contador_alerta -= 1
-        if contador_alerta <= 0:
-            load_music(boss_music, bucle=-1, volume=volume_music)  # Cambiar música al jefe
-            mostrar_alerta_boss = False
-            boss = Boss()
-            boss_group.add(boss)
-
-    
-    # Fase del jefe ------------------------------------------------
-    if boss_group:  # Verificar si hay jefe activo
-        boss_group.update(time_factor)
-        boss_group.draw(screen)  # Dibujar todo el grupo
-
-        for boss in boss_group:  # Iterar por si hay múltiples jefes (opcional)
-            for bullet in player.bullets.copy():
-                if boss.rect.top >= 50 and boss.rect.colliderect(bullet.rect):
-                    bullet.kill()
-                    boss.hit(10)
-                    if player.double_points > 0:
-                        score_manager.add_points(200)
-                    else:
-                        score_manager.add_points(100)
-                    player.charge = min(player.charge_max, player.charge + 5)
-
-        # Colisión balas del jefe vs jugador ------------------------
-        for boss in boss_group:
-            boss.bullets.update(time_factor)
-            for bullet in boss.bullets:
-                if player.rect.colliderect(bullet.rect):
-                        if not player.dashing:
-                            if player.shield <= 0:
-                                player.health -= 10
-                                score_manager.add_points(-50)  # Penalización por daño
-                        else:
-                            if player.double_points > 0:
-                                score_manager.add_points(200)
-                            else:
-                                score_manager.add_points(100)
-                            player.charge = min(player.charge_max, player.charge + 10)  # Incrementar carga al parry
-                        bullet.kill()
+        elif suceso == "jefe":
+            musica.reproducir("jefe")  # Cambiar música al jefe
 
-        # Verificar si el jefe ha sido derrotado -------------------
-        if not boss_group:  # Más pythonico para verificar grupo vacío
-            boss_defeated = True
-            boss = None
-            
     # Dibujar todo en la pantalla ---------------------------------------------------------------
-    if not player.charge_status:
-        scroll += 6  # velocidad del fondo (ajustable)
-    else:
-        scroll += 3
-    if scroll >= SCREEN_HEIGHT:
-        scroll = 0
+    renderer.draw(screen, session, acumulado / TICK_MS)
+    perfil.marca("dibujo")
 
-    screen.blit(fondo, (0, scroll - SCREEN_HEIGHT))
-    screen.blit(fondo, (0, scroll))
+    # Fase completada: mostrar mensajes y volver a la música principal ------------------------
+    if "fase_completada" in sucesos:
+        sonidos.reproducir("victoria")
+        renderer.draw_fase_completada(screen, session.fase_actual)
+        musica.reproducir("principal")  # Volver a la música principal
+        clock.tick()
+        renderer.invalidar()
 
-
-    # Dibujar objetos del juego ------------------------------------------------
-    player.draw(screen)
-    powerups.draw(screen)
-    player.bullets.draw(screen)
-    enemies.draw(screen)
-    if boss:
-        boss.draw(screen)
-    enemy_bullets.draw(screen)
-    
-    # Dibujar HUD y puntuación ------------------------------------------------
-    player.draw_hearts(screen)
-    player.draw_health_bar(screen)
-    player.draw_charge_bar(screen)
-    player.draw_powerup_icons(screen)
-    player.draw_score(screen, score_manager.score)
-
-    # Mostrar alerta de jefe si corresponde --------------------------------
-    if mostrar_alerta_boss:
-        warning_sound.play()
-        warning_sound.set_volume(volume_sound)  # Ajustar volumen del sonido de alerta
-        alerta_font = pygame.font.Font("assets/fonts/airstrike.ttf", 30)
-        alerta_text = alerta_font.render("¡ALERTA!", True, (255, 100, 50))
-        screen.blit(alerta_text, (int(SCREEN_WIDTH * 0.35), int(SCREEN_HEIGHT * 0.5)))
-    
-    # Verificar si el jefe ha sido derrotado y desbloquear fase ------------------------
-    if boss_defeated and score_manager.score > 0:
-        score_manager.add_points(500)
-        victory_sound.play()
-        victory_sound.set_volume(volume_sound)  # Ajustar volumen del sonido de victoria
-        if fase_actual + 1 not in fases_desbloqueadas:
-            fases_desbloqueadas.append(fase_actual + 1)
-            fase_actual += 1
-            save_manager.fase_actual = fase_actual
-            save_manager.fases_desbloqueadas = fases_desbloqueadas
-            save_manager.save()
-        
-        # Resetear estado de batalla
-        boss_group.empty()  
-        enemies.empty()
-        enemy_bullets.empty()
-        powerups.empty()
-        player.bullets.empty()
-        player.charge = 0  # Reiniciar carga al completar fase
-        player.charge_status = False  # Reiniciar estado de sobrecarga
-        pygame.time.set_timer(SPAWN_EVENT, 0)  # Desactivar generación de enemigos
-        
-        # Mostrar mensaje de fase completada
-        font = pygame.font.Font("assets/fonts/airstrike.ttf", 30)
-        texto = font.render("¡Fase Completada!", True, (0, 255, 0))
-        screen.blit(texto, (100, 300))
-        pygame.display.flip()
-        pygame.time.delay(2000)
-        screen.fill((0, 0, 0))  # Limpiar pantalla
-        player.charge_status = False  # Reiniciar estado de sobrecarga
-        player.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-        texto_fase = font.render(f"Fase {fase_actual} Comienza", True, (255, 255, 0))
-        screen.blit(texto_fase, (SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT // 2 - 20))
-        pygame.display.flip()
-        pygame.time.delay(2000)
-        score_boss += score_manager.score  # Aumentar el puntaje del jefe para la siguiente fase
-        difficulty = max(400, base_difficulty - (fase_actual - 1) * 150)  # Aumentar dificultad con cada fase, mínimo 400ms
-        pygame.time.set_timer(SPAWN_EVENT, difficulty)  # Reiniciar temporizador de generación de enemigos
-        boss_defeated = False
-        load_music(main_music, bucle=-1, volume=volume_music)  # Volver a la música principal
-    
     # Verificar si el jugador ha perdido --------------------------------
-    if player.health <= 0:
+    if session.game_over:
         resultado = game_over(screen, score_manager, lose_sound)
         if resultado:
             # Reiniciar juego
-            player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-            enemies.empty()
-            enemy_bullets.empty()
-            powerups.empty()
-            if boss:
-                boss_group.empty()
-            boss = None
-            boss_defeated = False
-            if mostrar_alerta_boss:
-                mostrar_alerta_boss = False
-            score_manager.reset()
-            player.charge = 0
-            player.charge_status = False
-            player.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-            # Evitar duplicados
-            pygame.time.set_timer(SPAWN_EVENT, 0)  # Desactivarlo primero
-            pygame.time.set_timer(SPAWN_EVENT, difficulty)  # Activarlo de nuevo
-            load_music(main_music, bucle=-1, volume=volume_music)  # Volver a la música principal
-
+            session.reiniciar()
+            musica.reproducir("principal")  # Volver a la música principal
         else:
             running = False
-
-    pygame.display.flip()
-
+        clock.tick()
+        renderer.invalidar()
+
+    zona_overlay = perfil.dibujar_overlay(screen)
+    if zona_overlay:
+        renderer.invalidar(zona_overlay)
+    perfil.marca("overlay")
+    renderer.presentar()
+    perfil.marca("flip")
+    if perfil.activo:
+        cola = renderer.cola.estadisticas()
+        voces = sonidos.estadisticas()
+        perfil.terminar_frame({
+            **session.conteos(), **session.collision_system.estadisticas,
+            "pixeles_pct": int(renderer.porcentaje_pixeles),
+            "envios_dibujo": cola["envios"], "vaciados_dibujo": cola["vaciados"],
+            "voces_descartadas": voces["descartadas"], "voces_robadas": voces["robadas"]
+        })
+
+perfil.detener_exportacion()
+if len(grabador.repeticion):
+    grabador.guardar(ULTIMA_PARTIDA, session)  # Reproducible con: python -m src.replay
+score_manager.cerrar()  # Escribir el récord pendiente antes de salir
+musica.cerrar()
 pygame.quit()
 sys.exit()
@@ -1,68 +1,229 @@
+# src/menu.py
+
+'''
+Menús del juego.
+
+Cada menú es una PantallaMenu retenida: el fondo compartido y los textos fijos se
+componen una sola vez en una superficie base, y las opciones se renderizan de antemano
+en su estado normal y seleccionado. El bucle se bloquea en pygame.event.wait en lugar
+de girar sin límite, y solo redibuja cuando algo cambia: al mover la selección se
+restauran y envían únicamente los rectángulos de las dos opciones afectadas. Así un
+menú abierto (p. ej. la pausa) no ocupa un núcleo entero.
+
+El menú de pausa usa como fondo una copia oscurecida del último frame de la partida.
+'''
+
 import pygame
 
+from src.text_manager import renderizar
+from src.sprite_manager import obtener_escalado
+
+FUENTE_MENU = "assets/fonts/Orbitron-VariableFont_wght.ttf"
+FONDO_MENU = "assets/bg/menu_main.png"
+
+ESPERA_MS = 500  # Espera máxima de pygame.event.wait antes de volver a comprobar el menú
+OSCURECER_PAUSA = (110, 110, 110)  # Multiplicador RGB del frame de la partida bajo la pausa
+
+BLANCO = (255, 255, 255)
+VERDE = (0, 255, 0)
+AMARILLO = (255, 255, 0)
+
+_SEGUIR = object()  # La tecla no cierra el menú
 
+def fondo_menu(screen):
+    '''
+    Returns:
+        pygame.Surface: Fondo de los menús escalado a la pantalla (compartido, no modificar).
+    '''
+    return obtener_escalado(FONDO_MENU, screen.get_size(), alpha=False)
+
+def texto(tamaño, contenido, color, posicion):
+    '''
+    Returns:
+        tuple: Par (superficie, posición) de un texto fijo del menú.
+    '''
+    return renderizar(FUENTE_MENU, tamaño, contenido, color), posicion
 
-def menu_principal(screen, options_sound):
+# Pantallas ---------------------------------------------------------------------------------------
+class PantallaMenu:
+    '''
+    Pantalla de menú retenida: fondo y textos fijos, y un resultado por tecla.
+
+    Atributos:
+        screen (pygame.Surface): Ventana del juego.
+        base (pygame.Surface): Fondo con los textos fijos ya dibujados.
+        sonido (pygame.mixer.Sound | BusSonido.voz): Sonido de cada pulsación (o None).
+        teclas (dict): Resultado que devuelve el menú al pulsar cada tecla.
+        cualquier_tecla (object): Resultado para el resto de teclas (_SEGUIR para ninguno).
+        al_cerrar (object): Resultado si se cierra la ventana.
+        redibujados (int): Frames enviados a la pantalla.
+    '''
+    def __init__(self, screen, textos=(), fondo=None, sonido=None, teclas=None, cualquier_tecla=_SEGUIR, al_cerrar=None):
+        self.screen = screen
+        self.base = (fondo if fondo is not None else fondo_menu(screen)).copy()
+        self.base.blits(list(textos), doreturn=False)
+        self.sonido = sonido
+        self.teclas = teclas or {}
+        self.cualquier_tecla = cualquier_tecla
+        self.al_cerrar = al_cerrar
+        self.redibujados = 0
+
+    def tecla(self, key):
+        '''
+        Atiende una pulsación.
+
+        Returns:
+            object: Resultado con el que se cierra el menú, o _SEGUIR.
+        '''
+        if self.sonido is not None:
+            self.sonido.play()
+        return self.teclas.get(key, self.cualquier_tecla)
+
+    def dibujar(self):
+        '''
+        Dibuja la pantalla completa.
+        '''
+        self.screen.blit(self.base, (0, 0))
+
+    def zonas_cambiadas(self):
+        '''
+        Redibuja lo que cambió desde el último frame.
+
+        Returns:
+            list: Rectángulos a enviar a la pantalla.
+        '''
+        return []
+
+    def ejecutar(self, al_mostrar=None):
+        '''
+        Muestra el menú hasta que una tecla o el cierre de la ventana lo terminan.
+
+        Args:
+            al_mostrar (callable): Función sin argumentos que se llama tras enviar el primer frame.
+        Returns:
+            object: Resultado de la tecla pulsada o `al_cerrar`.
+        '''
+        self.dibujar()
+        pygame.display.flip()
+        self.redibujados += 1
+        if al_mostrar is not None:
+            al_mostrar()
+        while True:
+            completo = False
+            for event in [pygame.event.wait(ESPERA_MS)] + pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return self.al_cerrar
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    completo = True
+                elif event.type == pygame.KEYDOWN:
+                    resultado = self.tecla(event.key)
+                    if resultado is not _SEGUIR:
+                        return resultado
+            if completo:
+                self.dibujar()
+                pygame.display.flip()
+                self.redibujados += 1
+            else:
+                zonas = self.zonas_cambiadas()
+                if zonas:
+                    pygame.display.update(zonas)
+                    self.redibujados += 1
+
+class MenuOpciones(PantallaMenu):
+    '''
+    Menú con una lista vertical de opciones que se recorre con las flechas y se elige con enter.
+
+    Atributos:
+        valores (list): Resultado de cada opción.
+        etiquetas (list): Por opción, superficies (normal, seleccionada) pre-renderizadas.
+        rects (list): Zona de pantalla de cada opción.
+        seleccion (int): Opción seleccionada.
+    '''
+    def __init__(self, screen, opciones, origen, paso, tamaño=28, color_seleccion=VERDE, **kwargs):
+        '''
+        Args:
+            opciones (list): Pares (texto, resultado).
+            origen (tuple): Posición de la primera opción.
+            paso (int): Separación vertical entre opciones.
+            tamaño (int): Tamaño de la fuente de las opciones.
+            color_seleccion (tuple): Color de la opción seleccionada.
+            **kwargs: Argumentos de PantallaMenu.
+        '''
+        super().__init__(screen, **kwargs)
+        self.valores = [valor for _, valor in opciones]
+        self.etiquetas = [
+            (renderizar(FUENTE_MENU, tamaño, nombre, BLANCO), renderizar(FUENTE_MENU, tamaño, nombre, color_seleccion))
+            for nombre, _ in opciones
+        ]
+        self.rects = [
+            normal.get_rect(topleft=(origen[0], origen[1] + i * paso)).union(seleccionada.get_rect(topleft=(origen[0], origen[1] + i * paso)))
+            for i, (normal, seleccionada) in enumerate(self.etiquetas)
+        ]
+        self.seleccion = 0
+        self._cambiadas = set()
+
+    def tecla(self, key):
+        if self.sonido is not None:
+            self.sonido.play()
+        if key in (pygame.K_UP, pygame.K_DOWN):
+            anterior = self.seleccion
+            self.seleccion = (self.seleccion + (1 if key == pygame.K_DOWN else -1)) % len(self.valores)
+            self._cambiadas.update((anterior, self.seleccion))
+        elif key == pygame.K_RETURN:
+            return self.valores[self.seleccion]
+        return self.teclas.get(key, _SEGUIR)
+
+    def _dibujar_opcion(self, i):
+        rect = self.rects[i]
+        self.screen.blit(self.base, rect, rect)
+        self.screen.blit(self.etiquetas[i][i == self.seleccion], rect)
+        return rect
+
+    def dibujar(self):
+        super().dibujar()
+        for i in range(len(self.valores)):
+            self._dibujar_opcion(i)
+        self._cambiadas.clear()
+
+    def zonas_cambiadas(self):
+        zonas = [self._dibujar_opcion(i) for i in sorted(self._cambiadas)]
+        self._cambiadas.clear()
+        return zonas
+
+# Menús del juego ---------------------------------------------------------------------------------
+def menu_principal(screen, options_sound, al_mostrar=None):
     '''
     Muestra el menú principal del juego.
     Permite al jugador seleccionar entre "Nuevo Juego", "Continuar" o "Salir".
-    
+
     Args:
         screen (pygame.Surface): La superficie donde se dibuja el menú.
-        options_sound (pygame.mixer.Sound): Sonido que se reproduce al seleccionar una opción.
+        options_sound (pygame.mixer.Sound | BusSonido.voz): Sonido que se reproduce al seleccionar una opción.
+        al_mostrar (callable): Función sin argumentos que se llama tras enviar el primer frame.
     Returns:
         str: La opción seleccionada por el jugador ("nuevo juego", "continuar" o "salir").
         '''
-    font_tittle = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 42)
-    font = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 32)
     opciones = ["Nuevo Juego", "Continuar", "Salir"]
-    seleccion = 0
-
-    fondo = pygame.image.load("assets/bg/menu_main.png").convert()
-    fondo = pygame.transform.scale(fondo, screen.get_size())
-    
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "salir"
-            if event.type == pygame.KEYDOWN:
-                options_sound.play()
-                if event.key == pygame.K_UP:
-                    seleccion = (seleccion - 1) % len(opciones)
-                elif event.key == pygame.K_DOWN:
-                    seleccion = (seleccion + 1) % len(opciones)
-                elif event.key == pygame.K_RETURN:
-                    return opciones[seleccion].lower()
-
-        screen.blit(fondo, (0,0))
-        
-        titulo = font_tittle.render("Galaxy Blast", True, (255, 255, 0))
-        screen.blit(titulo, (120, 220))
-
-        for i, opcion in enumerate(opciones):
-            color = (255, 255, 255) if i != seleccion else (0, 255, 0)
-            texto = font.render(opcion, True, color)
-            screen.blit(texto, (150, 280 + i * 50))
-
-        pygame.display.flip()
+    menu = MenuOpciones(
+        screen, [(opcion, opcion.lower()) for opcion in opciones], (150, 280), 50, 32,
+        textos=[texto(42, "Galaxy Blast", AMARILLO, (120, 220))],
+        sonido=options_sound, al_cerrar="salir"
+    )
+    return menu.ejecutar(al_mostrar)
 
 def menu_tutorial(screen, options_sound):
-    ''' 
+    '''
     Muestra el menú de tutorial del juego.
     Permite al jugador ver las instrucciones de control del juego.
-    
+
     Args:
         screen (pygame.Surface): La superficie donde se dibuja el menú.
-        options_sound (pygame.mixer.Sound): Sonido que se reproduce al seleccionar una opción.
+        options_sound (pygame.mixer.Sound | BusSonido.voz): Sonido que se reproduce al seleccionar una opción.
     Returns:
         bool: True si el jugador decide continuar, False si cierra el menú.
     '''
     pygame.mixer.pause()
-    
-    fondo = pygame.image.load("assets/bg/menu_main.png").convert()
-    fondo = pygame.transform.scale(fondo, screen.get_size())
-    
-    font = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 24)
+
     instrucciones = [
         "Controles:",
         "Flechas: Moverse.",
@@ -73,140 +234,75 @@ def menu_tutorial(screen, options_sound):
         "Presione cualquier tecla",
         "para continuar"
     ]
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                options_sound.play()
-                return True
-
-        screen.blit(fondo, (0, 0))
-        for i, linea in enumerate(instrucciones):
-            texto = font.render(linea, True, (255, 255, 255))
-            screen.blit(texto, (50, 100 + i * 30))
-
-        pygame.display.flip()
+    menu = PantallaMenu(
+        screen, [texto(24, linea, BLANCO, (50, 100 + i * 30)) for i, linea in enumerate(instrucciones)],
+        sonido=options_sound, cualquier_tecla=True, al_cerrar=False
+    )
+    return menu.ejecutar()
 
 def menu_seleccion_fase(screen, fases_desbloqueadas, options_sound):
     '''
     Muestra el menú de selección de fase.
     Permite al jugador seleccionar una fase desbloqueada para jugar.
-    
+
     Args:
         screen (pygame.Surface): La superficie donde se dibuja el menú.
         fases_desbloqueadas (list): Lista de fases desbloqueadas.
-        options_sound (pygame.mixer.Sound): Sonido que se reproduce al seleccionar una opción.
+        options_sound (pygame.mixer.Sound | BusSonido.voz): Sonido que se reproduce al seleccionar una opción.
     Returns:
         int: El número de la fase seleccionada por el jugador.
     '''
-    font = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 28)
-    seleccion = 0
-
-    fondo = pygame.image.load("assets/bg/menu_main.png").convert()
-    fondo = pygame.transform.scale(fondo, screen.get_size())
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return None
-            if event.type == pygame.KEYDOWN:
-                options_sound.play()
-                if event.key == pygame.K_UP:
-                    seleccion = (seleccion - 1) % len(fases_desbloqueadas)
-                elif event.key == pygame.K_DOWN:
-                    seleccion = (seleccion + 1) % len(fases_desbloqueadas)
-                elif event.key == pygame.K_RETURN:
-                    return fases_desbloqueadas[seleccion]
-
-        screen.blit(fondo, (0, 0))
-        titulo = font.render("Selecciona una Fase", True, (255, 255, 0))
-        screen.blit(titulo, (100, 100))
-
-        for i, fase in enumerate(fases_desbloqueadas):
-            color = (255, 255, 255) if i != seleccion else (0, 255, 0)
-            texto = font.render(f"Fase {fase}", True, color)
-            screen.blit(texto, (150, 160 + i * 40))
+    menu = MenuOpciones(
+        screen, [(f"Fase {fase}", fase) for fase in fases_desbloqueadas], (150, 160), 40,
+        textos=[texto(28, "Selecciona una Fase", AMARILLO, (100, 100))],
+        sonido=options_sound
+    )
+    return menu.ejecutar()
 
-        pygame.display.flip()
-        
 def menu_pausa(screen, options_sound):
     '''
-    Muestra el menú de pausa del juego.
+    Muestra el menú de pausa del juego sobre el último frame de la partida, oscurecido.
     Permite al jugador reanudar el juego, acceder a la configuración o salir.
-    
+
     Args:
         screen (pygame.Surface): La superficie donde se dibuja el menú.
-        options_sound (pygame.mixer.Sound): Sonido que se reproduce al seleccionar una opción.
+        options_sound (pygame.mixer.Sound | BusSonido.voz): Sonido que se reproduce al seleccionar una opción.
     Returns:
         str: La opción seleccionada por el jugador ("reanudar", "configuración" o "salir").
     '''
-    font = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 28)
     opciones = ["Reanudar", "Configuración", "Salir"]
-    seleccion = 0
-
-    fondo = pygame.image.load("assets/bg/menu_main.png").convert()
-    fondo = pygame.transform.scale(fondo, screen.get_size())
-    
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "salir"
-            if event.type == pygame.KEYDOWN:
-                options_sound.play()
-                if event.key == pygame.K_UP:
-                    seleccion = (seleccion - 1) % len(opciones)
-                elif event.key == pygame.K_DOWN:
-                    seleccion = (seleccion + 1) % len(opciones)
-                elif event.key == pygame.K_RETURN:
-                    return opciones[seleccion].lower()
-
-        screen.blit(fondo, (0, 0))
-        for i, opcion in enumerate(opciones):
-            color = (255, 255, 0) if i == seleccion else (255, 255, 255)
-            texto = font.render(opcion, True, color)
-            screen.blit(texto, (150, 200 + i * 40))
-        pygame.display.flip()
+    fondo = screen.copy()
+    fondo.fill(OSCURECER_PAUSA, special_flags=pygame.BLEND_RGB_MULT)
+    menu = MenuOpciones(
+        screen, [(opcion, opcion.lower()) for opcion in opciones], (150, 200), 40,
+        color_seleccion=AMARILLO, fondo=fondo, sonido=options_sound, al_cerrar="salir"
+    )
+    return menu.ejecutar()
 
 def game_over(screen, score_manager, lose_sound):
     '''
     Muestra el menú de Game Over.
     Permite al jugador reiniciar el juego o salir.
-    
+
     Args:
         screen (pygame.Surface): La superficie donde se dibuja el menú.
         score_manager (ScoreManager): Objeto que gestiona el puntaje y récords.
-        lose_sound (pygame.mixer.Sound): Sonido que se reproduce al perder.
+        lose_sound (pygame.mixer.Sound | BusSonido.voz): Sonido que se reproduce al perder.
     '''
     pygame.mixer.music.pause()
     lose_sound.play()
-    fondo = pygame.image.load("assets/bg/menu_main.png").convert()
-    fondo = pygame.transform.scale(fondo, screen.get_size())
-    font_big = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 36)
-    font_small = pygame.font.Font("assets/fonts/Orbitron-VariableFont_wght.ttf", 24)
-
-    texto1 = font_big.render("GAME OVER", True, (255, 0, 0))
-    texto2 = font_small.render(f"Puntaje: {score_manager.score}", True, (255, 255, 255))
-    texto3 = font_small.render(f"Récord: {score_manager.highscore}", True, (255, 255, 0))
-    texto4 = font_small.render("Presiona R para reiniciar ", True, (200, 200, 200))
-    texto5 = font_small.render("o ESC para salir", True, (200, 200, 200))
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    pygame.mixer.music.unpause()
-                    return True
-                elif event.key == pygame.K_ESCAPE:
-                    return False
-
-        screen.blit(fondo, (0, 0))
-        screen.blit(texto1, (150, 200))
-        screen.blit(texto2, (160, 250))
-        screen.blit(texto3, (160, 280))
-        screen.blit(texto4, (90, 340))
-        screen.blit(texto5, (130, 370))
-        pygame.display.flip()
\ No newline at end of file
+
+    menu = PantallaMenu(
+        screen, [
+            texto(36, "GAME OVER", (255, 0, 0), (150, 200)),
+            texto(24, f"Puntaje: {score_manager.score}", BLANCO, (160, 250)),
+            texto(24, f"Récord: {score_manager.highscore}", AMARILLO, (160, 280)),
+            texto(24, "Presiona R para reiniciar ", (200, 200, 200), (90, 340)),
+            texto(24, "o ESC para salir", (200, 200, 200), (130, 370))
+        ],
+        teclas={pygame.K_r: True, pygame.K_ESCAPE: False}, al_cerrar=False
+    )
+    reiniciar = menu.ejecutar()
+    if reiniciar:
+        pygame.mixer.music.unpause()
+    return reiniciar
@@ -1,9 +1,44 @@
+# src/music_manager.py
+
+'''
+Música del juego.
+
+GestorMusica comprueba al arrancar que existen las pistas de PISTAS; si falta alguna
+usa su pista de reserva (RESERVAS) o se queda en silencio, en lugar de fallar al
+cambiar de música en plena partida. Las pistas se leen a memoria en un hilo
+(precargar), así que el cambio no espera al disco; se suele precargar la siguiente
+pista probable, como el tema del jefe durante la cuenta atrás de la alerta.
+
+Los cambios de pista no bloquean el frame: reproducir() inicia el fundido de salida
+de la pista actual y update(), llamado una vez por frame, arranca la nueva con fundido
+de entrada cuando el de salida termina. pygame.mixer.music solo reproduce un flujo a la
+vez, por eso el fundido es encadenado (salida y después entrada) y no superpuesto.
+'''
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
+# Pistas por nombre
+PISTAS = {
+    "menu": "assets/music/menu-soundtrack.mp3",
+    "principal": "assets/music/main-music-soundtrack.mp3",
+    "jefe": "assets/music/boss-soundtrack.mp3"
+}
+
+# Pista que suena en lugar de otra si su archivo no existe
+RESERVAS = {
+    "jefe": "principal"
+}
+
+FUNDIDO_MS = 600  # Duración de cada fundido (salida y entrada)
+
 def load_music(path, bucle=-1, volume=0.5):
     '''
     Carga y reproduce música desde un archivo.
-    
+
     Args:
         path (str): Ruta del archivo de música.
         bucle (int): Número de veces que se repetirá la música (-1 para bucle infinito).
@@ -12,3 +47,123 @@ def load_music(path, bucle=-1, volume=0.5):
     pygame.mixer.music.load(path)
     pygame.mixer.music.set_volume(volume)  # Ajusta el volumen según sea necesario
     pygame.mixer.music.play(bucle)  # Reproduce la música en bucle
+
+def _leer(ruta):
+    with open(ruta, "rb") as f:
+        return f.read()
+
+class GestorMusica:
+    '''
+    Reproductor de música con pistas validadas, precarga en segundo plano y cambios
+    con fundido que no bloquean.
+
+    Atributos:
+        pistas (dict): Ruta de cada pista ya resuelta (la de reserva si falta la suya;
+            None si no hay ninguna).
+        volumen (float): Volumen de la música (0.0 a 1.0).
+        fundido_ms (int): Duración de cada fundido en milisegundos.
+        actual (str): Ruta de la pista que suena (None si ninguna).
+        cache (dict): Contenido de cada archivo ya leído, por ruta.
+        cambio (tuple): Pista pendiente (ruta, bucle, instante en ms en que termina el
+            fundido de salida), o None.
+    '''
+    def __init__(self, volumen=0.5, pistas=PISTAS, reservas=RESERVAS, fundido_ms=FUNDIDO_MS):
+        self.volumen = volumen
+        self.fundido_ms = fundido_ms
+        self.pistas = self.validar(pistas, reservas)
+        self.actual = None
+        self.cache = {}
+        self.cambio = None
+        self._lecturas = {}
+        self._flujo = None  # El flujo en memoria debe vivir mientras suena
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="musica")
+
+    @staticmethod
+    def validar(pistas, reservas):
+        '''
+        Resuelve cada pista a un archivo existente.
+
+        Returns:
+            dict: Ruta de cada pista; la de su reserva si falta la propia, o None.
+        '''
+        resueltas = {}
+        for nombre, ruta in pistas.items():
+            if not os.path.isfile(ruta):
+                reserva = pistas.get(reservas.get(nombre))
+                ruta = reserva if reserva is not None and os.path.isfile(reserva) else None
+                print(f"Falta la pista '{nombre}' ({pistas[nombre]}); se usará {ruta or 'silencio'}")
+            resueltas[nombre] = ruta
+        return resueltas
+
+    def precargar(self, nombre):
+        '''
+        Lee en segundo plano el archivo de una pista para que el cambio no espere al disco.
+        '''
+        ruta = self.pistas.get(nombre)
+        if ruta is not None and ruta not in self.cache and ruta not in self._lecturas:
+            self._lecturas[ruta] = self._pool.submit(_leer, ruta)
+
+    def reproducir(self, nombre, bucle=-1):
+        '''
+        Cambia a una pista. Si ya suena no hace nada; si suena otra empieza su fundido
+        de salida y la nueva arranca en update().
+
+        Args:
+            nombre (str): Pista de PISTAS.
+            bucle (int): Repeticiones (-1 para bucle infinito).
+        '''
+        ruta = self.pistas.get(nombre)
+        if ruta == self.actual and self.cambio is None:
+            return
+        self.precargar(nombre)
+        if self.actual is None or not pygame.mixer.music.get_busy():
+            self._iniciar(ruta, bucle)
+            return
+        if self.cambio is None:
+            pygame.mixer.music.fadeout(self.fundido_ms)
+        fin = pygame.time.get_ticks() + self.fundido_ms if self.cambio is None else self.cambio[2]
+        self.cambio = (ruta, bucle, fin)
+
+    def update(self):
+        '''
+        Arranca la pista pendiente cuando termina el fundido de salida. Se llama una vez por frame.
+        '''
+        if self.cambio is not None:
+            ruta, bucle, fin = self.cambio
+            if pygame.time.get_ticks() >= fin or not pygame.mixer.music.get_busy():
+                self._iniciar(ruta, bucle)
+
+    def _iniciar(self, ruta, bucle):
+        '''
+        Carga y reproduce una pista con fundido de entrada, desde memoria si ya se leyó.
+        '''
+        self.cambio = None
+        self.actual = ruta
+        if ruta is None:
+            pygame.mixer.music.stop()
+            return
+        lectura = self._lecturas.get(ruta)
+        if lectura is not None and lectura.done():
+            del self._lecturas[ruta]
+            try:
+                self.cache[ruta] = lectura.result()
+            except OSError:
+                pass
+        try:
+            if ruta in self.cache:
+                self._flujo = io.BytesIO(self.cache[ruta])
+                pygame.mixer.music.load(self._flujo, os.path.splitext(ruta)[1][1:])
+            else:
+                pygame.mixer.music.load(ruta)  # La lectura aún no terminó: no se espera por ella
+            pygame.mixer.music.set_volume(self.volumen)
+            pygame.mixer.music.play(bucle, fade_ms=self.fundido_ms)
+        except pygame.error as e:
+            print(f"No se pudo reproducir {ruta}: {e}")
+            self.actual = None
+
+    def cerrar(self):
+        '''
+        Detiene la música y el hilo de lectura.
+        '''
+        pygame.mixer.music.stop()
+        self._pool.shutdown(wait=False, cancel_futures=True)
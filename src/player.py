@@ -3,7 +3,7 @@
 import pygame
 from src.bullet import Bullet
 from src.config import PLAYER_SPEED, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.sprite_manager import cargar_sprites, extraer_sprite
+from src.sprite_manager import obtener_sprite
 
 class Player(pygame.sprite.Sprite):
     '''
@@ -40,35 +40,35 @@ class Player(pygame.sprite.Sprite):
     '''
     def __init__(self, x, y):
         super().__init__()
-        ship_sheet = pygame.image.load("assets/player/SpaceShips_Player-0001.png").convert_alpha()
-        self.sprite_ship_normal = extraer_sprite(ship_sheet, 77, 71, 38, 40, 1.5)  # Nave normal
-        self.sprite_ship_overcharge = extraer_sprite(ship_sheet, 12, 22, 38, 40, 1.5)  # Nave sobrecargada
-        shield_sheet = pygame.image.load("assets/effects/Barrier-0001.png").convert_alpha()
-        self.sprite_shield = extraer_sprite(shield_sheet, 15, 16, 67, 67, 1.5)
-        self.ui_sheet = pygame.image.load("assets/ui/UI_sprites-0001.png").convert_alpha()
+        ship_sheet = "assets/player/SpaceShips_Player-0001.png"
+        self.sprite_ship_normal = obtener_sprite(ship_sheet, 77, 71, 38, 40, 1.5)  # Nave normal
+        self.sprite_ship_overcharge = obtener_sprite(ship_sheet, 12, 22, 38, 40, 1.5)  # Nave sobrecargada
+        shield_sheet = "assets/effects/Barrier-0001.png"
+        self.sprite_shield = obtener_sprite(shield_sheet, 15, 16, 67, 67, 1.5)
+        self.ui_sheet = "assets/ui/UI_sprites-0001.png"
         self.ui_icons = {
-            "full_health_icon": extraer_sprite(self.ui_sheet, 3, 82, 12, 10, 2.1),  # Icono de salud lleno
-            "empty_health_icon": extraer_sprite(self.ui_sheet, 19, 82, 12, 10, 2.1),  # Icono de salud vacío
-            "health_bar_icon": extraer_sprite(self.ui_sheet, 3, 11, 73, 20, 2.4),  # Barra de salud
-            "shield_icon": extraer_sprite(self.ui_sheet, 93, 27, 22, 22, 1.5),  # Escudo
-            "speed_icon": extraer_sprite(self.ui_sheet, 93, 51, 22, 22, 1.5),  # Velocidad
-            "double_shot_icon": extraer_sprite(self.ui_sheet, 93, 77, 22, 22, 1.5),  # Disparo doble
-            "double_points_icon": extraer_sprite(self.ui_sheet, 93, 102, 22, 22, 1.5),  # Puntos dobles
-            "charge_icon": extraer_sprite(self.ui_sheet, 55, 80, 9, 13, 2.5),  # Sobre carga
-            "charge_tank_full": extraer_sprite(self.ui_sheet, 16, 101, 7, 22, 2.4),  # Barra de carga llena
-            "charge_tank_empty": extraer_sprite(self.ui_sheet, 26, 101, 7, 22, 2.4)  # Barra de carga vacía
+            "full_health_icon": obtener_sprite(self.ui_sheet, 3, 82, 12, 10, 2.1),  # Icono de salud lleno
+            "empty_health_icon": obtener_sprite(self.ui_sheet, 19, 82, 12, 10, 2.1),  # Icono de salud vacío
+            "health_bar_icon": obtener_sprite(self.ui_sheet, 3, 11, 73, 20, 2.4),  # Barra de salud
+            "shield_icon": obtener_sprite(self.ui_sheet, 93, 27, 22, 22, 1.5),  # Escudo
+            "speed_icon": obtener_sprite(self.ui_sheet, 93, 51, 22, 22, 1.5),  # Velocidad
+            "double_shot_icon": obtener_sprite(self.ui_sheet, 93, 77, 22, 22, 1.5),  # Disparo doble
+            "double_points_icon": obtener_sprite(self.ui_sheet, 93, 102, 22, 22, 1.5),  # Puntos dobles
+            "charge_icon": obtener_sprite(self.ui_sheet, 55, 80, 9, 13, 2.5),  # Sobre carga
+            "charge_tank_full": obtener_sprite(self.ui_sheet, 16, 101, 7, 22, 2.4),  # Barra de carga llena
+            "charge_tank_empty": obtener_sprite(self.ui_sheet, 26, 101, 7, 22, 2.4)  # Barra de carga vacía
         }
         self.score_font = [
-            extraer_sprite(self.ui_sheet, 8, 68, 6, 6, 2.0),  # 1
-            extraer_sprite(self.ui_sheet, 13, 68, 6, 6, 2.0),  # 2
-            extraer_sprite(self.ui_sheet, 18, 68, 6, 6, 2.0), # 3
-            extraer_sprite(self.ui_sheet, 23, 68, 6, 6, 2.0), # 4
-            extraer_sprite(self.ui_sheet, 28, 68, 6, 6, 2.0), # 5
-            extraer_sprite(self.ui_sheet, 33, 68, 6, 6, 2.0), # 6
-            extraer_sprite(self.ui_sheet, 38, 68, 6, 6, 2.0), # 7
-            extraer_sprite(self.ui_sheet, 43, 68, 6, 6, 2.0), # 8
-            extraer_sprite(self.ui_sheet, 48, 68, 6, 6, 2.0), #9
-            extraer_sprite(self.ui_sheet, 53, 68, 6, 6, 2.0)   #0
+            obtener_sprite(self.ui_sheet, 8, 68, 6, 6, 2.0),  # 1
+            obtener_sprite(self.ui_sheet, 13, 68, 6, 6, 2.0),  # 2
+            obtener_sprite(self.ui_sheet, 18, 68, 6, 6, 2.0), # 3
+            obtener_sprite(self.ui_sheet, 23, 68, 6, 6, 2.0), # 4
+            obtener_sprite(self.ui_sheet, 28, 68, 6, 6, 2.0), # 5
+            obtener_sprite(self.ui_sheet, 33, 68, 6, 6, 2.0), # 6
+            obtener_sprite(self.ui_sheet, 38, 68, 6, 6, 2.0), # 7
+            obtener_sprite(self.ui_sheet, 43, 68, 6, 6, 2.0), # 8
+            obtener_sprite(self.ui_sheet, 48, 68, 6, 6, 2.0), #9
+            obtener_sprite(self.ui_sheet, 53, 68, 6, 6, 2.0)   #0
         ]
         self.image = self.sprite_ship_normal
         self.rect = self.image.get_rect(center=(x, y))
@@ -182,17 +182,17 @@ class Player(pygame.sprite.Sprite):
         if self.shoot_cooldown == 0:
             if self.double_shot > 0 and self.charge_status:
                 # Disparo doble: dos balas en paralelo
-                bullet1 = Bullet(self.rect.centerx - 10, self.rect.top)
-                bullet2 = Bullet(self.rect.centerx + 10, self.rect.top)
-                bullet3 = Bullet(self.rect.centerx, self.rect.top)
+                bullet1 = Bullet.crear(self.rect.centerx - 10, self.rect.top)
+                bullet2 = Bullet.crear(self.rect.centerx + 10, self.rect.top)
+                bullet3 = Bullet.crear(self.rect.centerx, self.rect.top)
                 self.bullets.add(bullet1, bullet2, bullet3)
             elif self.double_shot > 0 or self.charge_status:
                 # Disparo doble: dos balas en paralelo
-                bullet1 = Bullet(self.rect.centerx - 10, self.rect.top)
-                bullet2 = Bullet(self.rect.centerx + 10, self.rect.top)
+                bullet1 = Bullet.crear(self.rect.centerx - 10, self.rect.top)
+                bullet2 = Bullet.crear(self.rect.centerx + 10, self.rect.top)
                 self.bullets.add(bullet1, bullet2)
             else:
-                bullet = Bullet(self.rect.centerx, self.rect.top)
+                bullet = Bullet.crear(self.rect.centerx, self.rect.top)
                 self.bullets.add(bullet)
 
             self.shoot_cooldown = 10
@@ -286,6 +286,16 @@ class Player(pygame.sprite.Sprite):
             self.dash_timer = self.dash_duration
             self.dash_cooldown = 30  # Frames de cooldown (~0.5s)
             
+    def draw_shield(self, surface):
+        '''
+        Dibuja el sprite del escudo encima del jugador si el escudo está activo.
+        
+        Args:
+            surface (pygame.Surface): Superficie donde se dibuja el escudo.
+        '''
+        if self.shield > 0:
+            surface.blit(self.sprite_shield, (self.rect.centerx - self.sprite_shield.get_width() // 2, self.rect.centery - self.sprite_shield.get_height() // 2))
+
     def draw_powerup_icons(self, surface):
         '''
         Dibuja los iconos de los potenciadores activos del jugador en la superficie proporcionada.
@@ -305,8 +315,6 @@ class Player(pygame.sprite.Sprite):
             icon = self.ui_icons["shield_icon"]
             surface.blit(icon, (x_base, y))
             y += 50
-            # Dibuja el sprite del escudo encima del jugador
-            surface.blit(self.sprite_shield, (self.rect.centerx - self.sprite_shield.get_width() // 2, self.rect.centery - self.sprite_shield.get_height() // 2))
 
         if self.speed_boost > 0:
             icon = self.ui_icons["speed_icon"]
@@ -0,0 +1,164 @@
+# src/pool.py
+
+'''
+Pools de reciclaje para proyectiles.
+
+Cada clase de proyectil tiene su propia lista de objetos libres. En lugar de crear un
+Sprite nuevo en cada disparo, se toma uno de la lista y se reinicializa; al llamar a
+kill() el proyectil vuelve a su pool en vez de descartarse.
+'''
+
+import pygame
+from src.config import POOL_MAX_LIBRES
+
+# Registro de pools por clase de proyectil
+_pools = {}
+
+class Pool:
+    '''
+    Lista de objetos libres de una clase concreta.
+
+    Atributos:
+        clase (type): Clase de los objetos que se reciclan.
+        max_libres (int): Número máximo de objetos libres que se guardan (high-water mark).
+        libres (list): Objetos disponibles para reutilizar.
+        creados (int): Objetos construidos desde cero.
+        reutilizados (int): Objetos entregados desde la lista de libres.
+        desbordes (int): Objetos devueltos que se descartaron por superar max_libres.
+    '''
+    def __init__(self, clase, max_libres=POOL_MAX_LIBRES):
+        self.clase = clase
+        self.max_libres = max_libres
+        self.libres = []
+        self.creados = 0
+        self.reutilizados = 0
+        self.desbordes = 0
+
+    def adquirir(self, *args, **kwargs):
+        '''
+        Devuelve un objeto listo para usar, reciclado si hay alguno libre.
+
+        Args:
+            *args, **kwargs: Argumentos de inicialización del proyectil.
+        Returns:
+            pygame.sprite.Sprite: El proyectil reinicializado.
+        '''
+        if self.libres:
+            obj = self.libres.pop()
+            obj.en_pool = False
+            obj.reiniciar(*args, **kwargs)
+            self.reutilizados += 1
+            return obj
+        self.creados += 1
+        return self.clase(*args, **kwargs)
+
+    def liberar(self, obj):
+        '''
+        Devuelve un objeto al pool. Si la lista de libres está llena, se descarta.
+
+        Args:
+            obj (pygame.sprite.Sprite): Objeto ya eliminado de todos sus grupos.
+        '''
+        if obj.en_pool:
+            return
+        if len(self.libres) >= self.max_libres:
+            obj.en_pool = True  # Descartado: un segundo kill() no vuelve a contarse
+            self.desbordes += 1
+            return
+        obj.en_pool = True
+        self.libres.append(obj)
+
+    def precargar(self, cantidad, *args, **kwargs):
+        '''
+        Crea objetos por adelantado para evitar asignaciones durante la partida.
+
+        Args:
+            cantidad (int): Número de objetos a crear.
+            *args, **kwargs: Argumentos de construcción de los objetos.
+        '''
+        for _ in range(min(cantidad, self.max_libres - len(self.libres))):
+            obj = self.clase(*args, **kwargs)
+            self.creados += 1
+            obj.en_pool = True
+            self.libres.append(obj)
+
+    def estadisticas(self):
+        '''
+        Returns:
+            dict: Contadores de creación, reutilización y desbordes, y objetos libres.
+        '''
+        return {
+            "creados": self.creados,
+            "reutilizados": self.reutilizados,
+            "desbordes": self.desbordes,
+            "libres": len(self.libres),
+            "max_libres": self.max_libres
+        }
+
+def obtener_pool(clase):
+    '''
+    Devuelve el pool de una clase, creándolo la primera vez.
+
+    Args:
+        clase (type): Clase del proyectil.
+    Returns:
+        Pool: El pool asociado a la clase.
+    '''
+    pool = _pools.get(clase)
+    if pool is None:
+        pool = Pool(clase)
+        _pools[clase] = pool
+    return pool
+
+def configurar_pool(clase, max_libres):
+    '''
+    Ajusta el número máximo de objetos libres de una clase.
+
+    Args:
+        clase (type): Clase del proyectil.
+        max_libres (int): Nuevo high-water mark.
+    '''
+    pool = obtener_pool(clase)
+    pool.max_libres = max_libres
+    del pool.libres[max_libres:]
+
+def estadisticas_pools():
+    '''
+    Returns:
+        dict: Nombre de clase -> estadísticas de su pool.
+    '''
+    return {clase.__name__: pool.estadisticas() for clase, pool in _pools.items()}
+
+def vaciar_pools():
+    '''
+    Descarta todos los objetos libres y reinicia los contadores.
+    '''
+    _pools.clear()
+
+class PooledSprite(pygame.sprite.Sprite):
+    '''
+    Sprite reciclable. Se crean con Clase.crear(...) en lugar de Clase(...).
+
+    Las subclases deben definir reiniciar() con los mismos argumentos que su constructor:
+    Pool.adquirir lo llama sobre un objeto reciclado para dejarlo como recién construido.
+
+    Atributos:
+        en_pool (bool): Indica si el objeto está guardado en la lista de libres.
+    '''
+    def __init__(self):
+        super().__init__()
+        self.en_pool = False
+
+    @classmethod
+    def crear(cls, *args, **kwargs):
+        '''
+        Obtiene una instancia del pool de la clase.
+        '''
+        return obtener_pool(cls).adquirir(*args, **kwargs)
+
+    def kill(self):
+        '''
+        Saca el sprite de todos sus grupos y lo devuelve a su pool.
+        '''
+        super().kill()
+        obtener_pool(type(self)).liberar(self)
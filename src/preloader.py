@@ -0,0 +1,280 @@
+# src/preloader.py
+
+'''
+Precarga de recursos con pantalla de carga.
+
+Precargador decodifica en un pool de hilos las imágenes (atlas, fondos y, si el atlas
+hay que reconstruirlo, las hojas de origen) y los efectos de sonido, mientras el hilo
+principal anima una pantalla de carga sencilla. Decodificar no necesita la ventana y
+pygame suelta el GIL mientras lee y descomprime, así que los archivos se leen a la vez;
+la conversión al formato de la pantalla (convert/convert_alpha) sí la necesita y se
+hace en el hilo principal en cuanto termina cada imagen.
+
+Después calienta, también en el hilo principal, las cachés que si no se llenarían en
+plena partida: sprites de jugador, enemigos, jefe, power-ups y balas, tiras de pulso de
+las bolas cargadas, patrones del jefe compilados, fondos escalados y fuentes.
+
+InformeArranque reúne los tiempos del arranque: importación de módulos, decodificación
+y conversión de cada recurso, calentamiento de cada caché y tiempo hasta el primer
+frame interactivo. `python -m src.main --arranque` lo imprime al mostrarse el menú.
+'''
+
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pygame
+
+from src import atlas
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.sprite_manager import registrar_hoja, obtener_escalado, obtener_recurso, obtener_pulso
+from src.text_manager import obtener_fuente
+from src.player import Player
+from src.bullet import Bullet
+from src.enemy import Enemy
+from src.enemy_bullet import sprite_bala_enemiga
+from src.boss import Boss
+from src.powerup import crear_animaciones
+from src.bullet_patterns import PATRONES, obtener_patron
+from src.menu import FUENTE_MENU, FONDO_MENU
+from src.renderer import FUENTE_AVISOS, FONDO_JUEGO
+from src.sound_bus import EFECTOS
+
+HILOS = 4  # Hilos de decodificación
+FPS_CARGA = 60  # Ritmo de la animación de la pantalla de carga
+
+# Fondos que se decodifican siempre (ruta, alpha); las hojas de sprites van en el atlas
+FONDOS = (
+    (FONDO_MENU, False),
+    (FONDO_JUEGO, False)
+)
+
+# Efectos de sonido por nombre (ver src/sound_bus.py)
+SONIDOS = {nombre: efecto["ruta"] for nombre, efecto in EFECTOS.items()}
+
+# Fuentes (ruta, tamaño) que usan los menús y los avisos
+FUENTES = (
+    *((FUENTE_MENU, tamaño) for tamaño in (24, 28, 32, 36, 42)),
+    (FUENTE_AVISOS, 30)
+)
+
+# Tareas de los hilos -----------------------------------------------------------------------------
+def _cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+def _decodificar_imagen(ruta):
+    return _cronometrar(pygame.image.load, ruta)
+
+def _decodificar_sonido(ruta):
+    return _cronometrar(pygame.mixer.Sound, ruta)
+
+def _leer_atlas():
+    return _cronometrar(atlas.leer)
+
+# Informe -----------------------------------------------------------------------------------------
+class InformeArranque:
+    '''
+    Tiempos del arranque del juego, en milisegundos.
+
+    Atributos:
+        importacion (float): Importación de los módulos del juego.
+        recursos (list): Por recurso, (nombre, decodificación en hilo, conversión en el hilo principal).
+        calentamiento (dict): Tiempo de cada caché calentada.
+        carga (float): Duración total de la precarga, con la pantalla de carga.
+        frames_carga (int): Frames dibujados de la pantalla de carga.
+        primer_frame (float): Desde el inicio del proceso hasta el primer frame interactivo.
+    '''
+    def __init__(self, inicio, importacion):
+        self.inicio = inicio
+        self.importacion = importacion
+        self.recursos = []
+        self.calentamiento = {}
+        self.carga = 0.0
+        self.frames_carga = 0
+        self.primer_frame = None
+
+    def marcar_primer_frame(self):
+        '''
+        Anota el primer frame interactivo (solo la primera vez que se llama).
+        '''
+        if self.primer_frame is None:
+            self.primer_frame = (time.perf_counter() - self.inicio) * 1000
+
+    def lineas(self):
+        '''
+        Returns:
+            list: Líneas de texto del informe.
+        '''
+        lineas = [f"Importación de módulos: {self.importacion:8.1f} ms"]
+        lineas.append(f"Precarga ({self.frames_carga} frames de carga): {self.carga:8.1f} ms")
+        for nombre, decodificacion, conversion in sorted(self.recursos, key=lambda r: -r[1]):
+            lineas.append(f"  {nombre:<44} {decodificacion:7.1f} ms  conversión {conversion:6.1f} ms")
+        for nombre, duracion in self.calentamiento.items():
+            lineas.append(f"  caché {nombre:<38} {duracion:7.1f} ms")
+        if self.primer_frame is not None:
+            lineas.append(f"Primer frame interactivo: {self.primer_frame:8.1f} ms")
+        return lineas
+
+    def imprimir(self):
+        print("\n".join(self.lineas()))
+
+# Precarga ----------------------------------------------------------------------------------------
+class Precargador:
+    '''
+    Carga de recursos en segundo plano con pantalla de carga.
+
+    Atributos:
+        informe (InformeArranque): Tiempos de la precarga.
+        sonidos (dict): Efectos de sonido decodificados, por nombre (ver SONIDOS).
+        hilos (int): Hilos de decodificación.
+        progreso (float): Fracción de la precarga completada (0 a 1).
+    '''
+    def __init__(self, informe, hilos=HILOS):
+        self.informe = informe
+        self.sonidos = {}
+        self.hilos = hilos
+        self.progreso = 0.0
+        self._atlas = None
+
+    def ejecutar(self, screen):
+        '''
+        Decodifica los recursos, los termina en el hilo principal y calienta las cachés
+        mientras anima la pantalla de carga.
+
+        Args:
+            screen (pygame.Surface): Ventana del juego (ya creada).
+        Returns:
+            bool: False si el jugador cerró la ventana durante la carga.
+        '''
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="precarga") as pool:
+            tareas = {pool.submit(_leer_atlas): ("atlas", None)}
+            for ruta, alpha in FONDOS:
+                tareas[pool.submit(_decodificar_imagen, ruta)] = ("imagen", (ruta, alpha))
+            for nombre, ruta in SONIDOS.items():
+                tareas[pool.submit(_decodificar_sonido, ruta)] = ("sonido", (nombre, ruta))
+            total = len(tareas)
+            pendientes = set(tareas)
+            ultimo_frame = 0.0
+            while pendientes:
+                hechas, pendientes = wait(pendientes, timeout=1 / FPS_CARGA, return_when=FIRST_COMPLETED)
+                for futuro in hechas:
+                    tipo, datos = tareas.pop(futuro)
+                    for nueva, ruta in self._terminar(pool, futuro, tipo, datos):
+                        tareas[nueva] = ("imagen", (ruta, True))
+                        pendientes.add(nueva)
+                        total += 1
+                self.progreso = 0.5 * (total - len(pendientes)) / total
+                if time.perf_counter() - ultimo_frame >= 1 / FPS_CARGA:
+                    if not self._animar(screen):
+                        pool.shutdown(cancel_futures=True)
+                        return False
+                    ultimo_frame = time.perf_counter()
+
+        if self._atlas is None:
+            # Atlas ausente o desfasado: se reconstruye con las hojas ya decodificadas
+            self._cronometrar_calentamiento("atlas (reconstrucción)", atlas.cargar)
+        pasos = self._calentamientos()
+        for i, (nombre, funcion) in enumerate(pasos):
+            self._cronometrar_calentamiento(nombre, funcion)
+            self.progreso = 0.5 + 0.5 * (i + 1) / len(pasos)
+            if not self._animar(screen):
+                return False
+        self.informe.carga = (time.perf_counter() - inicio) * 1000
+        return True
+
+    def _terminar(self, pool, futuro, tipo, datos):
+        '''
+        Termina en el hilo principal un recurso decodificado.
+
+        Returns:
+            list: Pares (tarea, ruta) nuevos: las hojas de origen si el atlas hay que reconstruirlo.
+        '''
+        resultado, decodificacion = futuro.result()
+        inicio = time.perf_counter()
+        nuevas = []
+        if tipo == "atlas":
+            nombre = atlas.IMAGEN
+            if resultado is not None:
+                superficie, indice = resultado
+                self._atlas = atlas.registrar(superficie.convert_alpha(), indice)
+            else:
+                nombre += " (desfasado)"
+                for ruta in sorted({recorte[0] for recorte in atlas.RECORTES} | {rejilla[0] for rejilla in atlas.REJILLAS}):
+                    nuevas.append((pool.submit(_decodificar_imagen, ruta), ruta))
+        elif tipo == "imagen":
+            nombre, alpha = datos
+            registrar_hoja(nombre, resultado, alpha)
+        else:
+            nombre = datos[1]
+            self.sonidos[datos[0]] = resultado
+        self.informe.recursos.append((nombre, decodificacion, (time.perf_counter() - inicio) * 1000))
+        return nuevas
+
+    def _calentamientos(self):
+        '''
+        Returns:
+            list: Pares (nombre, función) de las cachés a llenar antes de jugar.
+        '''
+        return [
+            ("jugador y HUD", lambda: Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)),
+            ("bala del jugador", lambda: Bullet(0, 0)),
+            ("enemigos", Enemy.cargar_sprites),
+            ("balas enemigas", lambda: (sprite_bala_enemiga(False), sprite_bala_enemiga(True))),
+            ("jefe y bolas cargadas", _calentar_jefe),
+            ("patrones del jefe", lambda: [obtener_patron(nombre) for nombre in PATRONES]),
+            ("power-ups", lambda: obtener_recurso("powerup_animaciones", crear_animaciones)),
+            ("fondos escalados", lambda: [obtener_escalado(ruta, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha) for ruta, alpha in FONDOS]),
+            ("fuentes", lambda: [obtener_fuente(ruta, tamaño) for ruta, tamaño in FUENTES])
+        ]
+
+    def _cronometrar_calentamiento(self, nombre, funcion):
+        _, duracion = _cronometrar(funcion)
+        self.informe.calentamiento[nombre] = duracion
+
+    def _animar(self, screen):
+        '''
+        Atiende los eventos y dibuja un frame de la pantalla de carga.
+
+        Returns:
+            bool: False si se cerró la ventana.
+        '''
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        dibujar_carga(screen, self.progreso, time.perf_counter() - self.informe.inicio)
+        pygame.display.flip()
+        self.informe.frames_carga += 1
+        return True
+
+def _calentar_jefe():
+    '''
+    Recorta los sprites del jefe y de sus balas y precalcula las tiras de pulso de las
+    bolas cargadas.
+    '''
+    jefe = Boss()
+    for sprite in jefe.charged_sprites:
+        obtener_pulso(sprite, 0.1)
+
+def dibujar_carga(screen, progreso, segundos):
+    '''
+    Pantalla de carga: barra de progreso y un anillo de puntos que gira. Solo usa
+    primitivas de pygame.draw para no depender de ningún recurso aún sin cargar.
+
+    Args:
+        screen (pygame.Surface): Superficie de destino.
+        progreso (float): Fracción completada (0 a 1).
+        segundos (float): Tiempo transcurrido, para la animación.
+    '''
+    screen.fill((0, 0, 0))
+    ancho, alto = screen.get_size()
+    barra = pygame.Rect(ancho // 4, alto // 2 + 40, ancho // 2, 12)
+    pygame.draw.rect(screen, (80, 80, 80), barra, 1)
+    pygame.draw.rect(screen, (0, 255, 0), (barra.x + 2, barra.y + 2, int((barra.width - 4) * progreso), barra.height - 4))
+    activo = int(segundos * 12) % 8
+    for i in range(8):
+        angulo = i * math.pi / 4
+        color = (255, 255, 0) if i == activo else (90, 90, 90)
+        pygame.draw.circle(screen, color, (ancho // 2 + int(24 * math.cos(angulo)), alto // 2 - 20 + int(24 * math.sin(angulo))), 4)
@@ -0,0 +1,226 @@
+# src/profiler.py
+
+'''
+Temporizadores por fase del frame.
+
+FrameProfiler mide con un reloj monotónico cuánto tarda cada fase del bucle
+(eventos, jugador, enemigos, balas, jefe, colisiones, dibujo, flip) y guarda los
+últimos N frames en un buffer circular. Puede mostrar un overlay con los tiempos y el
+número de entidades, y volcar cada frame a disco en CSV, JSON Lines o JSON.
+
+Desactivado, cada marca es una comprobación de atributo y un return.
+'''
+
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+from src.text_manager import obtener_fuente
+
+FASES = ("eventos", "jugador", "powerups", "enemigos", "balas_enemigas", "jefe", "colisiones", "dibujo", "overlay", "flip")
+CONTEOS = ("enemies", "enemy_bullets", "boss_bullets", "player_bullets", "powerups", "pares_candidatos", "celdas_ocupadas", "pixeles_pct", "envios_dibujo", "vaciados_dibujo", "voces_descartadas", "voces_robadas")
+
+class ExportadorFrames:
+    '''
+    Escribe una fila por frame en un archivo según su extensión: CSV, JSON Lines
+    (.jsonl, un objeto por línea) o JSON (.json, un array que se cierra en cerrar()).
+
+    Atributos:
+        ruta (str): Archivo de destino.
+        filas (int): Frames escritos.
+    '''
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.filas = 0
+        self.archivo = open(ruta, "w", newline="")
+        self.json = ruta.endswith(".jsonl") or ruta.endswith(".json")
+        self.array = ruta.endswith(".json")
+        if self.array:
+            self.archivo.write("[\n")
+        elif not self.json:
+            self.writer = csv.writer(self.archivo)
+            self.writer.writerow(("frame", "total_ms") + tuple(f"{fase}_ms" for fase in FASES) + CONTEOS)
+
+    def escribir(self, numero, datos):
+        '''
+        Añade un frame al archivo.
+
+        Args:
+            numero (int): Número de frame.
+            datos (dict): Frame medido por FrameProfiler ("total", "fases", "conteos").
+        '''
+        fases = datos["fases"]
+        conteos = datos["conteos"]
+        if self.json:
+            if self.array and self.filas:
+                self.archivo.write(",\n")
+            self.archivo.write(json.dumps({"frame": numero, **datos}))
+            if not self.array:
+                self.archivo.write("\n")
+        else:
+            self.writer.writerow(
+                (numero, round(datos["total"], 4))
+                + tuple(round(fases.get(fase, 0.0), 4) for fase in FASES)
+                + tuple(conteos.get(clave, 0) for clave in CONTEOS)
+            )
+        self.filas += 1
+
+    def cerrar(self):
+        if self.array:
+            self.archivo.write("\n]\n")
+        self.archivo.close()
+
+class FrameProfiler:
+    '''
+    Mide el tiempo de cada fase del frame.
+
+    Atributos:
+        activo (bool): Si se está midiendo.
+        mostrar_overlay (bool): Si se dibuja el overlay.
+        frames (collections.deque): Últimos frames medidos (buffer circular).
+        exportador (ExportadorFrames): Destino de la exportación continua o None.
+        numero_frame (int): Frames medidos desde que se activó.
+    '''
+    def __init__(self, capacidad=120):
+        self.activo = False
+        self.mostrar_overlay = False
+        self.frames = deque(maxlen=capacidad)
+        self.exportador = None
+        self.numero_frame = 0
+        self._actual = None
+        self._inicio = 0.0
+        self._ultimo = 0.0
+        self._fuente = None
+
+    def activar(self, activo=True):
+        '''
+        Activa o desactiva la medición. Al desactivar se deja de exportar.
+        '''
+        self.activo = activo
+        if not activo:
+            self._actual = None
+            self.detener_exportacion()
+
+    def alternar_overlay(self):
+        '''
+        Muestra u oculta el overlay; mostrarlo activa la medición.
+        '''
+        self.mostrar_overlay = not self.mostrar_overlay
+        if self.mostrar_overlay:
+            self.activar(True)
+        elif self.exportador is None:
+            self.activar(False)
+
+    def exportar(self, ruta):
+        '''
+        Empieza a volcar cada frame medido al archivo indicado.
+        '''
+        self.detener_exportacion()
+        self.activar(True)
+        self.exportador = ExportadorFrames(ruta)
+
+    def detener_exportacion(self):
+        '''
+        Cierra el archivo de exportación si hay uno abierto.
+        '''
+        if self.exportador:
+            self.exportador.cerrar()
+            self.exportador = None
+
+    def alternar_exportacion(self, ruta):
+        '''
+        Empieza a exportar a `ruta` o, si ya se estaba exportando, se detiene.
+        '''
+        if self.exportador is None:
+            self.exportar(ruta)
+            return
+        self.detener_exportacion()
+        if not self.mostrar_overlay:
+            self.activar(False)
+
+    def iniciar_frame(self):
+        '''
+        Marca el comienzo de un frame.
+        '''
+        if not self.activo:
+            return
+        ahora = time.perf_counter()
+        self._inicio = self._ultimo = ahora
+        self._actual = {}
+
+    def marca(self, fase):
+        '''
+        Asigna a `fase` el tiempo transcurrido desde la marca anterior.
+
+        Args:
+            fase (str): Nombre de la fase que acaba de terminar.
+        '''
+        if self._actual is None:
+            return
+        ahora = time.perf_counter()
+        self._actual[fase] = self._actual.get(fase, 0.0) + (ahora - self._ultimo) * 1000
+        self._ultimo = ahora
+
+    def terminar_frame(self, conteos=None):
+        '''
+        Cierra el frame, lo guarda en el buffer y lo exporta si corresponde.
+
+        Args:
+            conteos (dict): Número de entidades vivas por tipo.
+        '''
+        if self._actual is None:
+            return
+        datos = {
+            "total": (time.perf_counter() - self._inicio) * 1000,
+            "fases": self._actual,
+            "conteos": conteos or {}
+        }
+        self.frames.append(datos)
+        self.numero_frame += 1
+        if self.exportador:
+            self.exportador.escribir(self.numero_frame, datos)
+        self._actual = None
+
+    def promedios(self):
+        '''
+        Returns:
+            dict: Milisegundos medios por fase (y "total") en los frames del buffer.
+        '''
+        if not self.frames:
+            return {}
+        suma = {}
+        for datos in self.frames:
+            for fase, ms in datos["fases"].items():
+                suma[fase] = suma.get(fase, 0.0) + ms
+            suma["total"] = suma.get("total", 0.0) + datos["total"]
+        return {fase: ms / len(self.frames) for fase, ms in suma.items()}
+
+    def dibujar_overlay(self, surface):
+        '''
+        Dibuja los tiempos medios por fase y el número de entidades del último frame.
+
+        Args:
+            surface (pygame.Surface): Superficie de destino.
+        Returns:
+            pygame.Rect: Zona dibujada, o None si el overlay está oculto.
+        '''
+        if not self.mostrar_overlay or not self.frames:
+            return None
+        if self._fuente is None:
+            self._fuente = obtener_fuente(None, 18)
+        promedios = self.promedios()
+        lineas = [f"frame {promedios.get('total', 0.0):6.2f} ms"]
+        lineas += [f"{fase:<15}{promedios[fase]:6.2f}" for fase in FASES if fase in promedios]
+        lineas += [f"{clave:<15}{valor:6d}" for clave, valor in self.frames[-1]["conteos"].items()]
+        if self.exportador:
+            lineas.append(f"REC {self.exportador.filas}")
+
+        alto_linea = self._fuente.get_linesize()
+        fondo = pygame.Surface((170, alto_linea * len(lineas) + 8), pygame.SRCALPHA)
+        fondo.fill((0, 0, 0, 160))
+        for i, linea in enumerate(lineas):
+            fondo.blit(self._fuente.render(linea, True, (0, 255, 0)), (4, 4 + i * alto_linea))
+        return surface.blit(fondo, (surface.get_width() - fondo.get_width() - 40, 60))
@@ -0,0 +1,142 @@
+# src/render_queue.py
+
+'''
+Cola de dibujado por capas.
+
+Durante el frame las entidades no se dibujan directamente: se encolan como pares
+(superficie, posición) en su capa, sueltos o en lotes. Al final, ColaDibujo.vaciar()
+recorre las capas en orden y envía cada una con una sola llamada a Surface.blits, de
+modo que el coste por llamada de pygame se paga una vez por capa en lugar de una vez
+por sprite o por grupo. Los lotes se encadenan sin copiarlos a una lista; solo si se
+pide ordenar por superficie de origen (COLA_ORDENAR_FUENTE) se materializa la capa.
+'''
+
+from itertools import chain
+
+from src.config import COLA_ORDENAR_FUENTE
+
+# Capas, de la de más atrás a la de más adelante
+CAPA_FONDO = 0
+CAPA_JUGADOR = 1
+CAPA_POWERUPS = 2
+CAPA_BALAS_JUGADOR = 3
+CAPA_ENEMIGOS = 4
+CAPA_JEFE = 5
+CAPA_BALAS_JEFE = 6
+CAPA_BALAS_ENEMIGAS = 7
+CAPA_HUD = 8
+CAPA_AVISOS = 9
+NUM_CAPAS = 10
+
+def _fuente(elemento):
+    return id(elemento[0])
+
+class _VistaCapa:
+    '''
+    Superficie falsa que encola en una capa los blits de un método draw existente
+    (HUD y escudo del jugador) en lugar de dibujarlos.
+    '''
+    def __init__(self, cola, capa):
+        self.cola = cola
+        self.capa = capa
+
+    def blit(self, imagen, posicion):
+        self.cola.encolar(imagen, posicion, self.capa)
+
+    def blits(self, secuencia, doreturn=True):
+        self.cola.encolar_lote(secuencia, self.capa)
+
+class ColaDibujo:
+    '''
+    Cola de blits agrupada por capas.
+
+    Atributos:
+        capas (list): Por capa, la lista de lotes de pares (superficie, posición) encolados.
+        ordenar (bool): Si cada capa se ordena por superficie de origen antes de enviarla.
+        envios (int): Elementos encolados en el frame en curso.
+        vaciados (int): Llamadas a Surface.blits en el frame en curso.
+        ultimo (dict): Envíos y vaciados del último frame enviado.
+        frames (int): Frames enviados.
+    '''
+    def __init__(self, ordenar=COLA_ORDENAR_FUENTE):
+        self.capas = [[] for _ in range(NUM_CAPAS)]
+        self.vistas = [_VistaCapa(self, capa) for capa in range(NUM_CAPAS)]
+        self.ordenar = ordenar
+        self.envios = 0
+        self.vaciados = 0
+        self.ultimo = {"envios": 0, "vaciados": 0}
+        self.frames = 0
+
+    def encolar(self, imagen, posicion, capa):
+        '''
+        Encola un blit.
+
+        Args:
+            imagen (pygame.Surface): Superficie de origen.
+            posicion (tuple | pygame.Rect): Esquina superior izquierda de destino.
+            capa (int): Capa de dibujo (CAPA_*).
+        '''
+        self.capas[capa].append(((imagen, posicion),))
+        self.envios += 1
+
+    def encolar_lote(self, secuencia, capa, cantidad=None):
+        '''
+        Encola varios blits de una vez. La secuencia no se recorre hasta vaciar la cola.
+
+        Args:
+            secuencia (iterable): Pares (superficie, posición).
+            capa (int): Capa de dibujo (CAPA_*).
+            cantidad (int): Número de pares; None para usar len(secuencia).
+        '''
+        self.capas[capa].append(secuencia)
+        self.envios += len(secuencia) if cantidad is None else cantidad
+
+    def encolar_sprites(self, sprites, capa):
+        '''
+        Encola la imagen de cada sprite en su rectángulo.
+
+        Args:
+            sprites (pygame.sprite.Group | list): Sprites a dibujar.
+            capa (int): Capa de dibujo (CAPA_*).
+        '''
+        if sprites:
+            self.encolar_lote(((sprite.image, sprite.rect) for sprite in sprites), capa, len(sprites))
+
+    def vista(self, capa):
+        '''
+        Returns:
+            _VistaCapa: Objeto con blit/blits que encola en `capa`, para los métodos
+                draw que reciben una superficie.
+        '''
+        return self.vistas[capa]
+
+    def vaciar(self, superficie):
+        '''
+        Dibuja las capas en orden con un Surface.blits por capa y deja la cola vacía.
+
+        Args:
+            superficie (pygame.Surface): Superficie de destino.
+        '''
+        for lotes in self.capas:
+            if not lotes:
+                continue
+            if self.ordenar:
+                secuencia = sorted(chain.from_iterable(lotes), key=_fuente)
+            elif len(lotes) == 1:
+                secuencia = lotes[0]
+            else:
+                secuencia = chain.from_iterable(lotes)
+            superficie.blits(secuencia, doreturn=False)
+            self.vaciados += 1
+            lotes.clear()
+        self.ultimo = {"envios": self.envios, "vaciados": self.vaciados}
+        self.envios = 0
+        self.vaciados = 0
+        self.frames += 1
+
+    def estadisticas(self):
+        '''
+        Returns:
+            dict: Envíos y vaciados del último frame.
+        '''
+        return dict(self.ultimo)
@@ -0,0 +1,297 @@
+# src/renderer.py
+
+'''
+Pase de dibujado de una partida.
+
+Renderer dibuja el estado de una GameSession en una superficie: fondo con scroll,
+entidades, HUD y la alerta del jefe. La simulación no depende de él, por lo que las
+ejecuciones sin pantalla pueden omitirlo.
+
+Con alpha < 1 las entidades se dibujan interpoladas entre su posición al inicio del
+último tick (GameSession.anteriores) y la actual, de modo que el movimiento se ve
+suave aunque se dibujen más frames que ticks de simulación.
+
+Nada se dibuja directamente: fondo, entidades, HUD y avisos se encolan por capas en
+una ColaDibujo y se envían al final del frame con un Surface.blits por capa.
+
+DirtyRenderer es un modo alternativo de rectángulos sucios: en lugar de repintar y
+enviar la ventana entera, restaura el fondo solo donde se dibujó en el frame anterior
+y envía con pygame.display.update() únicamente las zonas modificadas. Su fondo es fijo:
+un fondo con scroll cambia toda la ventana en cada tick y no dejaría nada que ahorrar.
+'''
+
+import pygame
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DIRTY_UMBRAL, DIRTY_SCROLL_FONDO
+from src.sprite_manager import obtener_escalado
+from src.bullet_engine import BulletEngine
+from src.text_manager import renderizar
+from src.hud import HUD
+from src.render_queue import (
+    ColaDibujo, CAPA_FONDO, CAPA_JUGADOR, CAPA_POWERUPS, CAPA_BALAS_JUGADOR, CAPA_ENEMIGOS,
+    CAPA_JEFE, CAPA_BALAS_JEFE, CAPA_BALAS_ENEMIGAS, CAPA_HUD, CAPA_AVISOS
+)
+
+FUENTE_AVISOS = "assets/fonts/airstrike.ttf"
+FONDO_JUEGO = "assets/bg/Background_Full-0001.png"
+
+class Renderer:
+    '''
+    Dibuja una GameSession.
+
+    Atributos:
+        fondo (pygame.Surface): Fondo del juego escalado a la pantalla.
+        scroll (int): Desplazamiento vertical actual del fondo.
+        ultimo_tick (int): Último GameSession.frame dibujado; el fondo avanza por tick.
+        porcentaje_pixeles (float): Porcentaje de la ventana enviado en el último frame.
+        hud (HUD): Compositor del HUD.
+        cola (ColaDibujo): Cola de blits del frame.
+    '''
+    def __init__(self):
+        self.fondo = obtener_escalado(FONDO_JUEGO, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+        self.scroll = 0
+        self.ultimo_tick = None
+        self.porcentaje_pixeles = 100.0
+        self.hud = HUD()
+        self.cola = ColaDibujo()
+
+    def draw(self, screen, session, alpha=1.0):
+        '''
+        Dibuja un frame completo de la partida.
+
+        Args:
+            screen (pygame.Surface): Superficie de destino.
+            session (GameSession): Partida a dibujar.
+            alpha (float): Fracción del tick transcurrida desde el último paso de simulación.
+        '''
+        scroll = self.avanzar_fondo(session, alpha)
+        self.cola.encolar(self.fondo, (0, scroll - SCREEN_HEIGHT), CAPA_FONDO)
+        self.cola.encolar(self.fondo, (0, scroll), CAPA_FONDO)
+        self.dibujar_escena(screen, session, alpha)
+
+    def presentar(self):
+        '''
+        Envía el frame a la ventana.
+        '''
+        pygame.display.flip()
+
+    def invalidar(self, rect=None):
+        '''
+        Avisa de que se dibujó fuera del renderer (overlay, menús). Sin efecto al
+        enviar siempre la ventana completa.
+        '''
+
+    def avanzar_fondo(self, session, alpha=1.0):
+        '''
+        Avanza el scroll del fondo según los ticks simulados desde el último dibujo.
+
+        Returns:
+            int: Desplazamiento vertical del fondo interpolado para este frame.
+        '''
+        velocidad = 6 if not session.player.charge_status else 3  # velocidad del fondo (ajustable)
+        ticks = 1 if self.ultimo_tick is None else max(0, session.frame - self.ultimo_tick)
+        self.ultimo_tick = session.frame
+        self.scroll = (self.scroll + velocidad * ticks) % SCREEN_HEIGHT
+        return int(self.scroll - velocidad * (1 - alpha)) % SCREEN_HEIGHT
+
+    def dibujar_escena(self, screen, session, alpha=1.0):
+        '''
+        Encola entidades, HUD y alerta y envía la cola (con el fondo, si se encoló) a `screen`.
+        '''
+        player = session.player
+        cola = self.cola
+
+        # Encolar objetos del juego ------------------------------------------------
+        anteriores = session.anteriores if alpha < 1.0 else None
+        self._encolar(cola, [player], anteriores, alpha, CAPA_JUGADOR)
+        self._encolar(cola, session.powerups, anteriores, alpha, CAPA_POWERUPS)
+        self._encolar(cola, player.bullets, anteriores, alpha, CAPA_BALAS_JUGADOR)
+        self._encolar(cola, session.enemies, anteriores, alpha, CAPA_ENEMIGOS)
+        for jefe in session.boss_group:
+            self._encolar(cola, [jefe], anteriores, alpha, CAPA_JEFE)
+            self._encolar(cola, jefe.bullets, anteriores, alpha, CAPA_BALAS_JEFE)
+        self._encolar(cola, session.enemy_bullets, anteriores, alpha, CAPA_BALAS_ENEMIGAS)
+
+        # Encolar HUD y puntuación ------------------------------------------------
+        self.hud.draw(cola.vista(CAPA_HUD), player, session.score_manager.score)
+
+        # Mostrar alerta de jefe si corresponde --------------------------------
+        if session.mostrar_alerta_boss:
+            alerta_text = renderizar(FUENTE_AVISOS, 30, "¡ALERTA!", (255, 100, 50))
+            cola.encolar(alerta_text, (int(SCREEN_WIDTH * 0.35), int(SCREEN_HEIGHT * 0.5)), CAPA_AVISOS)
+
+        cola.vaciar(screen)
+
+    def _encolar(self, cola, contenedor, anteriores, alpha, capa):
+        '''
+        Encola un grupo de sprites o un BulletEngine. Con `anteriores` los sprites se
+        colocan entre su posición guardada y la actual; los que no tienen posición
+        guardada (creados en el último tick) se dibujan donde están.
+        '''
+        if isinstance(contenedor, BulletEngine):
+            if contenedor.n:
+                cola.encolar_lote(contenedor.batch(alpha), capa, contenedor.n)
+            return
+        if not anteriores:
+            cola.encolar_sprites(contenedor, capa)
+            return
+        lote = []
+        for sprite in contenedor:
+            x, y = sprite.rect.topleft
+            previa = anteriores.get(sprite)
+            if previa is not None:
+                x = int(previa[0] + (x - previa[0]) * alpha)
+                y = int(previa[1] + (y - previa[1]) * alpha)
+            lote.append((sprite.image, (x, y)))
+        cola.encolar_lote(lote, capa)
+
+    def draw_fase_completada(self, screen, fase):
+        '''
+        Muestra los mensajes de fase completada y de inicio de la siguiente fase.
+
+        Args:
+            screen (pygame.Surface): Superficie de destino.
+            fase (int): Fase que comienza.
+        '''
+        texto = renderizar(FUENTE_AVISOS, 30, "¡Fase Completada!", (0, 255, 0))
+        screen.blit(texto, (100, 300))
+        pygame.display.flip()
+        pygame.time.delay(2000)
+        screen.fill((0, 0, 0))  # Limpiar pantalla
+        texto_fase = renderizar(FUENTE_AVISOS, 30, f"Fase {fase} Comienza", (255, 255, 0))
+        screen.blit(texto_fase, (SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT // 2 - 20))
+        pygame.display.flip()
+        pygame.time.delay(2000)
+
+class _RegistroBlits:
+    '''
+    Envuelve una superficie y anota el rectángulo afectado por cada blit, de modo que
+    los métodos de dibujo existentes (grupos, HUD del jugador, BulletEngine) informan
+    de lo que pintan sin cambiarlos.
+    '''
+    def __init__(self, superficie, rects):
+        self.superficie = superficie
+        self.rects = rects
+
+    def blit(self, fuente, destino, area=None, special_flags=0):
+        rect = self.superficie.blit(fuente, destino, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(self, secuencia, doreturn=True):
+        rects = self.superficie.blits(secuencia, doreturn=True)
+        self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def __getattr__(self, nombre):
+        return getattr(self.superficie, nombre)
+
+class DirtyRenderer(Renderer):
+    '''
+    Renderer de rectángulos sucios.
+
+    Cada frame restaura el fondo bajo lo que se dibujó en el frame anterior, dibuja la
+    escena anotando los rectángulos y envía solo la unión de ambas listas. El fondo no
+    se desplaza: es el comportamiento propio de este modo (con scroll, crear_renderer
+    usa Renderer). Si la zona sucia supera el umbral se envía la ventana completa con flip().
+
+    Atributos:
+        umbral (float): Fracción de la ventana a partir de la cual se hace flip().
+        previos (list): Rectángulos dibujados en el frame anterior.
+        area_previos (int): Suma de sus áreas (cota superior de la zona a restaurar).
+        pendientes (list): Rectángulos a enviar en este frame; None para la ventana entera.
+        frames (int): Frames presentados.
+        frames_completos (int): Frames enviados con flip().
+        pixeles_enviados (int): Píxeles enviados en total.
+    '''
+    def __init__(self, umbral=DIRTY_UMBRAL):
+        super().__init__()
+        self.umbral = umbral
+        self.previos = []
+        self.area_previos = 0
+        self.pendientes = None
+        self.completo = True
+        self.frames = 0
+        self.frames_completos = 0
+        self.pixeles_enviados = 0
+
+    def draw(self, screen, session, alpha=1.0):
+        '''
+        Dibuja el frame repintando solo las zonas que cambiaron.
+        '''
+        rects = []
+        registro = _RegistroBlits(screen, rects)
+        if self.completo or self.area_previos > SCREEN_WIDTH * SCREEN_HEIGHT * self.umbral:
+            # Con tanta zona sucia un único blit del fondo sale más barato que restaurar por partes
+            screen.blit(self.fondo, (0, 0))
+            self.dibujar_escena(registro, session, alpha)
+            self.completo = True
+        else:
+            fondo = self.fondo
+            screen.blits([(fondo, rect, rect) for rect in self.previos], doreturn=False)  # Restaurar el fondo donde hubo sprites
+            self.dibujar_escena(registro, session, alpha)
+
+        self.pendientes = None if self.completo else self.previos + rects
+        self.previos = rects
+        self.area_previos = sum(rect.w * rect.h for rect in rects)
+        self.completo = False
+
+    def invalidar(self, rect=None):
+        '''
+        Añade al frame una zona dibujada fuera del renderer, o fuerza un repintado
+        completo en el próximo frame si no se indica zona (tras menús o mensajes).
+
+        Args:
+            rect (pygame.Rect): Zona modificada.
+        '''
+        if rect is None:
+            self.completo = True
+            return
+        self.previos.append(rect)
+        self.area_previos += rect.w * rect.h
+        if self.pendientes is not None:
+            self.pendientes.append(rect)
+
+    def presentar(self):
+        '''
+        Envía las zonas sucias o, si ocupan más que el umbral, la ventana entera.
+        '''
+        total = SCREEN_WIDTH * SCREEN_HEIGHT
+        enviados = total
+        if self.pendientes is not None:
+            enviados = min(total, sum(rect.w * rect.h for rect in self.pendientes))
+        if self.pendientes is None or enviados > total * self.umbral:
+            pygame.display.flip()
+            enviados = total
+            self.frames_completos += 1
+        else:
+            pygame.display.update(self.pendientes)
+        self.frames += 1
+        self.pixeles_enviados += enviados
+        self.porcentaje_pixeles = enviados / total * 100
+
+    def estadisticas(self):
+        '''
+        Returns:
+            dict: Frames presentados, cuántos fueron completos y porcentaje medio de píxeles enviados.
+        '''
+        total = SCREEN_WIDTH * SCREEN_HEIGHT
+        return {
+            "frames": self.frames,
+            "frames_completos": self.frames_completos,
+            "porcentaje_medio": self.pixeles_enviados / (total * self.frames) * 100 if self.frames else 0.0,
+            "porcentaje_ultimo": self.porcentaje_pixeles
+        }
+
+def crear_renderer(modo, desplazar_fondo=DIRTY_SCROLL_FONDO):
+    '''
+    Crea el renderer del modo indicado ("completo" o "dirty").
+
+    Args:
+        modo (str): "completo" o "dirty".
+        desplazar_fondo (bool): Si en modo "dirty" se quiere el fondo con scroll. Como
+            ensucia la ventana entera en cada tick, entonces se usa Renderer.
+    '''
+    if modo == "dirty" and not desplazar_fondo:
+        return DirtyRenderer()
+    return Renderer()
@@ -0,0 +1,205 @@
+# src/replay.py
+
+'''
+Grabación y reproducción de partidas.
+
+Una repetición guarda la semilla, el estado inicial (fase, fases desbloqueadas y
+backend de balas) y un byte por tick con las entradas del jugador (flechas, Z, X y C),
+comprimido con zlib. Como la simulación solo depende de la semilla y de las entradas,
+reproducirla da exactamente la misma partida. Al guardar se añade una huella del
+estado final, que reproducir() comprueba: así una repetición sirve de carga de
+rendimiento repetible y de prueba de regresión.
+
+Uso:
+    python -m src.replay ultima_partida.rep
+'''
+
+import argparse
+import hashlib
+import struct
+import sys
+import zlib
+
+from src.game_session import iniciar_headless, GameSession, Entradas
+from src.score_manager import ScoreManager
+from src.bullet_engine import BulletEngine
+
+ULTIMA_PARTIDA = "ultima_partida.rep"
+FIRMA = b"GBRP"
+VERSION = 2  # 2: enemigos por oleadas (wave_scheduler)
+BACKENDS = ("sprites", "numpy")
+_CABECERA = struct.Struct("<4sHQHBH")  # firma, versión, semilla, fase, backend, n fases desbloqueadas
+_BITS = ("izquierda", "derecha", "arriba", "abajo", "disparar", "dash", "sobrecarga")
+
+def codificar_entradas(entradas):
+    '''
+    Returns:
+        int: Las entradas de un tick empaquetadas en un byte (un bit por tecla).
+    '''
+    byte = 0
+    for bit, nombre in enumerate(_BITS):
+        if getattr(entradas, nombre):
+            byte |= 1 << bit
+    return byte
+
+def decodificar_entradas(byte):
+    '''
+    Returns:
+        Entradas: Entradas de un tick a partir de su byte.
+    '''
+    return Entradas(*(bool(byte >> bit & 1) for bit in range(len(_BITS))))
+
+def huella(session):
+    '''
+    Resumen del estado de una partida: puntuación, vida, tick y posición de todas las
+    entidades. Dos ejecuciones con la misma huella llegaron al mismo estado.
+
+    Returns:
+        str: Hash SHA-1 en hexadecimal.
+    '''
+    h = hashlib.sha1()
+    player = session.player
+    h.update(repr((session.frame, session.fase_actual, session.score_manager.score, player.health,
+                   tuple(player.rect), player.charge)).encode())
+    grupos = [player.bullets, session.powerups, session.enemies, session.boss_group]
+    contenedores = [session.enemy_bullets] + [jefe.bullets for jefe in session.boss_group]
+    for grupo in grupos:
+        h.update(repr([tuple(sprite.rect) for sprite in grupo]).encode())
+    for contenedor in contenedores:
+        if isinstance(contenedor, BulletEngine):
+            h.update(contenedor.x[:contenedor.n].tobytes())
+            h.update(contenedor.y[:contenedor.n].tobytes())
+        else:
+            h.update(repr([tuple(sprite.rect) for sprite in contenedor]).encode())
+    return h.hexdigest()
+
+class Repeticion:
+    '''
+    Semilla, estado inicial y entradas por tick de una partida.
+
+    Atributos:
+        semilla (int): Semilla del generador de la partida.
+        fase (int): Fase inicial.
+        fases_desbloqueadas (list): Fases desbloqueadas al empezar.
+        backend (str): Backend de balas con el que se grabó.
+        entradas (bytearray): Un byte por tick.
+        huella (str): Huella del estado final ("" si no se conoce).
+    '''
+    def __init__(self, semilla, fase, fases_desbloqueadas, backend, entradas=None, huella=""):
+        self.semilla = semilla
+        self.fase = fase
+        self.fases_desbloqueadas = list(fases_desbloqueadas)
+        self.backend = backend
+        self.entradas = bytearray(entradas or b"")
+        self.huella = huella
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __iter__(self):
+        for byte in self.entradas:
+            yield decodificar_entradas(byte)
+
+    def guardar(self, ruta):
+        '''
+        Escribe la repetición en un archivo binario.
+        '''
+        fases = self.fases_desbloqueadas
+        huella = self.huella.encode()
+        with open(ruta, "wb") as f:
+            f.write(_CABECERA.pack(FIRMA, VERSION, self.semilla, self.fase, BACKENDS.index(self.backend), len(fases)))
+            f.write(struct.pack(f"<{len(fases)}H", *fases))
+            f.write(struct.pack("<B", len(huella)) + huella)
+            f.write(zlib.compress(bytes(self.entradas), 9))
+
+    @classmethod
+    def cargar(cls, ruta):
+        '''
+        Lee una repetición guardada con guardar().
+
+        Raises:
+            ValueError: Si el archivo no es una repetición o es de otra versión.
+        '''
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        firma, version, semilla, fase, backend, n = _CABECERA.unpack_from(datos)
+        if firma != FIRMA or version != VERSION:
+            raise ValueError(f"{ruta} no es una repetición compatible")
+        desplazamiento = _CABECERA.size
+        fases = struct.unpack_from(f"<{n}H", datos, desplazamiento)
+        desplazamiento += 2 * n
+        longitud = datos[desplazamiento]
+        huella = datos[desplazamiento + 1:desplazamiento + 1 + longitud].decode()
+        entradas = zlib.decompress(datos[desplazamiento + 1 + longitud:])
+        return cls(semilla, fase, fases, BACKENDS[backend], entradas, huella)
+
+class GrabadorEntradas:
+    '''
+    Graba las entradas de una partida desde que empieza.
+
+    Atributos:
+        repeticion (Repeticion): Repetición en curso.
+    '''
+    def __init__(self, session):
+        self.repeticion = Repeticion(session.reloj.semilla, session.fase_actual, session.fases_desbloqueadas, session.backend)
+
+    def registrar(self, entradas):
+        '''
+        Añade las entradas de un tick.
+        '''
+        self.repeticion.entradas.append(codificar_entradas(entradas))
+
+    def guardar(self, ruta, session=None):
+        '''
+        Escribe la repetición; con `session` guarda también la huella del estado final.
+        '''
+        if session is not None:
+            self.repeticion.huella = huella(session)
+        self.repeticion.guardar(ruta)
+
+def preparar_sesion(repeticion, session):
+    '''
+    Deja una partida en el estado inicial de una repetición (semilla, fases y fase).
+    '''
+    session.sembrar(repeticion.semilla)
+    session.fases_desbloqueadas = list(repeticion.fases_desbloqueadas)
+    session.continuar(repeticion.fase)
+
+def reproducir(repeticion, backend=None):
+    '''
+    Reproduce una repetición sin pantalla. Tras un game over se reinicia la partida,
+    como hace el bucle principal al elegir reintentar.
+
+    Args:
+        repeticion (Repeticion): Repetición a reproducir.
+        backend (str): Backend de balas; None usa el de la grabación.
+    Returns:
+        GameSession: La partida en su estado final.
+    '''
+    iniciar_headless()
+    session = GameSession(ScoreManager(None), backend=backend or repeticion.backend)
+    preparar_sesion(repeticion, session)
+    for entradas in repeticion:
+        if session.game_over:
+            session.reiniciar()
+        session.step(entradas)
+    return session
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce una partida grabada de Galaxy Blast")
+    parser.add_argument("archivo", nargs="?", default=ULTIMA_PARTIDA)
+    parser.add_argument("--backend", choices=BACKENDS, help="Backend de balas (por defecto el de la grabación)")
+    args = parser.parse_args(argv)
+
+    repeticion = Repeticion.cargar(args.archivo)
+    session = reproducir(repeticion, args.backend)
+    resultado = huella(session)
+    print(f"{len(repeticion)} ticks, semilla {repeticion.semilla}, fase {session.fase_actual}, "
+          f"puntaje {session.score_manager.score}, huella {resultado}")
+    if repeticion.huella and resultado != repeticion.huella:
+        print(f"DIVERGENCIA: la grabación terminó con huella {repeticion.huella}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,228 @@
 import json
 import os
+import struct
+import zlib
 
-SAVE_FILE = "save_data.json"
+SAVE_FILE = "save_data.dat"
+LEGACY_SAVE_FILE = "save_data.json"  # Formato anterior (versión 0), se migra al cargar
+
+# Formato binario --------------------------------------------------------------------------------
+# Cabecera: firma, versión, longitud y CRC32 del contenido. El contenido (versión 1) es:
+#   fase_actual (H), n fases desbloqueadas (H) + n x fase (H),
+#   n estadísticas (H) + n x (fase H, mejor puntaje I, mejor tiempo ms I, intentos I, completadas I)
+FIRMA = b"GBSV"
+VERSION = 1
+_CABECERA = struct.Struct("<4sHII")
+_ESTADISTICA = struct.Struct("<HIIII")
+_CAMPOS_ESTADISTICA = ("mejor_puntaje", "mejor_tiempo_ms", "intentos", "completadas")
+
+class SaveCorrupto(ValueError):
+    '''
+    El archivo de guardado no tiene la firma esperada o su CRC no coincide.
+    '''
+
+def _datos_vacios():
+    return {"fase_actual": 1, "fases_desbloqueadas": [1], "estadisticas": {}}
+
+def _migrar_0_a_1(datos):
+    '''
+    Versión 0 (JSON): solo fase actual y fases desbloqueadas. Añade estadísticas vacías.
+    '''
+    return {
+        "fase_actual": datos.get("fase_actual", 1),
+        "fases_desbloqueadas": list(datos.get("fases_desbloqueadas", [1])),
+        "estadisticas": {}
+    }
+
+# Migración que lleva los datos de la versión n a la n + 1
+MIGRACIONES = {0: _migrar_0_a_1}
+
+def migrar(datos, version):
+    '''
+    Aplica en orden las migraciones desde `version` hasta VERSION.
+
+    Args:
+        datos (dict): Datos decodificados en el formato de `version`.
+        version (int): Versión de origen.
+    Returns:
+        dict: Datos en el formato actual.
+    '''
+    while version < VERSION:
+        datos = MIGRACIONES[version](datos)
+        version += 1
+    return datos
+
+def codificar(datos):
+    '''
+    Codifica los datos en el formato binario actual, con cabecera.
+
+    Returns:
+        bytes: Contenido del archivo.
+    '''
+    fases = datos["fases_desbloqueadas"]
+    estadisticas = datos["estadisticas"]
+    partes = [struct.pack("<HH", datos["fase_actual"], len(fases)), struct.pack(f"<{len(fases)}H", *fases)]
+    partes.append(struct.pack("<H", len(estadisticas)))
+    for fase in sorted(estadisticas):
+        fila = estadisticas[fase]
+        partes.append(_ESTADISTICA.pack(fase, *(fila[campo] for campo in _CAMPOS_ESTADISTICA)))
+    contenido = b"".join(partes)
+    return _CABECERA.pack(FIRMA, VERSION, len(contenido), zlib.crc32(contenido)) + contenido
+
+def decodificar(binario):
+    '''
+    Valida la cabecera y decodifica el contenido, migrándolo si es de una versión anterior.
+
+    Args:
+        binario (bytes): Contenido del archivo.
+    Returns:
+        dict: Datos en el formato actual.
+    Raises:
+        SaveCorrupto: Si la firma, la longitud o el CRC no son válidos.
+    '''
+    if len(binario) < _CABECERA.size:
+        raise SaveCorrupto("archivo truncado")
+    firma, version, longitud, crc = _CABECERA.unpack_from(binario)
+    contenido = binario[_CABECERA.size:_CABECERA.size + longitud]
+    if firma != FIRMA or len(contenido) != longitud or zlib.crc32(contenido) != crc:
+        raise SaveCorrupto("firma o CRC no válidos")
+    if version > VERSION:
+        raise SaveCorrupto(f"versión {version} más nueva que la soportada ({VERSION})")
+
+    fase_actual, n = struct.unpack_from("<HH", contenido)
+    desplazamiento = 4
+    fases = list(struct.unpack_from(f"<{n}H", contenido, desplazamiento))
+    desplazamiento += 2 * n
+    (n,) = struct.unpack_from("<H", contenido, desplazamiento)
+    desplazamiento += 2
+    estadisticas = {}
+    for _ in range(n):
+        fase, *valores = _ESTADISTICA.unpack_from(contenido, desplazamiento)
+        estadisticas[fase] = dict(zip(_CAMPOS_ESTADISTICA, valores))
+        desplazamiento += _ESTADISTICA.size
+    datos = {"fase_actual": fase_actual, "fases_desbloqueadas": fases, "estadisticas": estadisticas}
+    return migrar(datos, version) if version < VERSION else datos
 
 class SaveManager:
     '''
     Clase para manejar el guardado y carga de datos del juego.
-    Esta clase permite guardar el estado del juego, incluyendo la fase actual y las fases desbloqueadas.
-    
+    Esta clase permite guardar el estado del juego, incluyendo la fase actual, las fases
+    desbloqueadas y las estadísticas de cada fase (mejor puntaje, mejor tiempo, intentos).
+
+    El archivo es binario y versionado (ver codificar/decodificar). Se escribe en un
+    temporal con fsync que luego reemplaza al original, conservando la versión anterior
+    como copia de seguridad (.bak) por si el archivo principal apareciera dañado. Un
+    guardado antiguo en JSON se migra automáticamente. La lectura es perezosa: el disco
+    se lee la primera vez que se consulta un dato y después se usa la copia en memoria.
+
     Atributos:
         fase_actual (int): Fase actual del juego.
         fases_desbloqueadas (list): Lista de fases desbloqueadas.
+        estadisticas (dict): Estadísticas por fase.
+        archivo (str): Ruta del archivo de guardado.
+        origen (str): De dónde salieron los datos: "archivo", "copia", "json" o "nuevo".
     '''
-    def __init__(self):
-        self.fase_actual = 1
-        self.fases_desbloqueadas = [1]
-        self.load()
+    def __init__(self, archivo=SAVE_FILE, archivo_json=LEGACY_SAVE_FILE):
+        self.archivo = archivo
+        self.archivo_json = archivo_json
+        self.origen = None
+        self._datos = None
+
+    # Datos con carga perezosa ----------------------------------------------------------------
+    @property
+    def datos(self):
+        if self._datos is None:
+            self.load()
+        return self._datos
+
+    @property
+    def fase_actual(self):
+        return self.datos["fase_actual"]
+
+    @fase_actual.setter
+    def fase_actual(self, valor):
+        self.datos["fase_actual"] = valor
+
+    @property
+    def fases_desbloqueadas(self):
+        return self.datos["fases_desbloqueadas"]
+
+    @fases_desbloqueadas.setter
+    def fases_desbloqueadas(self, valor):
+        self.datos["fases_desbloqueadas"] = valor
 
-    def load(self):
+    @property
+    def estadisticas(self):
+        return self.datos["estadisticas"]
+
+    def load(self, forzar=False):
         '''
-        Carga los datos guardados desde el archivo JSON.
-        Si el archivo no existe, se inicializan los valores por defecto.
+        Carga los datos guardados. Si ya están en memoria no vuelve a leer el disco
+        salvo que se pida con `forzar`.
+        Prueba en orden el archivo principal, su copia de seguridad y el JSON antiguo;
+        si no hay ninguno válido, se inicializan los valores por defecto.
+
+        Args:
+            forzar (bool): Releer el disco aunque haya datos en memoria.
         '''
-        if os.path.exists(SAVE_FILE):
-            with open(SAVE_FILE, "r") as f:
-                data = json.load(f)
-                self.fase_actual = data.get("fase_actual", 1)
-                self.fases_desbloqueadas = data.get("fases_desbloqueadas", [1])
+        if self._datos is not None and not forzar:
+            return
+        for ruta, origen in ((self.archivo, "archivo"), (self.archivo + ".bak", "copia")):
+            if os.path.exists(ruta):
+                try:
+                    with open(ruta, "rb") as f:
+                        self._datos = decodificar(f.read())
+                    self.origen = origen
+                    return
+                except (SaveCorrupto, struct.error):
+                    continue
+        if self.archivo_json and os.path.exists(self.archivo_json):
+            with open(self.archivo_json, "r") as f:
+                self._datos = migrar(json.load(f), 0)
+            self.origen = "json"
+            return
+        self._datos = _datos_vacios()
+        self.origen = "nuevo"
 
     def save(self):
         '''
-        Guarda el estado actual del juego en un archivo JSON.
-        Incluye la fase actual y las fases desbloqueadas.
+        Guarda el estado actual del juego de forma atómica.
+        Escribe un temporal, lo sincroniza con el disco, mueve el archivo anterior a la
+        copia de seguridad y renombra el temporal sobre el principal.
+        '''
+        binario = codificar(self.datos)
+        temporal = self.archivo + ".tmp"
+        with open(temporal, "wb") as f:
+            f.write(binario)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(self.archivo):
+            os.replace(self.archivo, self.archivo + ".bak")
+        os.replace(temporal, self.archivo)
+
+    # Estadísticas por fase ---------------------------------------------------------------------
+    def registrar_fase(self, fase, puntaje, tiempo_ms, completada):
+        '''
+        Actualiza las estadísticas de una fase al terminar un intento (no guarda en disco).
+
+        Args:
+            fase (int): Fase jugada.
+            puntaje (int): Puntaje al terminar el intento.
+            tiempo_ms (int): Duración del intento en milisegundos.
+            completada (bool): Si se derrotó al jefe de la fase.
+        '''
+        fila = self.estadisticas.setdefault(fase, dict.fromkeys(_CAMPOS_ESTADISTICA, 0))
+        fila["intentos"] += 1
+        fila["mejor_puntaje"] = max(fila["mejor_puntaje"], max(0, int(puntaje)))
+        if completada:
+            fila["completadas"] += 1
+            tiempo_ms = int(tiempo_ms)
+            if fila["mejor_tiempo_ms"] == 0 or tiempo_ms < fila["mejor_tiempo_ms"]:
+                fila["mejor_tiempo_ms"] = tiempo_ms
+
+    def estadisticas_fase(self, fase):
+        '''
+        Returns:
+            dict: Mejor puntaje, mejor tiempo (ms, 0 si nunca se completó), intentos y completadas.
         '''
-        data = {
-            "fase_actual": self.fase_actual,
-            "fases_desbloqueadas": self.fases_desbloqueadas
-        }
-        with open(SAVE_FILE, "w") as f:
-            json.dump(data, f, indent=4)
\ No newline at end of file
+        return dict(self.estadisticas.get(fase, dict.fromkeys(_CAMPOS_ESTADISTICA, 0)))
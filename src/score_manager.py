@@ -1,28 +1,46 @@
+import atexit
 import json
 import os
+import threading
+import time
 
 SCORE_FILE = "score_data.json"
+INTERVALO_GUARDADO = 2.0  # Segundos que se agrupan los cambios del récord antes de escribirlos
 
 class ScoreManager:
     '''
     Clase para manejar el puntaje del juego.
     Esta clase permite agregar puntos, resetear el puntaje y guardar el récord en un archivo JSON.
-    
+    El récord se guarda en segundo plano (write-behind): add_points solo lo marca como
+    pendiente y un hilo lo escribe pasado INTERVALO_GUARDADO, al llamar a vaciar() o al
+    cerrar. Cada escritura va a un archivo temporal que luego reemplaza al original.
+
     Atributos:
         score (int): Puntaje actual del jugador.
         highscore (int): Récord de puntaje guardado.
-        SCORE_FILE (str): Ruta del archivo donde se guarda el récord.
+        archivo (str): Ruta del archivo donde se guarda el récord (None para no persistir).
+        intervalo (float): Segundos de espera para agrupar cambios antes de escribir.
+        escrituras (int): Veces que se ha escrito el archivo.
     '''
-    def __init__(self):
+    def __init__(self, archivo=SCORE_FILE, intervalo=INTERVALO_GUARDADO):
         self.score = 0
         self.highscore = 0
+        self.archivo = archivo
+        self.intervalo = intervalo
+        self.escrituras = 0
+        self._condicion = threading.Condition()
+        self._bloqueo_archivo = threading.Lock()
+        self._pendiente = False
+        self._urgente = False
+        self._cerrando = False
+        self._hilo = None
         self.load_score()
 
     def add_points(self, amount):
         '''
         Agrega puntos al puntaje actual.
         Si el puntaje se vuelve negativo, se establece en 0.
-        Si el nuevo puntaje supera el récord, se actualiza el récord y se guarda.
+        Si el nuevo puntaje supera el récord, se actualiza el récord y se programa su guardado.
         Args:
             amount (int): Cantidad de puntos a agregar.
         '''
@@ -32,7 +50,8 @@ class ScoreManager:
             self.score += amount
         if self.score > self.highscore:
             self.highscore = self.score
-            self.save_score()
+            if not self._pendiente:
+                self._programar_guardado()
 
     def reset(self):
         '''
@@ -43,17 +62,96 @@ class ScoreManager:
     def load_score(self):
         '''
         Carga el récord de puntaje desde un archivo JSON.
-        Si el archivo no existe, se inicializa el récord a 0.
+        Si el archivo no existe, se inicializa el récord a 0. Un récord en memoria
+        todavía sin escribir no se pierde: se conserva el mayor de los dos.
         '''
-        if os.path.exists(SCORE_FILE):
-            with open(SCORE_FILE, "r") as f:
+        if self.archivo and os.path.exists(self.archivo):
+            with open(self.archivo, "r") as f:
                 data = json.load(f)
-                self.highscore = data.get("highscore", 0)
+                self.highscore = max(self.highscore, data.get("highscore", 0))
 
     def save_score(self):
         '''
-        Guarda el récord de puntaje en un archivo JSON.
+        Guarda el récord de puntaje en un archivo JSON de forma inmediata (bloqueante).
         Si el archivo no existe, se crea uno nuevo.
         '''
-        with open(SCORE_FILE, "w") as f:
-            json.dump({"highscore": self.highscore}, f)
+        if not self.archivo:
+            return
+        self._escribir()
+
+    # Guardado en segundo plano ---------------------------------------------------------------
+    def _programar_guardado(self):
+        '''
+        Marca el récord como pendiente y despierta al hilo de guardado.
+        '''
+        if not self.archivo:
+            return
+        with self._condicion:
+            self._pendiente = True
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._trabajador, name="guardado-record", daemon=True)
+                self._hilo.start()
+                atexit.register(self.cerrar)
+            self._condicion.notify()
+
+    def vaciar(self):
+        '''
+        Pide al hilo que escriba ya el récord pendiente, sin esperar al intervalo.
+        No bloquea: pensado para los cambios de fase y el game over.
+        '''
+        with self._condicion:
+            if self._pendiente:
+                self._urgente = True
+                self._condicion.notify()
+
+    def cerrar(self):
+        '''
+        Detiene el hilo de guardado y escribe el récord pendiente antes de salir.
+        '''
+        with self._condicion:
+            self._cerrando = True
+            self._condicion.notify()
+            hilo = self._hilo
+        if hilo is not None:
+            hilo.join()
+        with self._condicion:
+            pendiente, self._pendiente = self._pendiente, False
+        if pendiente:
+            self._escribir()
+
+    def _trabajador(self):
+        '''
+        Bucle del hilo: espera un cambio, agrupa los siguientes durante el intervalo
+        (o hasta que se pida vaciar) y escribe el valor más reciente.
+        '''
+        while True:
+            with self._condicion:
+                while not self._pendiente and not self._cerrando:
+                    self._condicion.wait()
+                if self._cerrando:
+                    return
+                limite = time.monotonic() + self.intervalo
+                while not self._urgente and not self._cerrando:
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        break
+                    self._condicion.wait(restante)
+                if self._cerrando:
+                    return  # cerrar() escribe lo pendiente
+                self._pendiente = False
+                self._urgente = False
+            self._escribir()
+
+    def _escribir(self):
+        '''
+        Escribe el récord actual en un archivo temporal y lo renombra sobre el
+        original, de modo que un cierre a mitad de escritura no deja el archivo corrupto.
+        '''
+        with self._bloqueo_archivo:
+            temporal = self.archivo + ".tmp"
+            with open(temporal, "w") as f:
+                json.dump({"highscore": self.highscore}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self.archivo)
+            self.escrituras += 1
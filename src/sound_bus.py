@@ -0,0 +1,156 @@
+# src/sound_bus.py
+
+'''
+Bus de efectos de sonido.
+
+Los efectos se declaran como datos en EFECTOS: archivo, categoría, volumen relativo,
+polifonía (voces simultáneas como máximo) e intervalo mínimo entre disparos. BusSonido
+recibe los sonidos ya decodificados (ver src/preloader.py), les aplica el volumen una
+sola vez y reserva para cada categoría (interfaz, armas, impactos, alertas) su propio
+grupo de canales del mezclador, de modo que una ráfaga de disparos no puede quitarle
+el canal a una alerta.
+
+reproducir() descarta el disparo si llega antes del intervalo mínimo del efecto y, si
+el efecto ya suena con todas sus voces, roba la más antigua o descarta la nueva según
+el efecto. Si la categoría no tiene canal libre se roba su voz más antigua. Así el
+número de voces que mezcla pygame está acotado aunque el combate sea denso; los
+contadores de voces descartadas y robadas van al perfilador.
+'''
+
+import pygame
+
+VOLUMEN_EFECTOS = 0.4  # Volumen general de los efectos de sonido
+
+# Canales reservados por categoría
+CATEGORIAS = {
+    "interfaz": 1,
+    "armas": 3,
+    "impactos": 2,
+    "alertas": 2
+}
+
+# Catálogo de efectos -----------------------------------------------------------------------------
+# Claves de cada efecto: ruta, categoria, volumen (relativo a VOLUMEN_EFECTOS),
+# polifonia (voces simultáneas), intervalo (ms mínimos entre disparos) y robar (si con
+# todas sus voces sonando la nueva sustituye a la más antigua en vez de descartarse)
+EFECTOS = {
+    "disparo": {"ruta": "assets/sounds/laser-shoot.wav", "categoria": "armas", "polifonia": 3, "intervalo": 60, "robar": True},
+    "opciones": {"ruta": "assets/sounds/option-change-sound.wav", "categoria": "interfaz", "robar": True},
+    "powerup": {"ruta": "assets/sounds/powerup-sound.wav", "categoria": "impactos", "polifonia": 2, "intervalo": 50},
+    "derrota": {"ruta": "assets/sounds/lose.wav", "categoria": "alertas", "robar": True},
+    "victoria": {"ruta": "assets/sounds/victory.wav", "categoria": "alertas", "robar": True},
+    "alerta": {"ruta": "assets/sounds/warning.wav", "categoria": "alertas", "intervalo": 3000}
+}
+
+class _Voz:
+    '''
+    Objeto con play() que reproduce un efecto a través del bus, para el código que
+    recibe un pygame.mixer.Sound (los menús).
+    '''
+    def __init__(self, bus, nombre):
+        self.bus = bus
+        self.nombre = nombre
+
+    def play(self):
+        self.bus.reproducir(self.nombre)
+
+class BusSonido:
+    '''
+    Efectos de sonido con canales reservados por categoría y límites de voces.
+
+    Atributos:
+        sonidos (dict): Sonidos por nombre de efecto, con el volumen ya aplicado.
+        canales (dict): Por categoría, la lista de canales reservados.
+        voces (dict): Por canal, (efecto, instante en ms) de lo último que empezó a sonar en él.
+        ultimo (dict): Por efecto, instante en ms del último disparo aceptado.
+        reproducidas (int): Voces reproducidas.
+        descartadas (int): Disparos descartados por intervalo o por polifonía.
+        robadas (int): Voces cortadas para dejar sitio a otra.
+    '''
+    def __init__(self, sonidos, volumen=VOLUMEN_EFECTOS, efectos=EFECTOS, categorias=CATEGORIAS):
+        '''
+        Args:
+            sonidos (dict): Sonidos decodificados por nombre de efecto.
+            volumen (float): Volumen general de los efectos (0.0 a 1.0).
+            efectos (dict): Catálogo de efectos (ver EFECTOS).
+            categorias (dict): Canales reservados por categoría.
+        '''
+        self.efectos = efectos
+        self.sonidos = {}
+        for nombre, sonido in sonidos.items():
+            sonido.set_volume(volumen * efectos[nombre].get("volumen", 1.0))
+            self.sonidos[nombre] = sonido
+
+        # Los canales reservados no los usa la asignación automática de Sound.play()
+        total = sum(categorias.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+        pygame.mixer.set_reserved(total)
+        self.canales = {}
+        indice = 0
+        for categoria, cantidad in categorias.items():
+            self.canales[categoria] = [pygame.mixer.Channel(indice + i) for i in range(cantidad)]
+            indice += cantidad
+
+        self.voces = {}
+        self.ultimo = {}
+        self.reproducidas = 0
+        self.descartadas = 0
+        self.robadas = 0
+
+    def voz(self, nombre):
+        '''
+        Returns:
+            _Voz: Objeto con play() que reproduce `nombre` por el bus.
+        '''
+        return _Voz(self, nombre)
+
+    def reproducir(self, nombre, ahora=None):
+        '''
+        Reproduce un efecto respetando su intervalo mínimo, su polifonía y los canales
+        de su categoría.
+
+        Args:
+            nombre (str): Efecto del catálogo.
+            ahora (int): Instante en ms; None para pygame.time.get_ticks().
+        Returns:
+            bool: Si el efecto ha empezado a sonar.
+        '''
+        sonido = self.sonidos.get(nombre)
+        if sonido is None:
+            return False
+        efecto = self.efectos[nombre]
+        if ahora is None:
+            ahora = pygame.time.get_ticks()
+
+        ultimo = self.ultimo.get(nombre)
+        if ultimo is not None and ahora - ultimo < efecto.get("intervalo", 0):
+            self.descartadas += 1
+            return False
+
+        canales = self.canales[efecto["categoria"]]
+        propias = [canal for canal in canales if canal.get_busy() and self.voces.get(canal, (None,))[0] == nombre]
+        if len(propias) >= efecto.get("polifonia", 1):
+            if not efecto.get("robar", False):
+                self.descartadas += 1
+                return False
+            canal = min(propias, key=lambda canal: self.voces[canal][1])
+            self.robadas += 1
+        else:
+            canal = next((canal for canal in canales if not canal.get_busy()), None)
+            if canal is None:
+                canal = min(canales, key=lambda canal: self.voces.get(canal, (None, 0))[1])
+                self.robadas += 1
+
+        canal.play(sonido)
+        self.voces[canal] = (nombre, ahora)
+        self.ultimo[nombre] = ahora
+        self.reproducidas += 1
+        return True
+
+    def estadisticas(self):
+        '''
+        Returns:
+            dict: Voces reproducidas, descartadas y robadas, y voces sonando ahora.
+        '''
+        activas = sum(canal.get_busy() for canales in self.canales.values() for canal in canales)
+        return {"reproducidas": self.reproducidas, "descartadas": self.descartadas, "robadas": self.robadas, "activas": activas}
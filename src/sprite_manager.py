@@ -1,5 +1,15 @@
+import math
 import pygame
 
+# Registro global de recursos gráficos -----------------------------------------------------------
+# Cada hoja se decodifica una sola vez y cada recorte/escala se guarda bajo su clave,
+# de modo que todas las entidades comparten las mismas superficies.
+_hojas = {}
+_recursos = {}
+_estadisticas = {"aciertos": 0, "fallos": 0, "lecturas_disco": 0}
+
+PASOS_PULSO = 32  # Fotogramas por periodo en las tiras de pulso
+
 def cortar_sprite(sheet, columnas, filas, escala=1):
     '''
     Corta un sprite sheet en múltiples sprites individuales.
@@ -79,4 +89,192 @@ def animar_sprites(sprites, velocidad):
     animacion = []
     for sprite in sprites:
         animacion.append(pygame.transform.scale(sprite, (sprite.get_width() * velocidad, sprite.get_height() * velocidad)))
-    return animacion
\ No newline at end of file
+    return animacion
+
+def cargar_hoja(ruta, alpha=True):
+    '''
+    Carga una imagen desde disco una única vez y devuelve siempre la misma superficie.
+    
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        alpha (bool): Si es True se convierte con convert_alpha, si no con convert.
+    Returns:
+        pygame.Surface: La imagen convertida y compartida.
+    '''
+    clave = (ruta, alpha)
+    hoja = _hojas.get(clave)
+    if hoja is not None:
+        _estadisticas["aciertos"] += 1
+        return hoja
+    _estadisticas["fallos"] += 1
+    _estadisticas["lecturas_disco"] += 1
+    hoja = pygame.image.load(ruta)
+    hoja = hoja.convert_alpha() if alpha else hoja.convert()
+    _hojas[clave] = hoja
+    return hoja
+
+def registrar_hoja(ruta, imagen, alpha=True):
+    '''
+    Convierte una imagen ya decodificada (p. ej. en un hilo de precarga) y la guarda
+    como la hoja de `ruta`, de modo que cargar_hoja no vuelva a leerla del disco.
+    Necesita una ventana creada.
+
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        imagen (pygame.Surface): Imagen decodificada sin convertir.
+        alpha (bool): Si es True se convierte con convert_alpha, si no con convert.
+    Returns:
+        pygame.Surface: La imagen convertida y compartida.
+    '''
+    _estadisticas["lecturas_disco"] += 1
+    hoja = imagen.convert_alpha() if alpha else imagen.convert()
+    _hojas[(ruta, alpha)] = hoja
+    return hoja
+
+def obtener_recurso(clave, fabrica):
+    '''
+    Devuelve el recurso guardado bajo una clave o lo crea con la fábrica la primera vez.
+    
+    Args:
+        clave (hashable): Clave única del recurso.
+        fabrica (callable): Función sin argumentos que construye el recurso.
+    Returns:
+        object: El recurso compartido (superficie, lista o diccionario de superficies).
+    '''
+    recurso = _recursos.get(clave)
+    if recurso is not None:
+        _estadisticas["aciertos"] += 1
+        return recurso
+    _estadisticas["fallos"] += 1
+    recurso = fabrica()
+    _recursos[clave] = recurso
+    return recurso
+
+def registrar_recurso(clave, recurso):
+    '''
+    Guarda un recurso ya construido bajo su clave (p. ej. las piezas del atlas), de
+    modo que obtener_recurso lo devuelva sin llamar a la fábrica.
+
+    Args:
+        clave (hashable): Clave única del recurso (la misma que usaría obtener_*).
+        recurso (object): El recurso compartido.
+    '''
+    _recursos[clave] = recurso
+
+def obtener_sprite(ruta, x, y, ancho, alto, escala=1):
+    '''
+    Versión con caché de extraer_sprite: recorta y escala una región de una hoja una sola vez.
+    
+    Args:
+        ruta (str): Ruta del sprite sheet.
+        x (int): Coordenada X del sprite en el sprite sheet.
+        y (int): Coordenada Y del sprite en el sprite sheet.
+        ancho (int): Ancho del sprite a extraer.
+        alto (int): Alto del sprite a extraer.
+        escala (float): Factor de escala para redimensionar el sprite (1.0 = sin escala).
+    Returns:
+        pygame.Surface: El sprite compartido. No debe modificarse.
+    '''
+    return obtener_recurso(
+        ("sprite", ruta, x, y, ancho, alto, escala),
+        lambda: extraer_sprite(cargar_hoja(ruta), x, y, ancho, alto, escala)
+    )
+
+def obtener_sprites(ruta, columnas, filas, escala=1):
+    '''
+    Versión con caché de cargar_sprites: corta la hoja completa una sola vez.
+    
+    Args:
+        ruta (str): Ruta del sprite sheet.
+        columnas (int): Número de columnas en el sprite sheet.
+        filas (int): Número de filas en el sprite sheet.
+        escala (float): Factor de escala para redimensionar los sprites (1.0 = sin escala).
+    Returns:
+        tuple: Tupla compartida con los sprites cortados.
+    '''
+    return obtener_recurso(
+        ("hoja", ruta, columnas, filas, escala),
+        lambda: tuple(cortar_sprite(cargar_hoja(ruta), columnas, filas, escala))
+    )
+
+def obtener_escalado(ruta, tamaño, alpha=True):
+    '''
+    Carga una imagen completa y la escala a un tamaño fijo una sola vez (p. ej. fondos).
+    
+    Args:
+        ruta (str): Ruta del archivo de imagen.
+        tamaño (tuple): Tamaño final (ancho, alto).
+        alpha (bool): Si la imagen conserva canal alfa.
+    Returns:
+        pygame.Surface: La imagen escalada compartida.
+    '''
+    tamaño = tuple(tamaño)
+    return obtener_recurso(
+        ("escalado", ruta, tamaño, alpha),
+        lambda: pygame.transform.scale(cargar_hoja(ruta, alpha), tamaño)
+    )
+
+def obtener_pulso(superficie, amplitud=0.1, pasos=PASOS_PULSO):
+    '''
+    Tira precalculada de un efecto de pulso: la superficie escalada por
+    1 + amplitud * sin(fase) en `pasos` fases de un periodo. Los fotogramas que
+    redondean al mismo tamaño comparten superficie.
+    
+    Args:
+        superficie (pygame.Surface): Sprite original (compartido, del registro).
+        amplitud (float): Variación máxima de escala (0.1 = ±10 %).
+        pasos (int): Número de fases del periodo.
+    Returns:
+        tuple: Superficies indexadas por fase (ver fase_pulso).
+    '''
+    def fabrica():
+        ancho, alto = superficie.get_size()
+        por_tamaño = {}
+        tira = []
+        for paso in range(pasos):
+            escala = 1 + amplitud * math.sin(2 * math.pi * paso / pasos)
+            tamaño = (int(ancho * escala), int(alto * escala))
+            if tamaño not in por_tamaño:
+                por_tamaño[tamaño] = pygame.transform.scale(superficie, tamaño)
+            tira.append(por_tamaño[tamaño])
+        return tuple(tira)
+    return obtener_recurso(("pulso", superficie, amplitud, pasos), fabrica)
+
+def fase_pulso(angulo, pasos=PASOS_PULSO):
+    '''
+    Índice del fotograma de una tira de pulso.
+    
+    Args:
+        angulo (float): Fase del pulso en radianes (el argumento del seno).
+        pasos (int): Número de fases de la tira.
+    Returns:
+        int: Índice en [0, pasos).
+    '''
+    return int(angulo * pasos / (2 * math.pi)) % pasos
+
+def estadisticas_cache():
+    '''
+    Devuelve los contadores del registro de recursos.
+    
+    Returns:
+        dict: Aciertos, fallos, lecturas de disco y número de entradas guardadas.
+    '''
+    datos = dict(_estadisticas)
+    datos["hojas"] = len(_hojas)
+    datos["recursos"] = len(_recursos)
+    return datos
+
+def reiniciar_estadisticas():
+    '''
+    Pone a cero los contadores sin vaciar la caché (útil tras la carga inicial).
+    '''
+    for clave in _estadisticas:
+        _estadisticas[clave] = 0
+
+def limpiar_cache():
+    '''
+    Vacía por completo el registro. Necesario si se recrea la ventana de pygame.
+    '''
+    _hojas.clear()
+    _recursos.clear()
+    reiniciar_estadisticas()
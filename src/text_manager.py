@@ -0,0 +1,111 @@
+# src/text_manager.py
+
+'''
+Servicio de texto con caché.
+
+Las fuentes se abren una sola vez por (ruta, tamaño) y cada texto renderizado se
+guarda en una caché LRU con clave (fuente, texto, color, antialias). La caché tiene un
+presupuesto de memoria en bytes: al superarlo se desalojan los textos usados hace más
+tiempo. En régimen estable dibujar un texto ya visto no lee el archivo de la fuente ni
+rasteriza glifos, solo devuelve la superficie guardada.
+'''
+
+from collections import OrderedDict
+
+import pygame
+
+PRESUPUESTO_BYTES = 4 * 1024 * 1024  # Memoria máxima de las superficies de texto guardadas
+
+_fuentes = {}
+_textos = OrderedDict()
+_estadisticas = {"aciertos": 0, "fallos": 0, "desalojos": 0, "bytes": 0, "fuentes_abiertas": 0}
+_presupuesto = [PRESUPUESTO_BYTES]
+
+def obtener_fuente(ruta, tamaño):
+    '''
+    Devuelve la fuente de una ruta y tamaño, abriéndola solo la primera vez.
+
+    Args:
+        ruta (str): Archivo .ttf, o None para la fuente por defecto de pygame.
+        tamaño (int): Tamaño en puntos.
+    Returns:
+        pygame.font.Font: Fuente compartida.
+    '''
+    clave = (ruta, tamaño)
+    fuente = _fuentes.get(clave)
+    if fuente is None:
+        fuente = pygame.font.Font(ruta, tamaño)
+        _fuentes[clave] = fuente
+        _estadisticas["fuentes_abiertas"] += 1
+    return fuente
+
+def _bytes(superficie):
+    return superficie.get_width() * superficie.get_height() * superficie.get_bytesize()
+
+def renderizar(ruta, tamaño, texto, color, antialias=True):
+    '''
+    Versión con caché de Font.render.
+
+    Args:
+        ruta (str): Archivo de la fuente (None para la fuente por defecto).
+        tamaño (int): Tamaño en puntos.
+        texto (str): Texto a dibujar.
+        color (tuple): Color RGB del texto.
+        antialias (bool): Si se suavizan los bordes.
+    Returns:
+        pygame.Surface: Texto renderizado compartido. No debe modificarse.
+    '''
+    clave = (ruta, tamaño, texto, tuple(color), antialias)
+    superficie = _textos.get(clave)
+    if superficie is not None:
+        _textos.move_to_end(clave)
+        _estadisticas["aciertos"] += 1
+        return superficie
+
+    _estadisticas["fallos"] += 1
+    superficie = obtener_fuente(ruta, tamaño).render(texto, antialias, color)
+    _textos[clave] = superficie
+    _estadisticas["bytes"] += _bytes(superficie)
+    _desalojar()
+    return superficie
+
+def _desalojar():
+    '''
+    Elimina los textos menos usados hasta volver al presupuesto (el último siempre se conserva).
+    '''
+    while _estadisticas["bytes"] > _presupuesto[0] and len(_textos) > 1:
+        _, superficie = _textos.popitem(last=False)
+        _estadisticas["bytes"] -= _bytes(superficie)
+        _estadisticas["desalojos"] += 1
+
+def configurar_presupuesto(bytes_maximos):
+    '''
+    Cambia el presupuesto de memoria de la caché y desaloja si hace falta.
+
+    Args:
+        bytes_maximos (int): Memoria máxima para las superficies de texto.
+    '''
+    _presupuesto[0] = bytes_maximos
+    _desalojar()
+
+def estadisticas_texto():
+    '''
+    Devuelve los contadores de la caché de texto.
+
+    Returns:
+        dict: Aciertos, fallos, desalojos, bytes ocupados, entradas, fuentes abiertas y tasa de aciertos.
+    '''
+    datos = dict(_estadisticas)
+    consultas = datos["aciertos"] + datos["fallos"]
+    datos["entradas"] = len(_textos)
+    datos["tasa_aciertos"] = datos["aciertos"] / consultas if consultas else 0.0
+    return datos
+
+def limpiar_texto():
+    '''
+    Vacía las cachés de fuentes y textos y pone a cero los contadores.
+    '''
+    _fuentes.clear()
+    _textos.clear()
+    for clave in _estadisticas:
+        _estadisticas[clave] = 0
@@ -0,0 +1,202 @@
+# src/wave_scheduler.py
+
+'''
+Programador de oleadas de enemigos.
+
+Las oleadas de cada fase se declaran como datos en OLEADAS: una formación (sueltos,
+línea, V o columna) con el arquetipo de enemigo, el número de enemigos y, si se quiere,
+el tipo de movimiento. Al empezar la fase se compila un ciclo completo de oleadas en
+una tabla de apariciones (tick, enemigo, x, movimiento) con el generador de la partida;
+cuando se agota se compila el siguiente. Todo va por ticks de simulación, así que la
+misma semilla da las mismas apariciones aunque el juego se salte frames o se simule sin
+ventana más rápido que en tiempo real.
+
+ProgramadorOleadas crea cada tick las apariciones que ya tocan sin superar un
+presupuesto por tick, y se detiene mientras haya demasiados enemigos o balas enemigas
+vivos, de modo que el coste de las apariciones está acotado.
+'''
+
+from collections import deque
+
+from src.config import SCREEN_WIDTH, TICK_MS, OLEADA_APARICIONES_POR_TICK, MAX_ENEMIGOS_VIVOS, MAX_BALAS_ENEMIGAS
+from src.enemy import Enemy
+from src.game_clock import rng
+
+# Ticks entre apariciones: 1800 ms en la fase 1, 150 ms menos por fase y nunca menos de 400 ms
+INTERVALO_BASE = round(1800 / TICK_MS)
+REDUCCION_POR_FASE = round(150 / TICK_MS)
+INTERVALO_MINIMO = round(400 / TICK_MS)
+
+MARGEN = 20  # Distancia mínima (px) de un enemigo al borde de la pantalla
+
+# Catálogo de oleadas -----------------------------------------------------------------------------
+# Claves de cada oleada:
+#   formacion: "sueltos" (uno cada intervalo, x al azar), "linea" (a la vez, en fila),
+#   "v" (en fila, las alas entran `escalonado` ticks más tarde por puesto) o "columna" (misma x,
+#   uno cada `escalonado` ticks)
+#   enemigo ("normal", "torreta", "tanque", "rapido" o None al azar), cantidad, movimiento
+#   ("vertical", "zigzag", "lento", "salto" o None para el del arquetipo), separacion (px),
+#   escalonado (ticks) y pausa (intervalos que ocupa la oleada; por defecto, uno por enemigo)
+OLEADAS = {
+    1: (
+        {"formacion": "sueltos", "cantidad": 3},
+        {"formacion": "linea", "enemigo": "normal", "cantidad": 3, "movimiento": "vertical"},
+        {"formacion": "sueltos", "cantidad": 2},
+        {"formacion": "columna", "enemigo": "rapido", "cantidad": 3},
+        {"formacion": "sueltos", "enemigo": "torreta", "cantidad": 1}
+    ),
+    2: (
+        {"formacion": "sueltos", "cantidad": 2},
+        {"formacion": "v", "enemigo": "normal", "cantidad": 5, "movimiento": "salto"},
+        {"formacion": "linea", "enemigo": "torreta", "cantidad": 2, "separacion": 160},
+        {"formacion": "sueltos", "cantidad": 3},
+        {"formacion": "columna", "enemigo": "rapido", "cantidad": 4},
+        {"formacion": "sueltos", "enemigo": "tanque", "cantidad": 1}
+    ),
+    3: (
+        {"formacion": "v", "enemigo": "normal", "cantidad": 5, "movimiento": "zigzag"},
+        {"formacion": "sueltos", "cantidad": 3},
+        {"formacion": "linea", "enemigo": "tanque", "cantidad": 3, "separacion": 120},
+        {"formacion": "columna", "enemigo": "rapido", "cantidad": 5, "escalonado": 15},
+        {"formacion": "linea", "enemigo": "torreta", "cantidad": 3, "separacion": 150},
+        {"formacion": "sueltos", "cantidad": 4}
+    )
+}
+
+def oleadas(fase):
+    '''
+    Returns:
+        tuple: Oleadas de `fase` (las fases siguientes repiten las de la última).
+    '''
+    return OLEADAS[min(max(fase, 1), max(OLEADAS))]
+
+def intervalo_fase(fase):
+    '''
+    Returns:
+        int: Ticks entre apariciones de enemigos en `fase`.
+    '''
+    return max(INTERVALO_MINIMO, INTERVALO_BASE - (fase - 1) * REDUCCION_POR_FASE)
+
+# Compilación -------------------------------------------------------------------------------------
+def _apariciones_oleada(oleada, intervalo, generador):
+    '''
+    Expande una oleada del catálogo en apariciones (desfase en ticks, enemigo, x, movimiento).
+    '''
+    formacion = oleada.get("formacion", "sueltos")
+    cantidad = oleada.get("cantidad", 1)
+    enemigo = oleada.get("enemigo")
+    movimiento = oleada.get("movimiento")
+    if formacion == "sueltos":
+        return [(i * intervalo, enemigo, generador.randint(MARGEN, SCREEN_WIDTH - MARGEN), movimiento)
+                for i in range(cantidad)]
+    if formacion == "columna":
+        x = generador.randint(MARGEN, SCREEN_WIDTH - MARGEN)
+        escalonado = oleada.get("escalonado", 20)
+        return [(i * escalonado, enemigo, x, movimiento) for i in range(cantidad)]
+    # "linea" y "v": enemigos en fila centrados en una x que deja la formación dentro de la pantalla
+    separacion = oleada.get("separacion", 60)
+    medio = (cantidad - 1) / 2
+    ancho = min(int(medio * separacion), SCREEN_WIDTH // 2 - MARGEN)
+    centro = generador.randint(MARGEN + ancho, SCREEN_WIDTH - MARGEN - ancho)
+    escalonado = oleada.get("escalonado", 8) if formacion == "v" else 0
+    apariciones = []
+    for i in range(cantidad):
+        x = min(max(int(centro + (i - medio) * separacion), MARGEN), SCREEN_WIDTH - MARGEN)
+        apariciones.append((int(abs(i - medio) * escalonado), enemigo, x, movimiento))
+    return apariciones
+
+def compilar_ciclo(lista, intervalo, generador, inicio=0):
+    '''
+    Compila un ciclo de oleadas en su tabla de apariciones.
+
+    Args:
+        lista (tuple): Oleadas del catálogo (ver OLEADAS).
+        intervalo (int): Ticks entre apariciones.
+        generador (random.Random): Generador con el que se eligen las posiciones.
+        inicio (int): Tick en que empieza el ciclo.
+    Returns:
+        tuple: Lista de apariciones (tick, enemigo, x, movimiento) ordenada por tick y
+            tick en que termina el ciclo.
+    '''
+    tabla = []
+    cursor = inicio
+    for oleada in lista:
+        for desfase, enemigo, x, movimiento in _apariciones_oleada(oleada, intervalo, generador):
+            tabla.append((cursor + intervalo + desfase, enemigo, x, movimiento))
+        cursor += oleada.get("pausa", oleada.get("cantidad", 1)) * intervalo
+    tabla.sort(key=lambda aparicion: aparicion[0])
+    return tabla, cursor
+
+# Programador ------------------------------------------------------------------------------------
+class ProgramadorOleadas:
+    '''
+    Apariciones de enemigos de una fase, avanzadas tick a tick.
+
+    Atributos:
+        fase (int): Fase cuyas oleadas se programan.
+        intervalo (int): Ticks entre apariciones.
+        presupuesto (int): Enemigos máximos creados por tick.
+        max_enemigos (int): Con tantos enemigos vivos el programador se detiene.
+        max_balas (int): Con tantas balas enemigas vivas el programador se detiene.
+        tick (int): Ticks avanzados (no cuenta los ticks detenido).
+        tabla (list): Apariciones (tick, enemigo, x, movimiento) del ciclo actual.
+        siguiente (int): Índice en la tabla de la próxima aparición.
+        fin_ciclo (int): Tick en que termina el ciclo actual.
+        pendientes (collections.deque): Apariciones que ya tocaban y esperan presupuesto.
+        apariciones (int): Enemigos creados en total.
+        retenidos (int): Ticks en que los topes detuvieron el programador.
+    '''
+    def __init__(self, fase=1, intervalo=None, presupuesto=OLEADA_APARICIONES_POR_TICK,
+                 max_enemigos=MAX_ENEMIGOS_VIVOS, max_balas=MAX_BALAS_ENEMIGAS):
+        self.fase = fase
+        self.intervalo = intervalo if intervalo is not None else intervalo_fase(fase)
+        self.presupuesto = presupuesto
+        self.max_enemigos = max_enemigos
+        self.max_balas = max_balas
+        self.tick = 0
+        self.tabla = []
+        self.siguiente = 0
+        self.fin_ciclo = 0
+        self.pendientes = deque()
+        self.apariciones = 0
+        self.retenidos = 0
+        self._compilar_ciclo()
+
+    def _compilar_ciclo(self):
+        '''
+        Compila el siguiente ciclo de oleadas a continuación del actual.
+        '''
+        self.tabla, self.fin_ciclo = compilar_ciclo(oleadas(self.fase), self.intervalo, rng(), self.fin_ciclo)
+        self.siguiente = 0
+
+    def update(self, enemies, balas_vivas=0):
+        '''
+        Avanza un tick y crea los enemigos que tocan.
+
+        Args:
+            enemies (pygame.sprite.Group): Grupo de enemigos de la partida.
+            balas_vivas (int): Balas enemigas en pantalla.
+        Returns:
+            int: Enemigos creados en este tick.
+        '''
+        if len(enemies) >= self.max_enemigos or balas_vivas >= self.max_balas:
+            self.retenidos += 1
+            return 0
+        self.tick += 1
+        tabla = self.tabla
+        while True:
+            while self.siguiente < len(tabla) and tabla[self.siguiente][0] <= self.tick:
+                self.pendientes.append(tabla[self.siguiente])
+                self.siguiente += 1
+            if self.siguiente < len(tabla) or self.tick < self.fin_ciclo:
+                break
+            self._compilar_ciclo()
+            tabla = self.tabla
+
+        creados = 0
+        while self.pendientes and creados < self.presupuesto and len(enemies) < self.max_enemigos:
+            _, enemigo, x, movimiento = self.pendientes.popleft()
+            enemies.add(Enemy(enemigo, x, movimiento))
+            creados += 1
+        self.apariciones += creados
+        return creados